@@ -194,7 +194,7 @@ class DataConnector:
             return df
             
         # Create a temporary view loader
-        from view_loader_and_transformer import ViewLoader
+        from connector.view_loader_and_transformer import ViewLoader
         
         view_loader = ViewLoader(self.config.semantic_schema)
         
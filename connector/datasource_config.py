@@ -143,7 +143,7 @@ class DataSourceConfig:
             return []
             
         metadata = self.metadata.get_column_metadata(column_name)
-        return metadata.aggregations if metadata else []
+        return list(metadata.aggregations) if metadata else []
     
     def get_column_type(self, column_name: str) -> Optional[str]:
         """
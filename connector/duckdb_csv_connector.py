@@ -1,20 +1,86 @@
 
 import os
+import re
 import glob
+import hashlib
 import pandas as pd
 import logging
-from typing import Optional, Union
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Pattern, Set, Tuple, Union
 
 from connector.data_connector import DataConnector
 from connector.datasource_config import DataSourceConfig
+from connector.metadata import DatasetMetadata
 from modulo.connector.exceptions import ConfigurationException, DataConnectionException, DataReadException
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Optional imports resolved once at module load rather than on every connect
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+try:
+    from connector.view_loader_and_transformer import ViewLoader
+except ImportError:
+    ViewLoader = None
+
+# Optional SQL parser for alias rewriting; the regex substitution is the fallback
+try:
+    import sqlglot
+    from sqlglot import exp
+except ImportError:
+    sqlglot = None
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger("DuckDBCsvConnector")
 
+# Template for empty results; callers get a shallow copy so it is never shared
+_EMPTY_DF = pd.DataFrame()
+
+# Number of adapted queries remembered per connector
+_ADAPT_CACHE_SIZE = 256
+
+# Characters not allowed in generated table names; \W is exactly the
+# complement of str.isalnum() plus '_', so names match the old sanitizer
+_UNSAFE_TABLE_CHARS = re.compile(r'\W')
+
+# Generic "FROM csv" placeholder, matched case-insensitively with any spacing
+_FROM_CSV_RE = re.compile(r'(\bFROM\s+)csv\b', re.IGNORECASE)
+
+
+def _quote_ident(name: str) -> str:
+    """
+    Quote an SQL identifier for DuckDB, escaping embedded double quotes.
+    """
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+# Process-wide in-memory database for connectors using 'shared_connection'
+_SHARED_CONN = None
+_SHARED_LOCK = threading.Lock()
+
+
+def _shared_cursor():
+    """
+    Return a new cursor over the process-wide shared DuckDB database.
+    
+    The database is created on first use. Each cursor is an independent
+    connection to the same catalog and buffer manager.
+    """
+    global _SHARED_CONN
+    with _SHARED_LOCK:
+        if _SHARED_CONN is None:
+            _SHARED_CONN = duckdb.connect(database=':memory:')
+        return _SHARED_CONN.cursor()
+
 
 class DuckDBCsvConnector(DataConnector):
     """
@@ -33,6 +99,11 @@ class DuckDBCsvConnector(DataConnector):
         csv_files: List of CSV files in the directory.
         tables: Dictionary of registered table names.
         view_loader: Optional ViewLoader for semantic layer integration.
+    
+    With the 'shared_connection' parameter set, the connector works on a
+    cursor of a process-wide DuckDB database and registers its views in a
+    schema of its own (source_<source_id>). Sources can then be joined in a
+    single query, e.g. SELECT ... FROM source_a.vendas JOIN source_b.clientes.
     """
     
     def __init__(self, config: Union[DataSourceConfig]):
@@ -50,20 +121,66 @@ class DuckDBCsvConnector(DataConnector):
         self.csv_files = []
         self.tables = {}
         self.view_loader = None
+        self._alias_regex_cache = None
+        self._tables_cache: Optional[Set[str]] = None
+        self._schema_cache: Optional[pd.DataFrame] = None
+        self._table_registered = False
+        self._schema_name: Optional[str] = None
+        self._cached_files: Dict[str, str] = {}
+        self._adapt_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._refresh_config_flags()
         
         # Validate required parameters
         if 'path' not in self.config.params:
             raise ConfigurationException("Parameter 'path' is required for CSV sources")
     
+    def _refresh_config_flags(self) -> None:
+        """
+        Resolve which optional config sections are present.
+        
+        Done once here (and again on connect) so the per-query paths test
+        plain booleans instead of probing the config with hasattr. Adapted
+        queries depend on these sections, so the adapt cache is reset too and
+        the alias regex is recompiled up front rather than on the first query.
+        """
+        self._adapt_cache.clear()
+        self._alias_regex_cache = None
+        self._has_metadata = bool(getattr(self.config, 'metadata', None))
+        self._has_semantic_schema = bool(getattr(self.config, 'semantic_schema', None))
+        if self._has_metadata:
+            self._get_alias_regex(self.config.metadata)
+    
     def connect(self) -> None:
         """
         Establish connection with DuckDB and register the CSV file or directory as tables.
         """
+        if duckdb is None:
+            error_msg = "duckdb module not found. Install with: pip install duckdb"
+            logger.error(error_msg)
+            raise DataConnectionException(error_msg)
+        
         try:
-            import duckdb
-            
             # Initialize DuckDB connection
-            self.connection = duckdb.connect(database=':memory:')
+            if self.config.params.get('shared_connection', False):
+                # Work in a schema of our own inside the shared database
+                self.connection = _shared_cursor()
+                self._schema_name = f"source_{_UNSAFE_TABLE_CHARS.sub('_', str(self.config.source_id))}"
+                self.connection.execute(f"DROP SCHEMA IF EXISTS {self._schema_name} CASCADE")
+                self.connection.execute(f"CREATE SCHEMA {self._schema_name}")
+                self.connection.execute(f"SET schema = '{self._schema_name}'")
+            else:
+                self.connection = duckdb.connect(database=':memory:')
+                self._schema_name = None
+            self._apply_pragmas()
+            self._tables_cache = None
+            self._schema_cache = None
+            self._table_registered = False
+            self._cached_files = {}
+            self._refresh_config_flags()
+            
+            cache_dir = self.config.params.get('cache_dir')
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
             
             path = self.config.params['path']
             
@@ -71,13 +188,13 @@ class DuckDBCsvConnector(DataConnector):
             if os.path.isdir(path):
                 self.is_directory = True
                 pattern = self.config.params.get('pattern', '*.csv')
-                logger.info(f"Connecting to CSV directory via DuckDB: {path} with pattern {pattern}")
+                logger.info("Connecting to CSV directory via DuckDB: %s with pattern %s", path, pattern)
                 
                 # List all CSV files in the directory
                 self.csv_files = glob.glob(os.path.join(path, pattern))
                 
                 if not self.csv_files:
-                    logger.warning(f"No CSV files found in directory: {path}")
+                    logger.warning("No CSV files found in directory: %s", path)
                     return
                 
                 # Determine parameters for reading CSVs
@@ -88,69 +205,51 @@ class DuckDBCsvConnector(DataConnector):
                 has_header = self.config.params.get('header', True)
                 auto_detect = self.config.params.get('auto_detect', True)
                 
-                # Register each CSV file as a view/table in DuckDB
-                for csv_file in self.csv_files:
-                    try:
-                        file_name = os.path.basename(csv_file)
-                        # Remove extension and special characters to create valid table names
-                        table_name = os.path.splitext(file_name)[0]
-                        table_name = ''.join(c if c.isalnum() else '_' for c in table_name)
-                        
-                        # Build query to create the view
-                        query_parts = [f"CREATE VIEW {table_name} AS SELECT * FROM read_csv('{csv_file}'"]
-                        params = []
-                        
-                        params.append(f"delim='{delim}'")
-                        params.append(f"header={str(has_header).lower()}")
-                        params.append(f"auto_detect={str(auto_detect).lower()}")
-                        
-                        if params:
-                            query_parts.append(", " + ", ".join(params))
-                        
-                        query_parts.append(")")
-                        create_query = "".join(query_parts)
-                        
-                        logger.info(f"Registering file {file_name} as table {table_name}")
-                        logger.debug(f"Query: {create_query}")
-                        
-                        self.connection.execute(create_query)
-                        self.tables[file_name] = table_name
-                        
-                    except Exception as e:
-                        logger.error(f"Error registering CSV file {file_name}: {str(e)}")
+                # Register each CSV file as a view/table in DuckDB.
+                # Registration runs in parallel: each worker uses its own cursor
+                # (a sibling connection over the same in-memory database) and
+                # DuckDB releases the GIL while sniffing and binding the CSV.
+                max_workers = self.config.params.get('max_workers') or os.cpu_count() or 1
+                max_workers = max(1, min(max_workers, len(self.csv_files)))
+                
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    registered = list(executor.map(
+                        lambda csv_file: self._register_csv_file(csv_file, delim, has_header, auto_detect),
+                        self.csv_files
+                    ))
+                
+                # Fill the table map in file order so the first table stays deterministic
+                table_files = {}
+                for csv_file, table_name in zip(self.csv_files, registered):
+                    if table_name:
+                        self.tables[os.path.basename(csv_file)] = table_name
+                        table_files[table_name] = csv_file
                 
                 # Create a combined view if requested
                 if self.config.params.get('create_combined_view', True) and self.tables:
                     try:
-                        # Select the first file to get the schema
-                        first_table = next(iter(self.tables.values()))
-                        schema_query = f"SELECT * FROM {first_table} LIMIT 0"
-                        schema_df = self.connection.execute(schema_query).fetchdf()
-                        
-                        # Create a UNION ALL query for all tables
-                        union_parts = []
-                        for table_name in self.tables.values():
-                            # Check if the table has the same columns
-                            try:
-                                columns_query = f"SELECT * FROM {table_name} LIMIT 0"
-                                table_columns = self.connection.execute(columns_query).fetchdf().columns
-                                
-                                # Add only tables with compatible structure
-                                if set(schema_df.columns) == set(table_columns):
-                                    union_parts.append(f"SELECT * FROM {table_name}")
-                                else:
-                                    logger.warning(f"Table {table_name} ignored in combined view due to schema differences")
-                            except:
-                                logger.warning(f"Error checking schema for table {table_name}")
-                        
-                        if union_parts:
-                            # Create the combined view
-                            combined_query = f"CREATE VIEW {self.table_name} AS {' UNION ALL '.join(union_parts)}"
-                            self.connection.execute(combined_query)
-                            logger.info(f"Combined view created: {self.table_name}")
+                        # A single scan over the file list lets DuckDB read all
+                        # files in one parallel pass; union_by_name reconciles
+                        # differing file schemas, missing columns read as NULL
+                        if self._cached_files and len(self._cached_files) == len(table_files):
+                            combined = self.connection.read_parquet(
+                                [self._cached_files[table_name] for table_name in table_files],
+                                union_by_name=True
+                            )
+                        else:
+                            combined = self.connection.read_csv(
+                                list(table_files.values()),
+                                delimiter=delim,
+                                header=has_header,
+                                auto_detect=auto_detect,
+                                union_by_name=True
+                            )
+                        combined.create_view(self.table_name, replace=False)
+                        self._table_registered = True
+                        logger.info("Combined view created: %s", self.table_name)
                         
                     except Exception as e:
-                        logger.warning(f"Could not create combined view: {str(e)}")
+                        logger.warning("Could not create combined view: %s", e)
                 
             else:
                 # Original behavior for a single file
@@ -161,13 +260,13 @@ class DuckDBCsvConnector(DataConnector):
                     alternative_path = os.path.join(current_dir, base_filename)
                     
                     if os.path.exists(alternative_path):
-                        logger.info(f"File not found at {path}, using alternative: {alternative_path}")
+                        logger.info("File not found at %s, using alternative: %s", path, alternative_path)
                         path = alternative_path
                     else:
-                        logger.warning(f"CSV file not found: {path}")
+                        logger.warning("CSV file not found: %s", path)
                         return
                 
-                logger.info(f"Connecting to CSV via DuckDB: {path}")
+                logger.info("Connecting to CSV via DuckDB: %s", path)
                 
                 # Determine parameters
                 delim = self.config.params.get('delim', 
@@ -177,68 +276,200 @@ class DuckDBCsvConnector(DataConnector):
                 has_header = self.config.params.get('header', True)
                 auto_detect = self.config.params.get('auto_detect', True)
                 
-                # Build query to create the view
-                query_parts = [f"CREATE VIEW {self.table_name} AS SELECT * FROM read_csv('{path}'"]
-                params = []
-                
-                params.append(f"delim='{delim}'")
-                params.append(f"header={str(has_header).lower()}")
-                params.append(f"auto_detect={str(auto_detect).lower()}")
-                
-                if params:
-                    query_parts.append(", " + ", ".join(params))
-                
-                query_parts.append(")")
-                create_query = "".join(query_parts)
-                
-                logger.info(f"Query for DuckDB view creation: {create_query}")
-                self.connection.execute(create_query)
+                # Create the view through the relation API: no SQL text is
+                # assembled or parsed, and paths need no quoting
+                logger.info("Creating DuckDB view %s for %s", self.table_name, path)
+                self._csv_relation(self.connection, path, delim, has_header, auto_detect).create_view(
+                    self.table_name, replace=False
+                )
                 
                 # Register the table name
                 self.tables[os.path.basename(path)] = self.table_name
+                self._table_registered = True
             
             # Get columns for mapping
             self._create_column_mapping()
             
-            # Check structure of registered tables
-            self._log_tables_schema()
+            # Check structure of registered tables (debug output only)
+            if logger.isEnabledFor(logging.DEBUG):
+                self._log_tables_schema()
             
             # Initialize semantic layer if available
-            if hasattr(self.config, 'semantic_schema') and self.config.semantic_schema:
+            if self._has_semantic_schema:
                 self._initialize_semantic_layer()
         except Exception as e:
             error_msg = f"Error connecting to DuckDB: {str(e)}"
             logger.error(error_msg)
             raise DataConnectionException(error_msg) from e
                 
+    def _apply_pragmas(self) -> None:
+        """
+        Tune DuckDB for parallel CSV scans.
+        
+        Each setting can be overridden through the config params:
+        'threads' (defaults to the CPU count), 'memory_limit' (e.g. '4GB',
+        DuckDB's default when absent) and 'preserve_insertion_order'
+        (defaults to False). Not preserving insertion order lets DuckDB
+        parse and scan CSVs fully in parallel, but rows of a query without
+        ORDER BY may come back in any order; set it to True when callers
+        rely on file order. With a shared connection the settings apply to
+        the whole shared database.
+        """
+        params = self.config.params
+        threads = params.get('threads') or os.cpu_count()
+        if threads:
+            self.connection.execute(f"PRAGMA threads={int(threads)}")
+        
+        preserve_order = bool(params.get('preserve_insertion_order', False))
+        self.connection.execute(f"PRAGMA preserve_insertion_order={str(preserve_order).lower()}")
+        
+        memory_limit = params.get('memory_limit')
+        if memory_limit:
+            memory_limit = str(memory_limit).replace("'", "''")
+            self.connection.execute(f"PRAGMA memory_limit='{memory_limit}'")
+    
+    def _cursor(self):
+        """
+        Open a new cursor on the connector's database.
+        
+        Cursors start in the default schema, so when the connector owns a
+        schema in the shared database the cursor is pointed at it first.
+        """
+        cursor = self.connection.cursor()
+        if self._schema_name:
+            cursor.execute(f"SET schema = '{self._schema_name}'")
+        return cursor
+    
+    def _register_csv_file(self, csv_file: str, delim: str, has_header: bool, auto_detect: bool) -> Optional[str]:
+        """
+        Register a single CSV file as a view in DuckDB.
+        
+        Safe to call from worker threads: the view is created through a
+        dedicated cursor of the shared connection.
+        
+        Args:
+            csv_file: Path to the CSV file.
+            delim: Column delimiter.
+            has_header: Whether the file has a header row.
+            auto_detect: Whether DuckDB should auto-detect the CSV dialect.
+            
+        Returns:
+            Optional[str]: Name of the registered view, or None on failure.
+        """
+        file_name = os.path.basename(csv_file)
+        try:
+            # Remove extension and special characters to create valid table names
+            table_name = _UNSAFE_TABLE_CHARS.sub('_', os.path.splitext(file_name)[0])
+            
+            logger.info("Registering file %s as table %s", file_name, table_name)
+            
+            # The relation API creates the view without assembling or parsing
+            # SQL text, so file names need no quoting
+            cursor = self._cursor()
+            try:
+                self._csv_relation(cursor, csv_file, delim, has_header, auto_detect, table_name).create_view(
+                    table_name, replace=False
+                )
+            finally:
+                cursor.close()
+            
+            return table_name
+            
+        except Exception as e:
+            logger.error("Error registering CSV file %s: %s", file_name, e)
+            return None
+    
+    def _csv_relation(self, connection, csv_file: str, delim: str, has_header: bool,
+                      auto_detect: bool, table_name: Optional[str] = None):
+        """
+        Return a DuckDB relation over a CSV file, going through the Parquet cache if enabled.
+        
+        With the 'cache_dir' config parameter set, each CSV is parsed once and
+        written as Parquet; later connects scan the Parquet file instead of
+        parsing the CSV again. Cache entries are keyed by the file's path,
+        size, modification time and reading options, so an edited file is
+        parsed afresh. Stale entries are not removed automatically.
+        
+        Args:
+            connection: DuckDB connection or cursor to build the relation on.
+            csv_file: Path to the CSV file.
+            delim: Column delimiter.
+            has_header: Whether the file has a header row.
+            auto_detect: Whether DuckDB should auto-detect the CSV dialect.
+            table_name: View name the relation is registered under, used to
+                track cached files for the combined view.
+            
+        Returns:
+            duckdb.DuckDBPyRelation: Relation reading the file.
+        """
+        cache_file = self._cache_path(csv_file, delim, has_header, auto_detect)
+        if cache_file and os.path.exists(cache_file):
+            logger.info("Using Parquet cache for %s", os.path.basename(csv_file))
+        else:
+            relation = connection.read_csv(csv_file, delimiter=delim, header=has_header, auto_detect=auto_detect)
+            if not cache_file:
+                return relation
+            
+            # Write under a temporary name so a concurrent reader never sees
+            # a partial file
+            temp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                relation.write_parquet(temp_file)
+                os.replace(temp_file, cache_file)
+            except Exception as e:
+                logger.warning("Could not cache %s as Parquet: %s", os.path.basename(csv_file), e)
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+                return relation
+        
+        if table_name:
+            self._cached_files[table_name] = cache_file
+        return connection.read_parquet(cache_file)
+    
+    def _cache_path(self, csv_file: str, delim: str, has_header: bool, auto_detect: bool) -> Optional[str]:
+        """
+        Return the Parquet cache path for a CSV file, or None if caching is disabled.
+        """
+        cache_dir = self.config.params.get('cache_dir')
+        if not cache_dir:
+            return None
+        
+        stat = os.stat(csv_file)
+        key = "\0".join([
+            os.path.abspath(csv_file), str(stat.st_mtime_ns), str(stat.st_size),
+            str(delim), str(has_header), str(auto_detect)
+        ])
+        return os.path.join(cache_dir, hashlib.sha256(key.encode('utf-8')).hexdigest() + ".parquet")
+    
     def _initialize_semantic_layer(self) -> None:
         """
         Initialize the semantic layer integration with ViewLoader.
         """
+        if ViewLoader is None:
+            logger.warning("Could not import ViewLoader. Semantic layer integration disabled.")
+            self.view_loader = None
+            return
+        
         try:
-            from view_loader_and_transformer import ViewLoader
-            
             # Create view loader with semantic schema
             self.view_loader = ViewLoader(self.config.semantic_schema)
-            logger.info(f"Semantic layer initialized for {self.config.source_id}")
+            logger.info("Semantic layer initialized for %s", self.config.source_id)
             
             # Prepare data for view loader
             # Get sample data for each table to register with the view loader
             for file_name, table_name in self.tables.items():
                 try:
-                    # Get DataFrame from the table
-                    df = self.connection.execute(f"SELECT * FROM {table_name}").fetchdf()
+                    # Hand the table over as Arrow: DuckDB produces it without a
+                    # pandas conversion and the ViewLoader scans it in place
+                    table = self.connection.execute(f"SELECT * FROM {table_name}").fetch_record_batch().read_all()
                     # Register as a source for the view loader
-                    self.view_loader.register_source(table_name, df)
-                    logger.info(f"Registered table {table_name} with ViewLoader")
+                    self.view_loader.register_source(table_name, table)
+                    logger.info("Registered table %s with ViewLoader", table_name)
                 except Exception as e:
-                    logger.warning(f"Error registering table {table_name} with ViewLoader: {str(e)}")
+                    logger.warning("Error registering table %s with ViewLoader: %s", table_name, e)
                     
-        except ImportError:
-            logger.warning("Could not import ViewLoader. Semantic layer integration disabled.")
-            self.view_loader = None
         except Exception as e:
-            logger.warning(f"Error initializing semantic layer: {str(e)}")
+            logger.warning("Error initializing semantic layer: %s", e)
             self.view_loader = None
             
     def _create_column_mapping(self) -> None:
@@ -255,20 +486,20 @@ class DuckDBCsvConnector(DataConnector):
         try:
             first_table = next(iter(self.tables.values()))
             query = f"SELECT * FROM {first_table} LIMIT 0"
-            columns_df = self.connection.execute(query).fetchdf()
-            columns = columns_df.columns
+            # Read the names from the cursor description; no DataFrame is needed
+            columns = [column[0] for column in self.connection.execute(query).description]
             
             # If we have column metadata, use the defined aliases
-            if hasattr(self.config, 'metadata') and self.config.metadata:
+            if self._has_metadata:
                 for col_name, metadata in self.config.metadata.columns.items():
                     if col_name in columns:
                         for alias in metadata.alias:
                             self.column_mapping[alias.lower()] = col_name
                 
-                logger.info(f"Column mapping created from metadata: {self.column_mapping}")
+                logger.info("Column mapping created from metadata: %s", self.column_mapping)
             
             # If we have semantic schema, add column mappings from there as well
-            if hasattr(self.config, 'semantic_schema') and self.config.semantic_schema:
+            if self._has_semantic_schema:
                 schema = self.config.semantic_schema
                 for column in schema.columns:
                     if column.name in columns:
@@ -276,7 +507,7 @@ class DuckDBCsvConnector(DataConnector):
                         if column.description:
                             self.column_mapping[column.description.lower()] = column.name
                 
-                logger.info(f"Column mapping enhanced with semantic schema")
+                logger.info("Column mapping enhanced with semantic schema")
             
             else:
                 # Otherwise, use heuristic approach
@@ -303,55 +534,106 @@ class DuckDBCsvConnector(DataConnector):
                         if generic in self.column_mapping:
                             break
                 
-                logger.info(f"Column mapping created by heuristic: {self.column_mapping}")
+                logger.info("Column mapping created by heuristic: %s", self.column_mapping)
         except Exception as e:
-            logger.warning(f"Could not create column mapping: {str(e)}")
+            logger.warning("Could not create column mapping: %s", e)
             
     def _log_tables_schema(self) -> None:
         """
         Log information about table schemas for debugging.
+        
+        Only called when DEBUG logging is enabled, since it costs a metadata
+        query on every connect.
         """
+        if not self.tables:
+            return
+        
+        # Fetch the columns of every registered table in one metadata query
+        # instead of running DESCRIBE once per table
+        try:
+            rows = self.connection.execute(
+                "SELECT table_name, column_name, data_type FROM information_schema.columns "
+                "WHERE table_schema = current_schema() AND list_contains(?, table_name) "
+                "ORDER BY table_name, ordinal_position",
+                [list(self.tables.values())]
+            ).fetchall()
+        except Exception as e:
+            logger.warning("Could not get table schemas: %s", e)
+            return
+        
+        table_columns = {}
+        for table_name, column_name, column_type in rows:
+            table_columns.setdefault(table_name, []).append((column_name, column_type))
+        
         for file_name, table_name in self.tables.items():
-            try:
-                schema_info = self.connection.execute(f"DESCRIBE {table_name}").fetchdf()
-                logger.info(f"Schema for table {table_name} ({file_name}):")
-                for _, row in schema_info.iterrows():
-                    logger.info(f"  {row['column_name']} - {row['column_type']}")
-            except Exception as e:
-                logger.warning(f"Could not get schema for table {table_name}: {str(e)}")
+            if table_name not in table_columns:
+                logger.warning("Could not get schema for table %s", table_name)
+                continue
+            logger.debug("Schema for table %s (%s):", table_name, file_name)
+            for column_name, column_type in table_columns[table_name]:
+                logger.debug("  %s - %s", column_name, column_type)
                 
-    def read_data(self, query: Optional[str] = None) -> pd.DataFrame:
+    def read_data(self, query: Optional[str] = None, chunk_size: Optional[int] = None,
+                  columns: Optional[List[str]] = None
+                  ) -> Union[pd.DataFrame, "pa.Table", "pa.RecordBatchReader"]:
         """
         Read data from the CSV or directory of CSVs, optionally applying an SQL query.
         
         Args:
             query: Optional SQL query.
+            chunk_size: Optional number of rows per batch. When set, the result is
+                streamed as a pyarrow.RecordBatchReader instead of being materialized
+                as a single DataFrame. Semantic transformations are not applied to
+                streamed batches.
+            columns: Optional list of columns to read when no query is given. The
+                projection is pushed into DuckDB so other columns are never parsed.
+            
+        The 'output_format' config parameter ('pandas' by default, or 'arrow')
+        selects the result type. Arrow results are taken straight from DuckDB
+        without a pandas conversion and skip the semantic transformations.
             
         Returns:
-            pd.DataFrame: DataFrame with results.
+            Union[pd.DataFrame, pa.Table, pa.RecordBatchReader]: DataFrame with
+                results, a pyarrow.Table when output_format is 'arrow', or a
+                pyarrow.RecordBatchReader when chunk_size is given.
         """
         if not self.is_connected():
             raise DataConnectionException("Not connected to data source. Call connect() first.")
             
+        as_arrow = self.config.params.get('output_format', 'pandas') == 'arrow'
+        
         try:
             # Use semantic layer view if available and no specific query is provided
             if not query and self.view_loader is not None:
                 try:
                     # Construct and return view using the semantic schema
+                    if as_arrow:
+                        view_table = self.view_loader.construct_view_arrow()
+                        logger.info("View constructed using semantic schema for %s", self.config.source_id)
+                        return view_table.select(list(columns)) if columns else view_table
                     view_df = self.view_loader.construct_view()
-                    logger.info(f"View constructed using semantic schema for {self.config.source_id}")
+                    logger.info("View constructed using semantic schema for %s", self.config.source_id)
+                    if columns:
+                        view_df = view_df[list(columns)]
                     return view_df
                 except Exception as view_error:
-                    logger.warning(f"Error constructing view: {str(view_error)}. Falling back to regular query.")
+                    logger.warning("Error constructing view: %s. Falling back to regular query.", view_error)
             
             # If no specific query, select all data from the main table
             if not query:
+                select_list = ", ".join(map(_quote_ident, columns)) if columns else "*"
+                
                 if self.is_directory and self.config.params.get('return_dict', False):
                     # Return a dictionary of DataFrames for each file
                     result = {}
                     for file_name, table_name in self.tables.items():
                         try:
-                            df = self.connection.execute(f"SELECT * FROM {table_name}").fetchdf()
+                            cursor = self.connection.execute(f"SELECT {select_list} FROM {table_name}")
+                            if as_arrow:
+                                result[file_name] = cursor.fetch_record_batch().read_all()
+                                continue
+                            
+                            df = cursor.fetchdf()
                             
                             # Apply semantic transformations if available
                             if hasattr(self, 'apply_semantic_transformations'):
@@ -359,24 +641,31 @@ class DuckDBCsvConnector(DataConnector):
                                 
                             result[file_name] = df
                         except Exception as e:
-                            logger.warning(f"Error reading table {table_name}: {str(e)}")
+                            logger.warning("Error reading table %s: %s", table_name, e)
                     return result
                 
                 # Use the combined table or the only available table
-                table_to_query = self.table_name if self.table_name in self._get_all_tables() else next(iter(self.tables.values()), None)
+                table_to_query = self.table_name if self._table_registered else next(iter(self.tables.values()), None)
                 
                 if table_to_query:
-                    query = f"SELECT * FROM {table_to_query}"
+                    query = f"SELECT {select_list} FROM {table_to_query}"
                 else:
-                    return pd.DataFrame()
+                    return _EMPTY_DF.copy(deep=False)
             else:
                 # Adapt the query using metadata and table substitutions
                 query = self._adapt_query(query)
             
-            logger.info(f"Executing query: {query}")
+            logger.info("Executing query: %s", query)
             
             # Execute the query
             try:
+                if chunk_size:
+                    # Stream Arrow batches straight from DuckDB's vectors
+                    return self.connection.execute(query).fetch_record_batch(int(chunk_size))
+                
+                if as_arrow:
+                    return self.connection.execute(query).fetch_record_batch().read_all()
+                
                 result_df = self.connection.execute(query).fetchdf()
                 
                 # Apply semantic transformations if available
@@ -385,12 +674,12 @@ class DuckDBCsvConnector(DataConnector):
                     
                 return result_df
             except Exception as query_error:
-                logger.warning(f"Error in query: {str(query_error)}. Showing available tables.")
+                logger.warning("Error in query: %s. Showing available tables.", query_error)
                 
                 # List available tables to help the user
                 available_tables = self._get_all_tables()
                 error_msg = (f"Error executing query: {str(query_error)}. "
-                            f"Available tables: {', '.join(available_tables)}")
+                            f"Available tables: {', '.join(sorted(available_tables))}")
                 raise DataReadException(error_msg) from query_error
             
         except Exception as e:
@@ -400,27 +689,70 @@ class DuckDBCsvConnector(DataConnector):
             error_msg = f"Error reading data from CSV via DuckDB: {str(e)}"
             logger.error(error_msg)
             
-            # Try to provide an empty DataFrame instead of failing
-            try:
-                return pd.DataFrame()
-            except:
-                raise DataReadException(error_msg) from e
+            # Provide an empty DataFrame instead of failing
+            return _EMPTY_DF.copy(deep=False)
                 
-    def _get_all_tables(self) -> List[str]:
+    def read_data_batches(self, query: Optional[str] = None, batch_rows: int = 65536) -> Iterator:
+        """
+        Stream the result of a query as Arrow record batches.
+        
+        Unlike read_data, the result is never materialized as a whole, so memory
+        stays bounded by the batch size. The query runs on its own cursor, which
+        keeps the stream valid while other queries use the connection. Semantic
+        transformations are not applied.
+        
+        Args:
+            query: Optional SQL query. Defaults to all rows of the main table.
+            batch_rows: Number of rows per batch.
+            
+        Yields:
+            pyarrow.RecordBatch: Consecutive batches of the result.
+        """
+        if not self.is_connected():
+            raise DataConnectionException("Not connected to data source. Call connect() first.")
+        
+        if query:
+            query = self._adapt_query(query)
+        else:
+            table_to_query = self.table_name if self._table_registered else next(iter(self.tables.values()), None)
+            if not table_to_query:
+                return
+            query = f"SELECT * FROM {table_to_query}"
+        
+        logger.info("Streaming query: %s", query)
+        
+        cursor = self._cursor()
+        try:
+            try:
+                reader = cursor.execute(query).fetch_record_batch(int(batch_rows))
+            except Exception as query_error:
+                error_msg = f"Error executing query: {str(query_error)}"
+                logger.error(error_msg)
+                raise DataReadException(error_msg) from query_error
+            
+            yield from reader
+        finally:
+            cursor.close()
+    
+    def _get_all_tables(self) -> Set[str]:
         """
         Return all tables and views available in DuckDB.
         
+        The result is cached until the connection is reopened or closed, since
+        views are only created or dropped by connect() and close().
+        
         Returns:
-            List[str]: List of table/view names
+            Set[str]: Set of table/view names
         """
+        if self._tables_cache is not None:
+            return self._tables_cache
+        
         try:
-            tables_df = self.connection.execute("SHOW TABLES").fetchdf()
-            if 'name' in tables_df.columns:
-                return tables_df['name'].tolist()
-            return []
+            self._tables_cache = {row[0] for row in self.connection.execute("SHOW TABLES").fetchall()}
+            return self._tables_cache
         except Exception as e:
-            logger.warning(f"Error listing tables: {str(e)}")
-            return list(self.tables.values())
+            logger.warning("Error listing tables: %s", e)
+            return set(self.tables.values())
             
     def _adapt_query(self, query: str) -> str:
         """
@@ -432,19 +764,28 @@ class DuckDBCsvConnector(DataConnector):
         Returns:
             str: Adapted query.
         """
+        cached = self._adapt_cache.get(query)
+        if cached is not None:
+            self._adapt_cache.move_to_end(query)
+            return cached
+        
         adapted_query = query
         
         # Adapt with metadata if available
-        if hasattr(self.config, 'metadata') and self.config.metadata:
+        if self._has_metadata:
             adapted_query = self._adapt_query_with_metadata(adapted_query)
             
         # Adapt with semantic schema if available
-        if hasattr(self.config, 'semantic_schema') and self.config.semantic_schema:
+        if self._has_semantic_schema:
             adapted_query = self._adapt_query_with_semantic_schema(adapted_query)
             
         # Generic table name substitution
-        if "FROM csv" in adapted_query and self.table_name in self._get_all_tables():
-            adapted_query = adapted_query.replace("FROM csv", f"FROM {self.table_name}")
+        if self._table_registered:
+            adapted_query = _FROM_CSV_RE.sub(lambda match: match.group(1) + self.table_name, adapted_query)
+        
+        self._adapt_cache[query] = adapted_query
+        if len(self._adapt_cache) > _ADAPT_CACHE_SIZE:
+            self._adapt_cache.popitem(last=False)
             
         return adapted_query
             
@@ -458,22 +799,158 @@ class DuckDBCsvConnector(DataConnector):
         Returns:
             str: Adapted query.
         """
-        if not hasattr(self.config, 'metadata') or not self.config.metadata:
+        if not self._has_metadata:
             return query
         
-        metadata = self.config.metadata
-        adapted_query = query
+        pattern, alias_lookup = self._get_alias_regex(self.config.metadata)
+        if pattern is None:
+            return query
         
-        # Replace aliases with real column names
-        for alias, real_name in getattr(metadata, '_alias_lookup', {}).items():
-            # Use regex for precise replacement
-            import re
-            pattern = r'(?<![a-zA-Z0-9_])' + re.escape(alias) + r'(?![a-zA-Z0-9_])'
-            adapted_query = re.sub(pattern, real_name, adapted_query)
+        adapted_query = None
+        if sqlglot is not None:
+            adapted_query = self._rewrite_query_with_parser(query, alias_lookup)
         
-        logger.info(f"Query adapted with metadata: {adapted_query}")
+        if adapted_query is None:
+            # Replace aliases with real column names in a single pass,
+            # leaving string literals untouched
+            adapted_query = pattern.sub(
+                lambda match: alias_lookup[match.group(1)] if match.group(1) else match.group(0),
+                query
+            )
+        
+        logger.info("Query adapted with metadata: %s", adapted_query)
         return adapted_query
         
+    def _rewrite_query_with_parser(self, query: str, alias_lookup: Dict[str, str]) -> Optional[str]:
+        """
+        Rewrite column aliases (and the generic csv table) on the parsed query.
+        
+        Only column references are touched, so string literals, comments and
+        output aliases are left alone. References to a SELECT output alias in
+        ORDER BY, GROUP BY, HAVING or QUALIFY keep their name, since they point
+        at the projection rather than at a source column. The new names are
+        spliced into the original text at the parsed identifier positions, so
+        the rest of the query is returned exactly as written.
+        
+        Args:
+            query: Original SQL query.
+            alias_lookup: Alias -> column name lookup (aliases in lower case).
+            
+        Returns:
+            Optional[str]: Rewritten query, or None if it could not be parsed or
+                the parser does not report identifier positions.
+        """
+        try:
+            tree = sqlglot.parse_one(query, read='duckdb')
+            
+            edits = []
+            for column in tree.find_all(exp.Column):
+                real_name = alias_lookup.get(column.name.lower())
+                if real_name and not self._references_output_alias(column):
+                    edits.append((column.this, real_name))
+            
+            if self._table_registered:
+                for table in tree.find_all(exp.Table):
+                    if table.name.lower() == 'csv' and not table.db:
+                        edits.append((table.this, self.table_name))
+            
+            return self._splice_identifiers(query, edits)
+        except Exception as e:
+            logger.debug("Could not parse query, using regex alias substitution: %s", e)
+            return None
+    
+    @staticmethod
+    def _references_output_alias(column) -> bool:
+        """
+        Tell whether an unqualified column in ORDER BY, GROUP BY, HAVING or
+        QUALIFY names an output alias of its own SELECT.
+        """
+        if column.table:
+            return False
+        select = column.parent_select
+        if select is None:
+            return False
+        
+        node = column.parent
+        while node is not None and node is not select:
+            if isinstance(node, (exp.Order, exp.Group, exp.Having, exp.Qualify)):
+                break
+            node = node.parent
+        else:
+            return False
+        
+        name = column.name.lower()
+        return any(
+            isinstance(projection, exp.Alias) and projection.alias.lower() == name
+            for projection in select.expressions
+        )
+    
+    @staticmethod
+    def _splice_identifiers(query: str, edits: List[Tuple[object, str]]) -> Optional[str]:
+        """
+        Replace each parsed identifier in the original query text.
+        
+        Args:
+            query: Original SQL query.
+            edits: (identifier node, new name) pairs.
+            
+        Returns:
+            Optional[str]: Query with the identifiers replaced, or None when an
+                identifier carries no source position.
+        """
+        spans = []
+        for identifier, new_name in edits:
+            start = identifier.meta.get('start')
+            end = identifier.meta.get('end')
+            if start is None or end is None:
+                return None
+            # Positions are inclusive and cover the quotes of quoted names
+            replacement = exp.to_identifier(new_name).sql(dialect='duckdb')
+            spans.append((start, end + 1, replacement))
+        
+        parts = []
+        position = 0
+        for start, end, replacement in sorted(spans):
+            parts.append(query[position:start])
+            parts.append(replacement)
+            position = end
+        parts.append(query[position:])
+        return ''.join(parts)
+        
+    def _get_alias_regex(self, metadata: DatasetMetadata) -> Tuple[Optional[Pattern], Dict[str, str]]:
+        """
+        Return the compiled alias-substitution regex for the given metadata.
+        
+        All aliases are combined into one alternation (longest first, so an
+        alias never shadows a longer one it prefixes) and compiled once per
+        metadata object. Single-quoted string literals are matched as a whole
+        so their contents are never rewritten.
+        
+        Args:
+            metadata: Dataset metadata holding the alias lookup.
+            
+        Returns:
+            Tuple[Optional[Pattern], Dict[str, str]]: Compiled pattern (None when
+                there are no aliases) and the alias -> column name lookup.
+        """
+        cached = self._alias_regex_cache
+        if cached is not None and cached[0] is metadata:
+            return cached[1], cached[2]
+        
+        alias_lookup = getattr(metadata, '_alias_lookup', None) or {}
+        pattern = None
+        if alias_lookup:
+            aliases = sorted(alias_lookup, key=len, reverse=True)
+            # String literals are matched first so the scan steps over them whole
+            # and aliases are only rewritten outside quotes
+            pattern = re.compile(
+                r"'(?:[^']|'')*'|"
+                r'(?<![a-zA-Z0-9_])(' + '|'.join(map(re.escape, aliases)) + r')(?![a-zA-Z0-9_])'
+            )
+        
+        self._alias_regex_cache = (metadata, pattern, alias_lookup)
+        return pattern, alias_lookup
+        
     def _adapt_query_with_semantic_schema(self, query: str) -> str:
         """
         Adapt an SQL query using semantic schema information.
@@ -484,7 +961,7 @@ class DuckDBCsvConnector(DataConnector):
         Returns:
             str: Adapted query with semantic adaptations.
         """
-        if not hasattr(self.config, 'semantic_schema') or not self.config.semantic_schema:
+        if not self._has_semantic_schema:
             return query
             
         schema = self.config.semantic_schema
@@ -505,24 +982,28 @@ class DuckDBCsvConnector(DataConnector):
                 self.view_loader.close()
                 logger.info("ViewLoader connection closed")
             except Exception as view_error:
-                logger.warning(f"Error closing ViewLoader: {str(view_error)}")
+                logger.warning("Error closing ViewLoader: %s", view_error)
                 
         if self.connection:
             try:
-                # Try to remove the view/table before closing
-                try:
-                    self.connection.execute(f"DROP VIEW IF EXISTS {self.table_name}")
-                except Exception as drop_error:
-                    logger.warning(f"Could not remove view: {str(drop_error)}")
-                
-                # Close the connection
+                if self._schema_name:
+                    # Shared database: drop only this source's views, then
+                    # release our cursor; the database stays open for others
+                    self.connection.execute(f"DROP SCHEMA IF EXISTS {self._schema_name} CASCADE")
+                # The database is in-memory, so closing a private connection
+                # releases the whole catalog; dropping the views is redundant
                 self.connection.close()
             except Exception as e:
-                logger.warning(f"Error closing DuckDB connection: {str(e)}")
+                logger.warning("Error closing DuckDB connection: %s", e)
             finally:
                 self.connection = None
                 self.view_loader = None
-                logger.info(f"DuckDB connection closed for CSV: {self.config.params.get('path')}")
+                self._schema_name = None
+                self._tables_cache = None
+                self._schema_cache = None
+                self._table_registered = False
+                self._adapt_cache.clear()
+                logger.info("DuckDB connection closed for CSV: %s", self.config.params.get('path'))
     
     def is_connected(self) -> bool:
         """
@@ -536,7 +1017,7 @@ class DuckDBCsvConnector(DataConnector):
             
         try:
             # Check if the connection is active
-            self.connection.execute("SELECT 1")
+            self.connection.execute("SELECT 1").fetchone()
             return True
         except Exception:
             return False
@@ -545,43 +1026,57 @@ class DuckDBCsvConnector(DataConnector):
         """
         Return the schema (structure) of the CSV file.
         
+        The schema is computed once per connection and cached; callers receive
+        a copy so they can modify it freely.
+        
         Returns:
             pd.DataFrame: DataFrame with schema information.
         """
         if not self.is_connected():
             raise DataConnectionException("Not connected to data source. Call connect() first.")
+        
+        if self._schema_cache is not None:
+            return self._schema_cache.copy()
             
         try:
             # Get information about column schema
             query = f"DESCRIBE {self.table_name}"
-            return self.connection.execute(query).fetchdf()
+            self._schema_cache = self.connection.execute(query).fetchdf()
+            return self._schema_cache.copy()
         except Exception as e:
-            logger.warning(f"Error getting schema: {str(e)}")
+            logger.warning("Error getting schema: %s", e)
             
-            # Alternative: create schema based on a simple query
+            # Alternative: derive the schema from the result description of an
+            # empty query, which returns column metadata without scanning rows
             try:
-                query = f"SELECT * FROM {self.table_name} LIMIT 1"
-                sample = self.connection.execute(query).fetchdf()
+                query = f"SELECT * FROM {self.table_name} LIMIT 0"
+                description = self.connection.execute(query).description
                 
                 schema_data = {
-                    'column_name': sample.columns,
-                    'column_type': [str(sample[col].dtype) for col in sample.columns]
+                    'column_name': [column[0] for column in description],
+                    'column_type': [str(column[1]) for column in description]
                 }
-                return pd.DataFrame(schema_data)
+                self._schema_cache = pd.DataFrame(schema_data)
+                return self._schema_cache.copy()
             except Exception as alt_error:
                 error_msg = f"Error getting alternative schema: {str(alt_error)}"
                 logger.error(error_msg)
                 raise DataReadException(error_msg) from e
     
-    def sample_data(self, num_rows: int = 5) -> pd.DataFrame:
+    def sample_data(self, num_rows: int = 5, as_arrow: bool = False,
+                    columns: Optional[List[str]] = None) -> Union[pd.DataFrame, "pa.Table"]:
         """
         Return a sample of the data.
         
         Args:
             num_rows: Number of rows to return.
+            as_arrow: If True, return a pyarrow.Table instead of a DataFrame,
+                skipping the pandas conversion.
+            columns: Optional list of columns to return. The projection is
+                pushed into DuckDB so other columns are never parsed.
             
         Returns:
-            pd.DataFrame: DataFrame with the sample.
+            Union[pd.DataFrame, pa.Table]: DataFrame with the sample (pyarrow.Table if as_arrow).
         """
         if not self.is_connected():
             raise DataConnectionException("Not connected to data source. Call connect() first.")
@@ -590,24 +1085,26 @@ class DuckDBCsvConnector(DataConnector):
             # If we have a semantic view, use that
             if self.view_loader:
                 try:
-                    view_df = self.view_loader.construct_view()
-                    return view_df.head(num_rows)
+                    if as_arrow:
+                        view_table = self.view_loader.construct_view_arrow(limit=num_rows)
+                        return view_table.select(list(columns)) if columns else view_table
+                    view_df = self.view_loader.construct_view(limit=num_rows)
+                    if columns:
+                        view_df = view_df[list(columns)]
+                    return view_df
                 except Exception as view_error:
-                    logger.warning(f"Error sampling from semantic view: {str(view_error)}. Using raw table.")
+                    logger.warning("Error sampling from semantic view: %s. Using raw table.", view_error)
             
             # Otherwise, use the raw table
-            query = f"SELECT * FROM {self.table_name} LIMIT {num_rows}"
-            return self.connection.execute(query).fetchdf()
+            # The row count is bound as a parameter: the SQL text stays constant
+            # and int() rejects anything that is not a number
+            select_list = ", ".join(map(_quote_ident, columns)) if columns else "*"
+            query = f"SELECT {select_list} FROM {self.table_name} LIMIT ?"
+            result = self.connection.execute(query, [int(num_rows)])
+            if as_arrow:
+                return result.fetch_record_batch().read_all()
+            return result.fetchdf()
         except Exception as e:
             error_msg = f"Error getting data sample: {str(e)}"
             logger.error(error_msg)
             raise DataReadException(error_msg) from e
-            
-        except ImportError:
-            error_msg = "duckdb module not found. Install with: pip install duckdb"
-            logger.error(error_msg)
-            raise DataConnectionException(error_msg)
-        except Exception as e:
-            error_msg = f"Error connecting to CSV via DuckDB: {str(e)}"
-            logger.error(error_msg)
-            raise DataConnectionException(error_msg) from e
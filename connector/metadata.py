@@ -1,61 +1,156 @@
+import copy
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import math
+import mmap
+import os
+import re
+import sys
+import threading
+from dataclasses import dataclass, field
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 logger = logging.getLogger("column_metadata")
 
+# Usa orjson quando disponível; pode ser desligado (ex.: em testes) para
+# forçar o módulo json da biblioteca padrão
+_FAST_JSON = orjson is not None
+
+# Caracteres que json.dumps escapa com ensure_ascii e o orjson grava como UTF-8
+_NON_ASCII = re.compile('[\x7f-\U0010ffff]')
+
+
+def _intern(value: Any) -> Any:
+    """Interna strings repetidas (nomes, tipos, tags); outros valores passam intactos."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _dumps_bytes(data: Dict[str, Any], indent: Optional[int]) -> Optional[bytes]:
+    """
+    Serializa um dicionário para JSON em bytes usando orjson.
+    
+    A saída é idêntica, byte a byte, à de json.dumps(data, indent=2): o texto
+    fora do ASCII imprimível é escapado como no ensure_ascii, e números de
+    ponto flutuante que o orjson formata de outro jeito (expoentes, NaN)
+    ficam para o json padrão.
+    
+    Args:
+        data: Dicionário a serializar.
+        indent: Número de espaços para indentação (apenas 2 usa orjson).
+        
+    Returns:
+        Optional[bytes]: JSON codificado em ASCII, ou None quando orjson não pode
+            ser usado e o chamador deve recorrer ao json da biblioteca padrão.
+    """
+    # Sem indentação, o json padrão usa separadores com espaço que o orjson não gera
+    if not _FAST_JSON or indent != 2 or not _floats_match_json(data):
+        return None
+    
+    try:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    except TypeError:
+        # Chaves não-string e tipos desconhecidos ficam para o json padrão
+        return None
+    if encoded.isascii() and b'\x7f' not in encoded:
+        return encoded
+    return _NON_ASCII.sub(_escape_non_ascii, encoded.decode('utf-8')).encode('ascii')
+
+
+def _escape_non_ascii(match: 're.Match[str]') -> str:
+    """Escapa um caractere como \\uXXXX, com par substituto acima do BMP (como o json)."""
+    code = ord(match.group())
+    if code < 0x10000:
+        return '\\u{0:04x}'.format(code)
+    code -= 0x10000
+    return '\\u{0:04x}\\u{1:04x}'.format(0xd800 | (code >> 10), 0xdc00 | (code & 0x3ff))
+
+
+def _floats_match_json(value: Any) -> bool:
+    """
+    Verifica se todo float tem a mesma representação no orjson e no json
+    padrão: valores finitos cujo repr não usa expoente.
+    """
+    if type(value) is float:
+        return math.isfinite(value) and 'e' not in repr(value)
+    if isinstance(value, dict):
+        return all(_floats_match_json(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return all(_floats_match_json(item) for item in value)
+    return True
+
+
+def _load_mapped_json(file_path: str) -> Any:
+    """
+    Lê um arquivo JSON mapeando-o em memória e analisando os bytes com orjson.
+    
+    Evita copiar o conteúdo do arquivo para um objeto str/bytes antes do parse.
+    
+    Args:
+        file_path: Caminho para o arquivo JSON.
+        
+    Returns:
+        Any: Conteúdo JSON decodificado.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            # mmap não aceita arquivos vazios
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError(f"JSON inválido: arquivo vazio: {file_path}")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+    except FileNotFoundError:
+        raise ValueError(f"Arquivo não encontrado: {file_path}")
+    except orjson.JSONDecodeError as e:
+        raise ValueError(f"JSON inválido: {str(e)}")
+
+@dataclass(frozen=True, slots=True, eq=False)
 class ColumnMetadata:
     """
     Armazena metadados para uma coluna específica.
     
+    Instâncias são imutáveis; listas recebidas são armazenadas como tuplas.
+    
     Attributes:
         name (str): Nome da coluna no dataset.
         description (str): Descrição da finalidade/significado da coluna.
         data_type (str): Tipo de dados esperado (str, int, float, date, etc).
         format (str): Formato específico (ex: YYYY-MM-DD para datas).
-        alias (List[str]): Nomes alternativos para a coluna.
-        aggregations (List[str]): Agregações recomendadas (sum, avg, etc).
+        alias (Tuple[str, ...]): Nomes alternativos para a coluna.
+        aggregations (Tuple[str, ...]): Agregações recomendadas (sum, avg, etc).
         validation (Dict): Regras de validação (min, max, etc).
         display (Dict): Preferências de exibição (precision, unit, etc).
-        tags (List[str]): Tags para categorização.
+        tags (Tuple[str, ...]): Tags para categorização.
     """
     
-    def __init__(
-        self,
-        name: str,
-        description: str = None,
-        data_type: str = None,
-        format: str = None,
-        alias: List[str] = None,
-        aggregations: List[str] = None,
-        validation: Dict[str, Any] = None,
-        display: Dict[str, Any] = None,
-        tags: List[str] = None
-    ):
-        """
-        Inicializa metadados para uma coluna.
-        
-        Args:
-            name: Nome da coluna.
-            description: Descrição/propósito da coluna.
-            data_type: Tipo de dados esperado.
-            format: Formato específico.
-            alias: Nomes alternativos para a coluna.
-            aggregations: Agregações recomendadas.
-            validation: Regras de validação.
-            display: Configurações de exibição.
-            tags: Tags para categorização.
-        """
-        self.name = name
-        self.description = description
-        self.data_type = data_type
-        self.format = format
-        self.alias = alias or []
-        self.aggregations = aggregations or []
-        self.validation = validation or {}
-        self.display = display or {}
-        self.tags = tags or []
+    name: str
+    description: Optional[str] = None
+    data_type: Optional[str] = None
+    format: Optional[str] = None
+    alias: Tuple[str, ...] = ()
+    aggregations: Tuple[str, ...] = ()
+    validation: Dict[str, Any] = field(default_factory=dict)
+    display: Dict[str, Any] = field(default_factory=dict)
+    tags: Tuple[str, ...] = ()
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        """Normaliza valores None e listas recebidos no construtor."""
+        object.__setattr__(self, 'name', _intern(self.name))
+        object.__setattr__(self, 'data_type', _intern(self.data_type))
+        object.__setattr__(self, 'alias', tuple(map(_intern, self.alias or ())))
+        object.__setattr__(self, 'aggregations', tuple(map(_intern, self.aggregations or ())))
+        object.__setattr__(self, 'validation', self.validation or {})
+        object.__setattr__(self, 'display', self.display or {})
+        object.__setattr__(self, 'tags', tuple(map(_intern, self.tags or ())))
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ColumnMetadata':
@@ -71,51 +166,65 @@ class ColumnMetadata:
         if 'name' not in data:
             raise ValueError("O metadado da coluna deve conter o campo 'name'")
         
+        # Chamada posicional, sem montar um dicionário de kwargs; chaves
+        # desconhecidas são ignoradas
+        get = data.get
         return cls(
-            name=data['name'],
-            description=data.get('description'),
-            data_type=data.get('data_type'),
-            format=data.get('format'),
-            alias=data.get('alias'),
-            aggregations=data.get('aggregations'),
-            validation=data.get('validation'),
-            display=data.get('display'),
-            tags=data.get('tags')
+            data['name'],
+            get('description'),
+            get('data_type'),
+            get('format'),
+            get('alias', ()),
+            get('aggregations', ()),
+            get('validation'),
+            get('display'),
+            get('tags', ()),
         )
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Converte os metadados para um dicionário.
         
+        Como a instância é imutável, o resultado é montado uma única vez e
+        mantido em cache. Cada chamada devolve uma cópia profunda, que o
+        chamador pode alterar sem afetar o cache.
+        
         Returns:
             Dict: Representação em dicionário.
         """
+        return copy.deepcopy(self._cached())
+    
+    def _cached(self) -> Dict[str, Any]:
+        """Retorna o dicionário em cache, compartilhado; não deve ser alterado."""
+        if self._cached_dict is None:
+            object.__setattr__(self, '_cached_dict', self._build_dict())
+        return self._cached_dict
+    
+    def _build_dict(self) -> Dict[str, Any]:
+        """Monta a representação em dicionário dos metadados da coluna."""
         result = {'name': self.name}
-        
-        if self.description:
-            result['description'] = self.description
-        if self.data_type:
-            result['data_type'] = self.data_type
-        if self.format:
-            result['format'] = self.format
-        if self.alias:
-            result['alias'] = self.alias
-        if self.aggregations:
-            result['aggregations'] = self.aggregations
-        if self.validation:
-            result['validation'] = self.validation
-        if self.display:
-            result['display'] = self.display
-        if self.tags:
-            result['tags'] = self.tags
-            
+        # Campos opcionais vazios são omitidos; tuplas voltam a ser listas
+        result.update(
+            (key, list(value) if type(value) is tuple else value)
+            for key, value in zip(_COLUMN_OPTIONAL, _get_column_optional(self))
+            if value
+        )
         return result
 
 
+# Campos opcionais serializados por to_dict, na ordem de saída
+_COLUMN_OPTIONAL = ('description', 'data_type', 'format', 'alias',
+                    'aggregations', 'validation', 'display', 'tags')
+_get_column_optional = attrgetter(*_COLUMN_OPTIONAL)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class DatasetMetadata:
     """
     Armazena metadados para um dataset completo.
     
+    Instâncias são imutáveis; listas recebidas são armazenadas como tuplas.
+    
     Attributes:
         name (str): Nome do dataset.
         description (str): Descrição do dataset.
@@ -124,55 +233,56 @@ class DatasetMetadata:
         created_at (str): Data de criação.
         updated_at (str): Data da última atualização.
         version (str): Versão dos metadados.
-        tags (List[str]): Tags para categorização.
+        tags (Tuple[str, ...]): Tags para categorização.
         owner (str): Proprietário do dataset.
         custom (Dict): Campos personalizados adicionais.
     """
     
-    def __init__(
-        self,
-        name: str,
-        description: str = None,
-        source: str = None,
-        columns: Dict[str, ColumnMetadata] = None,
-        created_at: str = None,
-        updated_at: str = None,
-        version: str = None,
-        tags: List[str] = None,
-        owner: str = None,
-        custom: Dict[str, Any] = None
-    ):
-        """
-        Inicializa metadados para um dataset.
-        
-        Args:
-            name: Nome do dataset.
-            description: Descrição do dataset.
-            source: Origem dos dados.
-            columns: Metadados de cada coluna.
-            created_at: Data de criação.
-            updated_at: Data da última atualização.
-            version: Versão dos metadados.
-            tags: Tags para categorização.
-            owner: Proprietário do dataset.
-            custom: Campos personalizados adicionais.
-        """
-        self.name = name
-        self.description = description
-        self.source = source
-        self.columns = columns or {}
-        self.created_at = created_at
-        self.updated_at = updated_at
-        self.version = version
-        self.tags = tags or []
-        self.owner = owner
-        self.custom = custom or {}
+    name: str
+    description: Optional[str] = None
+    source: Optional[str] = None
+    columns: Dict[str, ColumnMetadata] = field(default_factory=dict)
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    version: Optional[str] = None
+    tags: Tuple[str, ...] = ()
+    owner: Optional[str] = None
+    custom: Dict[str, Any] = field(default_factory=dict)
+    _alias_lookup: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _resolve: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _by_tag: Dict[str, Tuple[str, ...]] = field(default_factory=dict, init=False, repr=False)
+    _by_type: Dict[Optional[str], Tuple[str, ...]] = field(default_factory=dict, init=False, repr=False)
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    _cached_json: Dict[Optional[int], bytes] = field(default_factory=dict, init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        """Normaliza valores recebidos no construtor e monta o lookup de alias."""
+        object.__setattr__(self, 'columns', self.columns or {})
+        object.__setattr__(self, 'tags', tuple(map(_intern, self.tags or ())))
+        object.__setattr__(self, 'custom', self.custom or {})
         
         # Cria lookup para nomes alternativos (alias) das colunas
-        self._alias_lookup = {}
         for column_name, metadata in self.columns.items():
             for alias in metadata.alias:
-                self._alias_lookup[alias.lower()] = column_name
+                self._alias_lookup[_intern(alias.lower())] = column_name
+        
+        # Lookup único de resolução: nomes em minúsculas, depois alias e, com
+        # maior prioridade, os nomes exatos das colunas. Fica como dict comum
+        # para que a instância continue serializável com pickle e deepcopy
+        resolve = {_intern(column_name.lower()): column_name for column_name in self.columns}
+        resolve.update(self._alias_lookup)
+        resolve.update((column_name, column_name) for column_name in self.columns)
+        object.__setattr__(self, '_resolve', resolve)
+        
+        # Índices invertidos por tag e por tipo, na ordem das colunas
+        by_tag: Dict[str, List[str]] = {}
+        by_type: Dict[Optional[str], List[str]] = {}
+        for column_name, metadata in self.columns.items():
+            for tag in dict.fromkeys(metadata.tags):
+                by_tag.setdefault(tag, []).append(column_name)
+            by_type.setdefault(metadata.data_type, []).append(column_name)
+        object.__setattr__(self, '_by_tag', {tag: tuple(names) for tag, names in by_tag.items()})
+        object.__setattr__(self, '_by_type', {data_type: tuple(names) for data_type, names in by_type.items()})
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'DatasetMetadata':
@@ -220,7 +330,8 @@ class DatasetMetadata:
             DatasetMetadata: Nova instância.
         """
         try:
-            data = json.loads(json_str)
+            # orjson aceita tanto str quanto bytes
+            data = orjson.loads(json_str) if _FAST_JSON else json.loads(json_str)
             return cls.from_dict(data)
         except json.JSONDecodeError as e:
             raise ValueError(f"JSON inválido: {str(e)}")
@@ -237,6 +348,10 @@ class DatasetMetadata:
             DatasetMetadata: Nova instância.
         """
         try:
+            if _FAST_JSON:
+                # Lê bytes diretamente, sem decodificar para str antes do parse
+                with open(file_path, 'rb') as f:
+                    return cls.from_json(f.read())
             with open(file_path, 'r', encoding='utf-8') as f:
                 return cls.from_json(f.read())
         except FileNotFoundError:
@@ -246,32 +361,32 @@ class DatasetMetadata:
         """
         Converte os metadados para um dicionário.
         
+        Como a instância é imutável, o resultado é montado uma única vez e
+        mantido em cache. Cada chamada devolve uma cópia profunda, que o
+        chamador pode alterar sem afetar o cache.
+        
         Returns:
             Dict: Representação em dicionário.
         """
+        return copy.deepcopy(self._cached())
+    
+    def _cached(self) -> Dict[str, Any]:
+        """Retorna o dicionário em cache, compartilhado; não deve ser alterado."""
+        if self._cached_dict is None:
+            object.__setattr__(self, '_cached_dict', self._build_dict())
+        return self._cached_dict
+    
+    def _build_dict(self) -> Dict[str, Any]:
+        """Monta a representação em dicionário dos metadados do dataset."""
         result = {'name': self.name}
-        
-        if self.description:
-            result['description'] = self.description
-        if self.source:
-            result['source'] = self.source
-        
-        if self.columns:
+        # Campos opcionais vazios são omitidos; tuplas voltam a ser listas
+        result.update(
+            (key, list(value) if type(value) is tuple else value)
+            for key, value in zip(_DATASET_OPTIONAL, _get_dataset_optional(self))
+            if value
+        )
+        if 'columns' in result:
             result['columns'] = [col.to_dict() for col in self.columns.values()]
-            
-        if self.created_at:
-            result['created_at'] = self.created_at
-        if self.updated_at:
-            result['updated_at'] = self.updated_at
-        if self.version:
-            result['version'] = self.version
-        if self.tags:
-            result['tags'] = self.tags
-        if self.owner:
-            result['owner'] = self.owner
-        if self.custom:
-            result['custom'] = self.custom
-            
         return result
     
     def to_json(self, indent: int = 2) -> str:
@@ -284,7 +399,26 @@ class DatasetMetadata:
         Returns:
             str: Representação JSON.
         """
-        return json.dumps(self.to_dict(), indent=indent)
+        return self._json_bytes(indent).decode('utf-8')
+    
+    def _json_bytes(self, indent: Optional[int]) -> bytes:
+        """
+        Retorna o JSON dos metadados em UTF-8, mantido em cache por indentação.
+        
+        Args:
+            indent: Número de espaços para indentação.
+            
+        Returns:
+            bytes: Representação JSON codificada.
+        """
+        encoded = self._cached_json.get(indent)
+        if encoded is None:
+            data = self._cached()
+            encoded = _dumps_bytes(data, indent)
+            if encoded is None:
+                encoded = json.dumps(data, indent=indent).encode('utf-8')
+            self._cached_json[indent] = encoded
+        return encoded
     
     def save_to_file(self, file_path: str, indent: int = 2) -> None:
         """
@@ -294,8 +428,9 @@ class DatasetMetadata:
             file_path: Caminho para o arquivo.
             indent: Número de espaços para indentação.
         """
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(self.to_json(indent))
+        # Grava os bytes já codificados, sem passar por str
+        with open(file_path, 'wb') as f:
+            f.write(self._json_bytes(indent))
     
     def get_column_metadata(self, column_name: str) -> Optional[ColumnMetadata]:
         """
@@ -307,17 +442,8 @@ class DatasetMetadata:
         Returns:
             Optional[ColumnMetadata]: Metadados da coluna ou None se não encontrado.
         """
-        # Verifica nome exato
-        if column_name in self.columns:
-            return self.columns[column_name]
-        
-        # Verifica alias
-        column_lower = column_name.lower()
-        if column_lower in self._alias_lookup:
-            actual_name = self._alias_lookup[column_lower]
-            return self.columns[actual_name]
-        
-        return None
+        actual_name = self.resolve_column_name(column_name)
+        return self.columns[actual_name] if actual_name else None
     
     def get_columns_by_tag(self, tag: str) -> List[str]:
         """
@@ -329,8 +455,7 @@ class DatasetMetadata:
         Returns:
             List[str]: Lista de nomes de colunas.
         """
-        return [name for name, metadata in self.columns.items() 
-                if tag in metadata.tags]
+        return list(self._by_tag.get(tag, ()))
     
     def get_columns_by_type(self, data_type: str) -> List[str]:
         """
@@ -342,8 +467,7 @@ class DatasetMetadata:
         Returns:
             List[str]: Lista de nomes de colunas.
         """
-        return [name for name, metadata in self.columns.items() 
-                if metadata.data_type == data_type]
+        return list(self._by_type.get(data_type, ()))
     
     def get_recommended_aggregations(self, column_name: str) -> List[str]:
         """
@@ -356,7 +480,7 @@ class DatasetMetadata:
             List[str]: Lista de agregações recomendadas.
         """
         metadata = self.get_column_metadata(column_name)
-        return metadata.aggregations if metadata else []
+        return list(metadata.aggregations) if metadata else []
     
     def resolve_column_name(self, name_or_alias: str) -> Optional[str]:
         """
@@ -368,14 +492,14 @@ class DatasetMetadata:
         Returns:
             Optional[str]: Nome real da coluna ou None se não encontrado.
         """
-        if name_or_alias in self.columns:
-            return name_or_alias
-        
-        name_lower = name_or_alias.lower()
-        if name_lower in self._alias_lookup:
-            return self._alias_lookup[name_lower]
-        
-        return None
+        # Chaves já normalizadas resolvem sem o custo de lower()
+        return self._resolve.get(name_or_alias) or self._resolve.get(name_or_alias.lower())
+
+
+# Campos opcionais serializados por to_dict, na ordem de saída
+_DATASET_OPTIONAL = ('description', 'source', 'columns', 'created_at',
+                     'updated_at', 'version', 'tags', 'owner', 'custom')
+_get_dataset_optional = attrgetter(*_DATASET_OPTIONAL)
 
 
 class MetadataRegistry:
@@ -384,17 +508,36 @@ class MetadataRegistry:
     
     Esta classe gerencia metadados para múltiplos datasets e fornece
     métodos para registrar, recuperar e utilizar esses metadados.
+    
+    O mapa de datasets é copy-on-write: leituras acessam uma visão imutável
+    sem lock, e escritas montam um novo dicionário sob lock e o substituem
+    de uma só vez.
     """
     
-    _instance = None
+    _instance: Optional['MetadataRegistry'] = None
+    _lock = threading.Lock()
+    _datasets: Mapping[str, DatasetMetadata]
     
-    def __new__(cls):
+    def __new__(cls) -> 'MetadataRegistry':
         """Implementação de Singleton para o registro."""
         if cls._instance is None:
-            cls._instance = super(MetadataRegistry, cls).__new__(cls)
-            cls._instance._datasets = {}
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(MetadataRegistry, cls).__new__(cls)
+                    instance._datasets = MappingProxyType({})
+                    cls._instance = instance
         return cls._instance
     
+    def _register_many(self, datasets: List[DatasetMetadata]) -> None:
+        """Publica um novo mapa de datasets contendo os metadados informados."""
+        with self._lock:
+            updated = dict(self._datasets)
+            for metadata in datasets:
+                updated[metadata.name] = metadata
+            self._datasets = MappingProxyType(updated)
+        for metadata in datasets:
+            logger.info(f"Metadados registrados para dataset: {metadata.name}")
+    
     def register_metadata(self, metadata: DatasetMetadata) -> None:
         """
         Registra metadados para um dataset.
@@ -402,8 +545,7 @@ class MetadataRegistry:
         Args:
             metadata: Objeto DatasetMetadata.
         """
-        self._datasets[metadata.name] = metadata
-        logger.info(f"Metadados registrados para dataset: {metadata.name}")
+        self._register_many([metadata])
     
     def register_from_dict(self, metadata_dict: Dict[str, Any]) -> None:
         """
@@ -435,6 +577,25 @@ class MetadataRegistry:
         metadata = DatasetMetadata.from_file(file_path)
         self.register_metadata(metadata)
     
+    def register_from_files(self, file_paths: List[str]) -> None:
+        """
+        Registra metadados a partir de vários arquivos JSON.
+        
+        Com orjson disponível, cada arquivo é mapeado em memória e analisado
+        diretamente dos bytes mapeados; caso contrário, usa o mesmo caminho
+        de register_from_file.
+        
+        Args:
+            file_paths: Caminhos para os arquivos JSON.
+        """
+        datasets = []
+        for file_path in file_paths:
+            if _FAST_JSON:
+                datasets.append(DatasetMetadata.from_dict(_load_mapped_json(file_path)))
+            else:
+                datasets.append(DatasetMetadata.from_file(file_path))
+        self._register_many(datasets)
+    
     def get_metadata(self, dataset_name: str) -> Optional[DatasetMetadata]:
         """
         Obtém metadados para um dataset específico.
@@ -457,11 +618,14 @@ class MetadataRegistry:
         Returns:
             bool: True se removido com sucesso, False caso contrário.
         """
-        if dataset_name in self._datasets:
-            del self._datasets[dataset_name]
-            logger.info(f"Metadados removidos para dataset: {dataset_name}")
-            return True
-        return False
+        with self._lock:
+            if dataset_name not in self._datasets:
+                return False
+            updated = dict(self._datasets)
+            del updated[dataset_name]
+            self._datasets = MappingProxyType(updated)
+        logger.info(f"Metadados removidos para dataset: {dataset_name}")
+        return True
     
     def list_datasets(self) -> List[str]:
         """
@@ -470,9 +634,10 @@ class MetadataRegistry:
         Returns:
             List[str]: Lista de nomes de datasets.
         """
-        return list(self._datasets.keys())
+        return list(self._datasets)
     
     def clear(self) -> None:
         """Remove todos os metadados registrados."""
-        self._datasets.clear()
+        with self._lock:
+            self._datasets = MappingProxyType({})
         logger.info("Registro de metadados limpo")
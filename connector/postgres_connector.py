@@ -1,5 +1,13 @@
+import hashlib
+import io
+import os
+import queue
 import pandas as pd
 import logging
+import threading
+from typing import Dict, Iterator, Tuple
+from uuid import uuid4
+from urllib.parse import quote
 
 from connector.data_connector import DataConnector
 from connector.datasource_config import DataSourceConfig
@@ -11,7 +19,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger("connector")
 
+# Pools de conexões compartilhados pelo processo, por (host, porta, banco,
+# usuário, hash da senha)
+_POOLS: Dict[Tuple, "ThreadedConnectionPool"] = {}
+_POOLS_LOCK = threading.Lock()
 
+try:
+    import psycopg2
+    from psycopg2.pool import PoolError, ThreadedConnectionPool
+except ImportError:
+    psycopg2 = None
+    PoolError = None
+    ThreadedConnectionPool = None
+
+# ConnectorX é opcional: lê resultados pelo protocolo binário direto para Arrow
+try:
+    import connectorx as cx
+except ImportError:
+    cx = None
+
+# Tipos do resultado por OID do PostgreSQL, usados para ler a saída do COPY.
+# OIDs ausentes são lidos como texto
+_COPY_DTYPES = {
+    20: 'Int64', 21: 'Int64', 23: 'Int64', 26: 'Int64',  # int8, int2, int4, oid
+    700: 'float64', 701: 'float64', 1700: 'float64',     # float4, float8, numeric
+}
+_BOOL_OID = 16
+_TIMESTAMPTZ_OID = 1184
+_COPY_DATETIME_OIDS = frozenset((1082, 1114, _TIMESTAMPTZ_OID))  # date, timestamp, timestamptz
+_COPY_BOOLS = {'t': True, 'f': False}
+
+
+# Trechos de mensagens de erro do ConnectorX que indicam um tipo não suportado;
+# só nesses casos a consulta é repetida pelo pandas
+_CX_UNSUPPORTED_MARKERS = ('unsupported', 'not supported', 'unimplemented', 'not implemented')
 
 class PostgresConnector(DataConnector):
     """
@@ -19,7 +60,8 @@ class PostgresConnector(DataConnector):
     
     Attributes:
         config (DataSourceConfig): Configuração da fonte de dados.
-        connection: Conexão com o banco de dados.
+        connection: Conexão com o banco de dados, emprestada de um pool
+            compartilhado por todos os conectores com o mesmo destino.
     """
     
     def __init__(self, config: DataSourceConfig):
@@ -31,6 +73,8 @@ class PostgresConnector(DataConnector):
         """
         self.config = config
         self.connection = None
+        self._pool = None
+        self._conn_url = None
         
         # Validação de parâmetros obrigatórios
         required_params = ['host', 'database', 'username', 'password']
@@ -40,47 +84,114 @@ class PostgresConnector(DataConnector):
             raise ConfigurationException(
                 f"Parâmetros obrigatórios ausentes para PostgreSQL: {', '.join(missing_params)}"
             )
+        
+        # Parâmetros de conexão montados uma única vez
+        params = self.config.params
+        self._conn_kwargs = {
+            'host': params['host'],
+            'port': params.get('port', 5432),
+            'database': params['database'],
+            'user': params['username'],
+            'password': params['password'],
+        }
+        # A senha entra na chave (como hash) para que credenciais diferentes nunca
+        # recebam uma conexão já autenticada por outro conector
+        password_hash = hashlib.sha256(str(params['password']).encode('utf-8')).hexdigest()
+        self._pool_key = (params['host'], self._conn_kwargs['port'], params['database'],
+                          params['username'], password_hash)
     
     def connect(self) -> None:
         """
         Estabelece conexão com o banco PostgreSQL.
         """
+        if psycopg2 is None:
+            error_msg = "Módulo psycopg2 não encontrado. Instale com: pip install psycopg2-binary"
+            logger.error(error_msg)
+            raise DataConnectionException(error_msg)
+        
         try:
-            import psycopg2
-            
-            host = self.config.params['host']
-            database = self.config.params['database']
-            username = self.config.params['username']
-            password = self.config.params['password']
-            port = self.config.params.get('port', 5432)
+            kwargs = self._conn_kwargs
+            host = kwargs['host']
+            database = kwargs['database']
             
             logger.info(f"Conectando ao PostgreSQL: {host}/{database}")
             
-            self.connection = psycopg2.connect(
-                host=host,
-                port=port,
-                database=database,
-                user=username,
-                password=password
+            # Reaproveita o pool do processo para este destino, evitando um novo
+            # handshake TCP/TLS e autenticação a cada conexão
+            with _POOLS_LOCK:
+                pool = _POOLS.get(self._pool_key)
+                if pool is None or pool.closed:
+                    pool = ThreadedConnectionPool(
+                        1,
+                        self.config.params.get('pool_max_connections', 10),
+                        **kwargs
+                    )
+                    _POOLS[self._pool_key] = pool
+            
+            self.connection = self._checkout(pool, kwargs)
+            self._conn_url = (
+                f"postgresql://{quote(str(kwargs['user']), safe='')}:{quote(str(kwargs['password']), safe='')}"
+                f"@{host}:{kwargs['port']}/{quote(str(database), safe='')}"
             )
             
             logger.info(f"Conectado com sucesso ao PostgreSQL: {host}/{database}")
             
-        except ImportError:
-            error_msg = "Módulo psycopg2 não encontrado. Instale com: pip install psycopg2-binary"
-            logger.error(error_msg)
-            raise DataConnectionException(error_msg)
         except Exception as e:
             error_msg = f"Erro ao conectar com PostgreSQL: {str(e)}"
             logger.error(error_msg)
             raise DataConnectionException(error_msg) from e
     
-    def read_data(self, query: str) -> pd.DataFrame:
+    def _checkout(self, pool: "ThreadedConnectionPool", kwargs: Dict) -> "psycopg2.extensions.connection":
+        """
+        Empresta uma conexão válida do pool ou, se ele estiver esgotado, abre
+        uma conexão própria, como fazia cada conector antes do pool.
+        
+        Conexões do pool são validadas com SELECT 1; as que o servidor já
+        encerrou são descartadas.
+        
+        Args:
+            pool: Pool compartilhado para o destino do conector.
+            kwargs: Parâmetros de conexão.
+            
+        Returns:
+            Conexão pronta para uso. self._pool indica se ela veio do pool.
+        """
+        while True:
+            try:
+                connection = pool.getconn()
+            except PoolError:
+                # Pool esgotado: conexão extra, fechada em close()
+                self._pool = None
+                return psycopg2.connect(**kwargs)
+            
+            if self._ping(connection):
+                self._pool = pool
+                return connection
+            pool.putconn(connection, close=True)
+    
+    @staticmethod
+    def _ping(connection) -> bool:
+        """Verifica com SELECT 1 se o servidor ainda responde na conexão."""
+        if connection.closed:
+            return False
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return True
+        except Exception:
+            return False
+    
+    def read_data(self, query: str, bulk: bool = False) -> pd.DataFrame:
         """
         Executa uma consulta SQL no banco PostgreSQL.
         
         Args:
             query: Consulta SQL a ser executada.
+            bulk: Se True, exporta o resultado com COPY ... TO STDOUT e o lê com
+                o parser C de CSV do pandas, evitando a conversão linha a linha
+                do cursor DB-API. Os tipos das colunas seguem os do resultado,
+                com as limitações descritas em _read_with_copy (numeric vira
+                float64; json, uuid, arrays e similares ficam como texto).
             
         Returns:
             pd.DataFrame: DataFrame com os resultados da consulta.
@@ -91,6 +202,26 @@ class PostgresConnector(DataConnector):
         if not query:
             raise DataReadException("Query SQL é obrigatória para conectores PostgreSQL")
             
+        if bulk:
+            try:
+                return self._read_with_copy(query)
+            except Exception as e:
+                error_msg = f"Erro ao executar COPY no PostgreSQL: {str(e)}"
+                logger.error(error_msg)
+                raise DataReadException(error_msg) from e
+        
+        if cx is not None and self.config.params.get('use_connectorx', False):
+            try:
+                return self._read_with_connectorx(query)
+            except Exception as e:
+                error_text = self._redact(str(e))
+                if not any(marker in error_text.lower() for marker in _CX_UNSUPPORTED_MARKERS):
+                    error_msg = f"Erro ao executar query com ConnectorX: {error_text}"
+                    logger.error(error_msg)
+                    raise DataReadException(error_msg) from None
+                # Tipos que o ConnectorX não suporta: a consulta é lida pelo pandas
+                logger.warning(f"ConnectorX não suporta o resultado, usando pandas: {error_text}")
+        
         try:
             return pd.read_sql_query(query, self.connection)
         except Exception as e:
@@ -98,13 +229,208 @@ class PostgresConnector(DataConnector):
             logger.error(error_msg)
             raise DataReadException(error_msg) from e
     
+    def iter_read_data(self, query: str, chunksize: int = 10000,
+                       prefetch: bool = True) -> Iterator[pd.DataFrame]:
+        """
+        Executa uma consulta SQL e devolve o resultado em blocos.
+        
+        Usa um cursor nomeado, que no PostgreSQL é mantido no servidor: as linhas
+        chegam em lotes de 'chunksize', de modo que a memória fica limitada
+        independentemente do tamanho do resultado.
+        
+        Args:
+            query: Consulta SQL a ser executada.
+            chunksize: Número de linhas por DataFrame.
+            prefetch: Se True, uma thread em segundo plano busca o próximo lote
+                enquanto o chamador processa o atual (no máximo um lote adiantado).
+            
+        Yields:
+            pd.DataFrame: Blocos consecutivos do resultado da consulta.
+        """
+        if not self.is_connected():
+            raise DataConnectionException("Não conectado ao banco de dados. Chame connect() primeiro.")
+            
+        if not query:
+            raise DataReadException("Query SQL é obrigatória para conectores PostgreSQL")
+        
+        cursor = self.connection.cursor(name=f"cur_{uuid4().hex}")
+        batches = None
+        try:
+            cursor.itersize = chunksize
+            cursor.execute(query)
+            batches = self._prefetch_batches(cursor, chunksize) if prefetch else iter(
+                lambda: cursor.fetchmany(chunksize), [])
+            columns = None
+            for rows in batches:
+                if columns is None:
+                    columns = [d.name for d in cursor.description]
+                yield pd.DataFrame(rows, columns=columns)
+        except Exception as e:
+            error_msg = f"Erro ao executar query no PostgreSQL: {str(e)}"
+            logger.error(error_msg)
+            raise DataReadException(error_msg) from e
+        finally:
+            if prefetch and batches is not None:
+                batches.close()
+            cursor.close()
+    
+    @staticmethod
+    def _prefetch_batches(cursor, chunksize: int) -> Iterator[list]:
+        """
+        Lê lotes do cursor em uma thread separada, mantendo um lote adiantado.
+        
+        Exceções da thread produtora são repassadas ao consumidor. Se o consumidor
+        parar antes do fim, a thread é sinalizada e aguardada antes de retornar,
+        para que o cursor possa ser fechado com segurança.
+        """
+        batches: "queue.Queue" = queue.Queue(maxsize=1)
+        stop = threading.Event()
+        done = object()
+        
+        def _put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def _producer() -> None:
+            try:
+                while not stop.is_set():
+                    rows = cursor.fetchmany(chunksize)
+                    if not rows:
+                        break
+                    if not _put(rows):
+                        return
+                _put(done)
+            except Exception as e:
+                _put(e)
+        
+        worker = threading.Thread(target=_producer, daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = batches.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            worker.join()
+    
+    def _redact(self, text: str) -> str:
+        """Remove a URL de conexão e a senha de uma mensagem antes de registrá-la."""
+        password = str(self._conn_kwargs['password'])
+        if self._conn_url:
+            text = text.replace(self._conn_url, 'postgresql://***')
+        if password:
+            text = text.replace(quote(password, safe=''), '***').replace(password, '***')
+        return text
+    
+    def _read_with_connectorx(self, query: str) -> pd.DataFrame:
+        """
+        Executa a consulta com ConnectorX, que lê o resultado em formato colunar
+        (Arrow) sem passar por tuplas Python linha a linha.
+        
+        Só é usado com o parâmetro 'use_connectorx' (padrão: False): o
+        ConnectorX abre conexões próprias, fora do pool compartilhado. Erros
+        são repassados ao chamador, exceto os de tipos não suportados, em que
+        a consulta é repetida pelo pandas.
+        
+        Se o parâmetro 'partition_on' indicar uma coluna numérica, a leitura é
+        dividida em partições lidas em paralelo ('partition_num', padrão: número
+        de CPUs).
+        
+        Args:
+            query: Consulta SQL a ser executada.
+            
+        Returns:
+            pd.DataFrame: DataFrame com os resultados da consulta.
+        """
+        kwargs = {}
+        partition_on = self.config.params.get('partition_on')
+        if partition_on:
+            kwargs['partition_on'] = partition_on
+            kwargs['partition_num'] = self.config.params.get('partition_num') or os.cpu_count() or 1
+        
+        table = cx.read_sql(self._conn_url, query, return_type='arrow', **kwargs)
+        return table.to_pandas()
+    
+    def _read_with_copy(self, query: str) -> pd.DataFrame:
+        """
+        Executa a consulta via COPY (query) TO STDOUT em formato CSV.
+        
+        Os bytes chegam por um único fluxo em memória e são convertidos
+        pelo parser C do pandas. Os tipos das colunas vêm de uma execução da
+        consulta com LIMIT 0, de modo que o CSV não é interpretado por
+        inferência: texto continua texto ('00123' não vira 123), NULL e ''
+        ficam distintos, e datas, timestamps e booleanos são convertidos.
+        
+        Limitações: numeric vira float64 (em vez de Decimal); um texto igual a
+        '\\N', o marcador de NULL usado na exportação, é lido como nulo; os
+        demais tipos (json, uuid, arrays, interval, ...) ficam como texto.
+        
+        Args:
+            query: Consulta SQL a ser executada.
+            
+        Returns:
+            pd.DataFrame: DataFrame com os resultados da consulta.
+        """
+        query = query.strip().rstrip(';')
+        copy_sql = f"COPY ({query}) TO STDOUT WITH (FORMAT CSV, HEADER, NULL '\\N')"
+        buffer = io.BytesIO()
+        
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"SELECT * FROM ({query}) AS _copy_query LIMIT 0")
+            description = cursor.description
+            cursor.copy_expert(copy_sql, buffer)
+        
+        names = [column.name for column in description]
+        type_codes = [column.type_code for column in description]
+        
+        # Colunas lidas por posição, o que também preserva nomes repetidos
+        dtype = {position: _COPY_DTYPES.get(type_code, str) for position, type_code in enumerate(type_codes)}
+        buffer.seek(0)
+        df = pd.read_csv(
+            buffer,
+            header=0,
+            names=range(len(names)),
+            dtype=dtype,
+            keep_default_na=False,
+            na_values=['\\N'],
+        )
+        
+        for position, type_code in enumerate(type_codes):
+            if type_code in _COPY_DATETIME_OIDS:
+                df[position] = pd.to_datetime(df[position], format='ISO8601',
+                                              utc=type_code == _TIMESTAMPTZ_OID)
+            elif type_code == _BOOL_OID:
+                df[position] = df[position].map(_COPY_BOOLS).astype('boolean')
+        
+        df.columns = names
+        return df
+    
     def close(self) -> None:
         """
         Fecha a conexão com o banco de dados.
         """
         if self.connection:
-            self.connection.close()
+            # Devolve a conexão ao pool em vez de fechá-la; conexões abertas com
+            # o pool esgotado são fechadas
+            try:
+                if self._pool is not None:
+                    self._pool.putconn(self.connection)
+                else:
+                    self.connection.close()
+            except Exception as e:
+                logger.warning(f"Erro ao devolver conexão ao pool: {str(e)}")
             self.connection = None
+            self._pool = None
+            self._conn_url = None
             logger.info(f"Conexão PostgreSQL fechada: {self.config.params.get('host')}/{self.config.params.get('database')}")
     
     def is_connected(self) -> bool:
@@ -116,12 +442,6 @@ class PostgresConnector(DataConnector):
         """
         if not self.connection:
             return False
-            
-        try:
-            # Verifica se a conexão está ativa com uma consulta simples
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT 1")
-            cursor.close()
-            return True
-        except Exception:
-            return False
+        
+        # Verifica se a conexão está ativa com uma consulta simples
+        return self._ping(self.connection)
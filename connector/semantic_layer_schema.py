@@ -1,9 +1,30 @@
 import json
+import sys
+from operator import attrgetter
 from typing import List, Dict, Any, Optional
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = datetime.fromisoformat
+
+# Use orjson when available; can be switched off (e.g. in tests) to force
+# the standard library json module
+_FAST_JSON = orjson is not None
+
 class ColumnType(Enum):
     """Supported column data types."""
     STRING = 'string'
@@ -30,6 +51,11 @@ class TransformationType(Enum):
     UPPERCASE = 'to_uppercase'  # Adicione essa linha
     REPLACE = 'replace'
 
+# Direct value -> member lookups; unknown values still go through the Enum
+# constructor so callers get its usual ValueError
+_COL_TYPE_MAP = {member.value: member for member in ColumnType}
+_TX_TYPE_MAP = {member.value: member for member in TransformationType}
+
 @dataclass
 class ColumnSchema:
     """Schema for defining column metadata."""
@@ -43,6 +69,13 @@ class ColumnSchema:
     constraints: Dict[str, Any] = field(default_factory=dict)
     tags: List[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        """Interns the name and tags, which repeat heavily across schemas."""
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
+        if self.tags:
+            self.tags = [sys.intern(tag) if type(tag) is str else tag for tag in self.tags]
+
 @dataclass
 class RelationSchema:
     """Defines relationships between tables/columns."""
@@ -59,6 +92,57 @@ class TransformationRule:
     column: str
     params: Dict[str, Any]
 
+# Serialized field order of each element type, with matching attribute getters
+_COL_KEYS = ('name', 'type', 'description', 'nullable', 'primary_key',
+             'unique', 'default', 'constraints', 'tags')
+_COL_GET = attrgetter(*_COL_KEYS)
+_REL_KEYS = ('source_table', 'source_column', 'target_table', 'target_column',
+             'relationship_type')
+_REL_GET = attrgetter(*_REL_KEYS)
+_TRANS_KEYS = ('type', 'column', 'params')
+_TRANS_GET = attrgetter(*_TRANS_KEYS)
+
+def _column_from_dict(col: Dict[str, Any]) -> ColumnSchema:
+    """Builds a ColumnSchema from its dictionary representation."""
+    # Positional call in field order avoids building a kwargs dict per column
+    get = col.get
+    return ColumnSchema(
+        col['name'],
+        _COL_TYPE_MAP.get(col['type']) or ColumnType(col['type']),
+        get('description'),
+        get('nullable', True),
+        get('primary_key', False),
+        get('unique', False),
+        get('default'),
+        get('constraints', {}),
+        get('tags', [])
+    )
+
+def _relation_from_dict(rel: Dict[str, Any]) -> RelationSchema:
+    """Builds a RelationSchema from its dictionary representation."""
+    return RelationSchema(
+        rel['source_table'],
+        rel['source_column'],
+        rel['target_table'],
+        rel['target_column'],
+        rel.get('relationship_type', 'one_to_many')
+    )
+
+def _transformation_from_dict(trans: Dict[str, Any]) -> TransformationRule:
+    """Builds a TransformationRule from its dictionary representation."""
+    return TransformationRule(
+        _TX_TYPE_MAP.get(trans['type']) or TransformationType(trans['type']),
+        trans['column'],
+        trans['params']
+    )
+
+# Array items streamed by load_from_file_stream, mapped to their builders
+_STREAMED_ITEMS = {
+    'columns.item': ('columns', _column_from_dict),
+    'relations.item': ('relations', _relation_from_dict),
+    'transformations.item': ('transformations', _transformation_from_dict),
+}
+
 @dataclass
 class SemanticSchema:
     """Comprehensive semantic schema for data sources."""
@@ -82,18 +166,15 @@ class SemanticSchema:
         """
         # Check for duplicate column names
         column_names = [col.name for col in self.columns]
-        if len(column_names) != len(set(column_names)):
+        name_set = set(column_names)
+        if len(column_names) != len(name_set):
             return False
         
-        # Validate relations
-        for relation in self.relations:
-            source_cols = [col.name for col in self.columns if col.name == relation.source_column]
-            target_cols = [col.name for col in self.columns if col.name == relation.target_column]
-            
-            if not source_cols or not target_cols:
-                return False
-        
-        return True
+        # Validate relations: both ends must reference a known column
+        return all(
+            relation.source_column in name_set and relation.target_column in name_set
+            for relation in self.relations
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -102,40 +183,21 @@ class SemanticSchema:
         Returns:
             Dict[str, Any]: Dictionary representation of the schema.
         """
+        columns = [dict(zip(_COL_KEYS, _COL_GET(col))) for col in self.columns]
+        for col in columns:
+            col['type'] = col['type'].value
+        transformations = [dict(zip(_TRANS_KEYS, _TRANS_GET(trans))) for trans in self.transformations]
+        for trans in transformations:
+            trans['type'] = trans['type'].value
+        
         return {
             'name': self.name,
             'description': self.description,
             'source_type': self.source_type,
             'source_path': self.source_path,
-            'columns': [
-                {
-                    'name': col.name,
-                    'type': col.type.value,
-                    'description': col.description,
-                    'nullable': col.nullable,
-                    'primary_key': col.primary_key,
-                    'unique': col.unique,
-                    'default': col.default,
-                    'constraints': col.constraints,
-                    'tags': col.tags
-                } for col in self.columns
-            ],
-            'relations': [
-                {
-                    'source_table': rel.source_table,
-                    'source_column': rel.source_column,
-                    'target_table': rel.target_table,
-                    'target_column': rel.target_column,
-                    'relationship_type': rel.relationship_type
-                } for rel in self.relations
-            ],
-            'transformations': [
-                {
-                    'type': trans.type.value,
-                    'column': trans.column,
-                    'params': trans.params
-                } for trans in self.transformations
-            ],
+            'columns': columns,
+            'relations': [dict(zip(_REL_KEYS, _REL_GET(rel))) for rel in self.relations],
+            'transformations': transformations,
             'created_at': self.created_at.isoformat(),
             'version': self.version,
             'tags': self.tags
@@ -152,38 +214,30 @@ class SemanticSchema:
         Returns:
             SemanticSchema: Constructed semantic schema.
         """
-        columns = [
-            ColumnSchema(
-                name=col['name'],
-                type=ColumnType(col['type']),
-                description=col.get('description'),
-                nullable=col.get('nullable', True),
-                primary_key=col.get('primary_key', False),
-                unique=col.get('unique', False),
-                default=col.get('default'),
-                constraints=col.get('constraints', {}),
-                tags=col.get('tags', [])
-            ) for col in data.get('columns', [])
-        ]
-
-        relations = [
-            RelationSchema(
-                source_table=rel['source_table'],
-                source_column=rel['source_column'],
-                target_table=rel['target_table'],
-                target_column=rel['target_column'],
-                relationship_type=rel.get('relationship_type', 'one_to_many')
-            ) for rel in data.get('relations', [])
-        ]
-
-        transformations = [
-            TransformationRule(
-                type=TransformationType(trans['type']),
-                column=trans['column'],
-                params=trans['params']
-            ) for trans in data.get('transformations', [])
-        ]
+        columns = [_column_from_dict(col) for col in data.get('columns', [])]
+        relations = [_relation_from_dict(rel) for rel in data.get('relations', [])]
+        transformations = [_transformation_from_dict(trans) for trans in data.get('transformations', [])]
+        return cls._from_parts(data, columns, relations, transformations)
 
+    @classmethod
+    def _from_parts(cls,
+                    data: Dict[str, Any],
+                    columns: List[ColumnSchema],
+                    relations: List[RelationSchema],
+                    transformations: List[TransformationRule]) -> 'SemanticSchema':
+        """
+        Creates a SemanticSchema from its top-level fields and already built lists.
+        
+        Args:
+            data (Dict[str, Any]): Top-level scalar fields of the schema.
+            columns (List[ColumnSchema]): Column definitions.
+            relations (List[RelationSchema]): Relation definitions.
+            transformations (List[TransformationRule]): Transformation rules.
+        
+        Returns:
+            SemanticSchema: Constructed semantic schema.
+        """
+        created_at = data.get('created_at')
         return cls(
             name=data['name'],
             description=data.get('description'),
@@ -192,7 +246,7 @@ class SemanticSchema:
             columns=columns,
             relations=relations,
             transformations=transformations,
-            created_at=datetime.fromisoformat(data.get('created_at', datetime.now().isoformat())),
+            created_at=_parse_datetime(created_at) if created_at else datetime.now(),
             version=data.get('version', '1.0.0'),
             tags=data.get('tags', [])
         )
@@ -204,6 +258,19 @@ class SemanticSchema:
         Args:
             filepath (str): Path to save the JSON file.
         """
+        if _FAST_JSON:
+            # orjson serializes the dataclasses, enums and datetime directly,
+            # in field order, so no intermediate to_dict() is built
+            try:
+                encoded = orjson.dumps(self, option=orjson.OPT_INDENT_2)
+            except TypeError:
+                # Non-string keys or unknown types fall back to json below
+                encoded = None
+            if encoded is not None:
+                with open(filepath, 'wb') as f:
+                    f.write(encoded)
+                return
+        
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(self.to_dict(), f, indent=2)
 
@@ -218,6 +285,54 @@ class SemanticSchema:
         Returns:
             SemanticSchema: Loaded semantic schema.
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return cls.from_dict(data)
\ No newline at end of file
+        if _FAST_JSON:
+            with open(filepath, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        return cls.from_dict(data)
+
+    @classmethod
+    def load_from_file_stream(cls, filepath: str) -> 'SemanticSchema':
+        """
+        Loads a semantic schema from a JSON file in a single streaming pass.
+        
+        The file is tokenized incrementally with ijson (using its C backend
+        when compiled) and each column, relation and transformation is built
+        as soon as its object is complete, so peak memory stays around one
+        element instead of the whole document. Falls back to load_from_file
+        when ijson is not installed.
+        
+        Args:
+            filepath (str): Path to the JSON file.
+        
+        Returns:
+            SemanticSchema: Loaded semantic schema.
+        """
+        if ijson is None:
+            return cls.load_from_file(filepath)
+
+        data: Dict[str, Any] = {}
+        lists: Dict[str, List[Any]] = {'columns': [], 'relations': [], 'transformations': []}
+        builder = None
+        builder_prefix = None
+
+        with open(filepath, 'rb') as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == builder_prefix and event == 'end_map':
+                        section, factory = _STREAMED_ITEMS[prefix]
+                        lists[section].append(factory(builder.value))
+                        builder = None
+                elif event == 'start_map' and prefix in _STREAMED_ITEMS:
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    builder_prefix = prefix
+                elif prefix == 'tags.item':
+                    data.setdefault('tags', []).append(value)
+                elif prefix and '.' not in prefix and event in ('string', 'number', 'boolean', 'null'):
+                    data[prefix] = value
+
+        return cls._from_parts(data, lists['columns'], lists['relations'], lists['transformations'])
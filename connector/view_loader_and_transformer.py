@@ -1,15 +1,129 @@
 import logging
-from typing import Dict
+import queue
+from itertools import chain
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 import duckdb
 
+# Optional Arrow support, resolved once at module load
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
 from connector.semantic_layer_schema import (
     SemanticSchema, 
     TransformationType, 
     TransformationRule
 )
 
+# Idle in-memory DuckDB connections, reused by later ViewLoader instances
+_POOL_SIZE = 8
+_POOL: "queue.LifoQueue[duckdb.DuckDBPyConnection]" = queue.LifoQueue(maxsize=_POOL_SIZE)
+
+def _acquire_connection() -> "duckdb.DuckDBPyConnection":
+    """Take an idle connection from the pool, or open a new one."""
+    try:
+        return _POOL.get_nowait()
+    except queue.Empty:
+        return duckdb.connect(':memory:')
+
+def _release_connection(conn: "duckdb.DuckDBPyConnection", names: Sequence[str]) -> None:
+    """Unregister the given sources and return the connection to the pool."""
+    try:
+        for name in names:
+            conn.unregister(name)
+        _POOL.put_nowait(conn)
+    except (duckdb.Error, queue.Full):
+        conn.close()
+
+def _quote_ident(name: str) -> str:
+    """Quote an identifier for DuckDB SQL, escaping embedded quotes."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+def _dedupe_names(names: Sequence[str]) -> List[str]:
+    """
+    Make column names unique the way DuckDB's DataFrame conversion does:
+    a repeated name (compared case-insensitively) gets the next free _1, _2...
+    suffix, so Arrow results carry the same names as their pandas form.
+    """
+    seen = set()
+    counters: Dict[str, int] = {}
+    unique = []
+    for name in names:
+        key = name.lower()
+        if key in seen:
+            suffix = counters.get(key, 0)
+            while True:
+                suffix += 1
+                candidate = f"{name}_{suffix}"
+                if candidate.lower() not in seen:
+                    break
+            counters[key] = suffix
+            name, key = candidate, candidate.lower()
+        seen.add(key)
+        unique.append(name)
+    return unique
+
+# Resolution of datetimes pandas parses from strings with an explicit format
+# ('ns' before pandas 3, 'us' from it); the SQL and Arrow paths produce the same
+_DATETIME_UNIT = np.datetime_data(
+    pd.to_datetime(pd.Series(['2000-01-01']), format='%Y-%m-%d').dtype
+)[0]
+_SQL_TIMESTAMP_TYPES = {'s': 'TIMESTAMP_S', 'ms': 'TIMESTAMP_MS', 'us': 'TIMESTAMP', 'ns': 'TIMESTAMP_NS'}
+
+def _value_kind(value: Any) -> str:
+    """Classify a rule parameter the same way as _column_kind classifies columns."""
+    if isinstance(value, bool):
+        return 'other'
+    if isinstance(value, int):
+        return 'int'
+    if isinstance(value, float):
+        return 'float'
+    if isinstance(value, str):
+        return 'string'
+    return 'other'
+
+def _matches_kind(value: Any, kind: str, exact: bool = False) -> bool:
+    """
+    Check that a rule parameter compares with a column of the given kind the
+    way pandas compares it, without DuckDB's implicit casts. Numbers match
+    numeric columns (only integers when exact and the column is 'int');
+    strings match text columns.
+    """
+    value_kind = _value_kind(value)
+    if kind == 'string':
+        return value_kind == 'string'
+    if kind == 'int' and exact:
+        return value_kind == 'int'
+    if kind in ('int', 'float'):
+        return value_kind in ('int', 'float')
+    return False
+
+def _column_kind(dtype: Any) -> str:
+    """Classify a pandas dtype or pyarrow type as 'int', 'float', 'string' or 'other'."""
+    if pa is not None and isinstance(dtype, pa.DataType):
+        if pa.types.is_integer(dtype):
+            return 'int'
+        if pa.types.is_floating(dtype):
+            return 'float'
+        if pa.types.is_string(dtype) or pa.types.is_large_string(dtype):
+            return 'string'
+        return 'other'
+    if pd.api.types.is_bool_dtype(dtype):
+        return 'other'
+    if pd.api.types.is_integer_dtype(dtype):
+        return 'int'
+    if pd.api.types.is_float_dtype(dtype):
+        return 'float'
+    if pd.api.types.is_string_dtype(dtype):
+        return 'string'
+    return 'other'
+
 class ViewLoader:
     """
     Advanced view loader with semantic layer support and transformations.
@@ -23,35 +137,249 @@ class ViewLoader:
             schema (SemanticSchema): Semantic schema defining the view.
         """
         self.schema = schema
+        # Tables the relations refer to; the schema does not change afterwards
+        self._required_tables = frozenset(chain.from_iterable(
+            (rel.source_table, rel.target_table) for rel in schema.relations
+        ))
         self.logger = logging.getLogger(f"ViewLoader[{schema.name}]")
-        self.duckdb_conn = duckdb.connect(':memory:')
-        self._registered_sources: Dict[str, pd.DataFrame] = {}
+        self.duckdb_conn = _acquire_connection()
+        self._registered_sources: Dict[str, Any] = {}
+        # Arrow form of each source, when it has one
+        self._arrow_sources: Dict[str, Any] = {}
+        # MAP_VALUES lookup Series, built once per rule
+        self._map_lookups: Dict[int, pd.Series] = {}
+        # View query, its SQL-transformed form, the hoisted DROP_NA columns and
+        # the remaining rules; rebuilt when sources change
+        self._compiled_query: Optional[Tuple[str, Optional[Tuple[str, List[Any], List[str]]],
+                                             List[str], List[TransformationRule]]] = None
         
-    def register_source(self, name: str, dataframe: pd.DataFrame) -> None:
+    def register_source(self, name: str, dataframe: Any) -> None:
         """
         Register a source DataFrame for view construction.
         
         Args:
             name (str): Name of the source.
-            dataframe (pd.DataFrame): Source DataFrame.
+            dataframe: Source data, either a pandas DataFrame or a pyarrow
+                Table. Arrow tables are scanned by DuckDB without a pandas copy;
+                DataFrames are converted to Arrow once here so that every later
+                scan reads contiguous column buffers.
         """
-        self.duckdb_conn.register(name, dataframe)
+        source = dataframe
+        if isinstance(dataframe, pd.DataFrame) and pa is not None:
+            try:
+                source = pa.Table.from_pandas(dataframe, preserve_index=False)
+            except (ValueError, TypeError) as e:
+                # Mixed-type object columns cannot be represented in Arrow
+                self.logger.warning(f"Registering {name} as a DataFrame, Arrow conversion failed: {e}")
+        
+        self.duckdb_conn.register(name, source)
         self._registered_sources[name] = dataframe
+        if pa is not None and isinstance(source, pa.Table):
+            self._arrow_sources[name] = source
+        else:
+            self._arrow_sources.pop(name, None)
+        self._compiled_query = None
         self.logger.info(f"Registered source: {name}")
     
     def apply_transformations(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply transformations defined in the semantic schema.
         
+        Rules work on a dict of column Series and the DataFrame is rebuilt
+        once at the end, instead of writing every result back to the frame.
+        
+        Args:
+            df (pd.DataFrame): Input DataFrame.
+        
+        Returns:
+            pd.DataFrame: Transformed DataFrame.
+        """
+        return self._apply_rules(df, self.schema.transformations)
+    
+    def _apply_rules(self, df: pd.DataFrame, transformations: List[TransformationRule]) -> pd.DataFrame:
+        """
+        Apply the given transformation rules, in order, with pandas.
+        
+        Rules read and write a dict of column Series; RENAME only relabels a
+        dict entry. Consecutive DROP_NA rules are combined into one row mask,
+        applied right before the next rule that reads values (or at the end),
+        so every rule still sees the same rows it would on the frame. Frames
+        with duplicate column names, or renames onto an existing name, finish
+        on the DataFrame itself.
+        
         Args:
             df (pd.DataFrame): Input DataFrame.
+            transformations (List[TransformationRule]): Rules to apply.
         
         Returns:
             pd.DataFrame: Transformed DataFrame.
         """
-        for transformation in self.schema.transformations:
-            df = self._apply_single_transformation(df, transformation)
-        return df
+        if not transformations:
+            return df
+        if not df.columns.is_unique:
+            for transformation in transformations:
+                df = self._apply_single_transformation(df, transformation)
+            return df
+        
+        cols: Dict[Any, pd.Series] = {name: df[name] for name in df.columns}
+        changed: set = set()
+        keep: Optional[np.ndarray] = None
+        
+        for position, transformation in enumerate(transformations):
+            column = transformation.column
+            
+            if transformation.type == TransformationType.DROP_NA:
+                try:
+                    present = cols[column].notna().to_numpy(dtype=bool)
+                except KeyError as e:
+                    self.logger.error(f"Error applying transformation {transformation.type}: {e}")
+                    continue
+                keep = present if keep is None else keep & present
+                continue
+            
+            if transformation.type == TransformationType.RENAME:
+                new_name = transformation.params.get('new_name')
+                if column not in cols or new_name == column:
+                    continue
+                if new_name in cols:
+                    df = self._columns_to_frame(df, cols, changed, keep)
+                    for remaining in transformations[position:]:
+                        df = self._apply_single_transformation(df, remaining)
+                    return df
+                cols = {new_name if name == column else name: series for name, series in cols.items()}
+                if column in changed:
+                    changed.discard(column)
+                    changed.add(new_name)
+                continue
+            
+            if keep is not None:
+                df = self._columns_to_frame(df, cols, changed, keep)
+                cols = {name: df[name] for name in df.columns}
+                changed = set()
+                keep = None
+            try:
+                cols[column] = self._transform_series(cols[column], transformation)
+                changed.add(column)
+            except Exception as e:
+                self.logger.error(f"Error applying transformation {transformation.type}: {e}")
+        
+        return self._columns_to_frame(df, cols, changed, keep)
+    
+    @staticmethod
+    def _columns_to_frame(df: pd.DataFrame,
+                          cols: Dict[Any, pd.Series],
+                          changed: set,
+                          keep: Optional[np.ndarray]) -> pd.DataFrame:
+        """
+        Rebuild a DataFrame from a column dict, applying a pending row mask.
+        
+        Unchanged columns stay in the blocks of the frame they came from, so
+        the mask filters each dtype block at once instead of column by column.
+        
+        Args:
+            df (pd.DataFrame): Frame the columns were taken from.
+            cols (Dict[Any, pd.Series]): Current columns, in frame order.
+            changed (set): Names of the columns replaced since then.
+            keep (Optional[np.ndarray]): Boolean mask of rows to keep, if any.
+        
+        Returns:
+            pd.DataFrame: The assembled DataFrame.
+        """
+        names = list(cols)
+        if names != list(df.columns):
+            df = df.set_axis(names, axis=1)
+        if changed:
+            df = df.copy(deep=False)
+            for name in changed:
+                df[name] = cols[name]
+        if keep is None or keep.all():
+            return df
+        return df[keep]
+    
+    @staticmethod
+    def _to_datetime(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
+        """
+        Convert a column to datetime, using bulk paths where the input allows.
+        
+        Integer columns are read as epoch values in one vectorized call, with
+        the 'unit' parameter ('ns' by default). Strings without an explicit
+        format are parsed as ISO 8601 first; if that leaves values unparsed,
+        pandas' usual format inference is used instead.
+        
+        Args:
+            series (pd.Series): Column to convert.
+            params (Dict[str, Any]): Transformation parameters.
+        
+        Returns:
+            pd.Series: Converted column.
+        """
+        fmt = params.get('format')
+        if fmt is None:
+            if series.dtype.kind in 'iu':
+                return pd.to_datetime(series, errors='coerce', unit=params.get('unit', 'ns'))
+            if series.dtype == object or pd.api.types.is_string_dtype(series.dtype):
+                parsed = pd.to_datetime(series, errors='coerce', format='ISO8601')
+                if parsed.isna().sum() == series.isna().sum():
+                    return parsed
+        return pd.to_datetime(series, errors='coerce', format=fmt)
+    
+    @staticmethod
+    def _is_scalar_replace(series: pd.Series, old_value: Any, new_value: Any) -> bool:
+        """
+        Check whether a REPLACE rule can be applied as a plain equality mask.
+        
+        Only number-for-number replacements on numeric columns and
+        string-for-string replacements on text columns qualify; lists, dicts,
+        missing values, booleans and mixed types keep going through
+        Series.replace, whose matching rules differ from simple equality.
+        
+        Args:
+            series (pd.Series): Column the rule applies to.
+            old_value (Any): Value to replace.
+            new_value (Any): Replacement value.
+        
+        Returns:
+            bool: True if the masked path gives the same result as replace.
+        """
+        number = (int, float)
+        if isinstance(old_value, number) and isinstance(new_value, number):
+            if isinstance(old_value, bool) or isinstance(new_value, bool):
+                return False
+            if old_value != old_value or new_value != new_value:
+                return False
+            return series.dtype.kind in 'iuf'
+        if isinstance(old_value, str) and isinstance(new_value, str):
+            return pd.api.types.is_string_dtype(series.dtype) \
+                and not isinstance(series.dtype, pd.CategoricalDtype)
+        return False
+    
+    def _map_lookup(self, transformation: TransformationRule) -> pd.Series:
+        """
+        Return the lookup Series for a MAP_VALUES rule, building it on first use.
+        
+        Series.map resolves a Series mapper with one vectorized index lookup
+        (get_indexer + take); passing a dict makes pandas rebuild that Series
+        on every call. Construction mirrors what pandas does for a dict.
+        
+        Args:
+            transformation (TransformationRule): MAP_VALUES rule.
+        
+        Returns:
+            pd.Series: Mapped values indexed by source value.
+        """
+        lookup = self._map_lookups.get(id(transformation))
+        if lookup is None:
+            mapping = transformation.params.get('mapping', {})
+            if not mapping:
+                # Mapping with an empty dict yields all-NaN float64
+                lookup = pd.Series(mapping, dtype='float64')
+            else:
+                lookup = pd.Series(
+                    list(mapping.values()),
+                    index=pd.Index(list(mapping.keys()), tupleize_cols=False)
+                )
+            self._map_lookups[id(transformation)] = lookup
+        return lookup
     
     def _apply_single_transformation(self, 
                                     df: pd.DataFrame, 
@@ -70,50 +398,11 @@ class ViewLoader:
             if transformation.type == TransformationType.RENAME:
                 df = df.rename(columns={transformation.column: transformation.params.get('new_name')})
             
-            elif transformation.type == TransformationType.FILLNA:
-                df[transformation.column] = df[transformation.column].fillna(
-                    transformation.params.get('value')
-                )
-            
             elif transformation.type == TransformationType.DROP_NA:
                 df = df.dropna(subset=[transformation.column])
             
-            elif transformation.type == TransformationType.CONVERT_TYPE:
-                target_type = transformation.params.get('type')
-                if target_type == 'int':
-                    df[transformation.column] = pd.to_numeric(
-                        df[transformation.column], errors='coerce'
-                    ).astype('Int64')
-                elif target_type == 'float':
-                    df[transformation.column] = pd.to_numeric(
-                        df[transformation.column], errors='coerce'
-                    )
-                elif target_type == 'datetime':
-                    df[transformation.column] = pd.to_datetime(
-                        df[transformation.column], 
-                        errors='coerce', 
-                        format=transformation.params.get('format')
-                    )
-            
-            elif transformation.type == TransformationType.MAP_VALUES:
-                df[transformation.column] = df[transformation.column].map(
-                    transformation.params.get('mapping', {})
-                )
-            
-            elif transformation.type == TransformationType.CLIP:
-                df[transformation.column] = df[transformation.column].clip(
-                    lower=transformation.params.get('min'),
-                    upper=transformation.params.get('max')
-                )
-            
-            elif transformation.type == TransformationType.REPLACE:
-                df[transformation.column] = df[transformation.column].replace(
-                    transformation.params.get('old_value'),
-                    transformation.params.get('new_value')
-                )
-            
             else:
-                self.logger.warning(f"Unsupported transformation: {transformation.type}")
+                df[transformation.column] = self._transform_series(df[transformation.column], transformation)
             
             return df
         
@@ -121,72 +410,761 @@ class ViewLoader:
             self.logger.error(f"Error applying transformation {transformation.type}: {e}")
             return df
     
-    def construct_view(self) -> pd.DataFrame:
+    def _transform_series(self, series: pd.Series, transformation: TransformationRule) -> pd.Series:
+        """
+        Apply a column-level transformation rule to one column.
+        
+        Args:
+            series (pd.Series): Column to transform.
+            transformation (TransformationRule): Transformation to apply.
+        
+        Returns:
+            pd.Series: Transformed column.
+        """
+        if transformation.type == TransformationType.FILLNA:
+            return series.fillna(transformation.params.get('value'))
+        
+        elif transformation.type == TransformationType.CONVERT_TYPE:
+            target_type = transformation.params.get('type')
+            if target_type == 'int':
+                return pd.to_numeric(series, errors='coerce').astype('Int64')
+            elif target_type == 'float':
+                return pd.to_numeric(series, errors='coerce')
+            elif target_type == 'datetime':
+                return self._to_datetime(series, transformation.params)
+            return series
+        
+        elif transformation.type == TransformationType.MAP_VALUES:
+            return series.map(self._map_lookup(transformation))
+        
+        elif transformation.type == TransformationType.CLIP:
+            return series.clip(
+                lower=transformation.params.get('min'),
+                upper=transformation.params.get('max')
+            )
+        
+        elif transformation.type == TransformationType.REPLACE:
+            old_value = transformation.params.get('old_value')
+            new_value = transformation.params.get('new_value')
+            if self._is_scalar_replace(series, old_value, new_value):
+                # One comparison and one select instead of the generic replace machinery
+                matches = series.eq(old_value)
+                if matches.dtype != bool:
+                    matches = matches.fillna(False).astype(bool)
+                return series.mask(matches, new_value)
+            return series.replace(old_value, new_value)
+        
+        self.logger.warning(f"Unsupported transformation: {transformation.type}")
+        return series
+    
+    def construct_view(self, limit: Optional[int] = None) -> pd.DataFrame:
         """
         Construct the view by joining registered sources and applying transformations.
         
+        Args:
+            limit (Optional[int]): Maximum number of rows to return. Pushed into
+                the SQL query unless a row-filtering transformation has to see
+                every row first.
+        
         Returns:
             pd.DataFrame: Constructed view DataFrame.
         """
+        return self._construct(limit, as_arrow=False)
+    
+    def construct_view_arrow(self, limit: Optional[int] = None) -> Any:
+        """
+        Construct the view as a pyarrow Table.
+        
+        When the transformations run in SQL, DuckDB's result is handed over as
+        Arrow record batches and never passes through pandas.
+        
+        Args:
+            limit (Optional[int]): Maximum number of rows to return.
+        
+        Returns:
+            pyarrow.Table: Constructed view table.
+        """
+        return self._construct(limit, as_arrow=True)
+    
+    def _construct(self, limit: Optional[int], as_arrow: bool) -> Any:
+        """
+        Build the view as a DataFrame or, if as_arrow is set, a pyarrow Table.
+        
+        Args:
+            limit (Optional[int]): Maximum number of rows to return.
+            as_arrow (bool): Return a pyarrow Table instead of a DataFrame.
+        
+        Returns:
+            Constructed view.
+        """
         # Validate sources are registered
         if not self._registered_sources:
             raise ValueError("No sources registered for view construction")
         
-        # Construct the view query
-        view_query = self._build_view_query()
+        # Construct the view query once per set of registered sources
+        if self._compiled_query is None:
+            not_null_columns, remaining = self._split_drop_na()
+            view_query = self._build_view_query(not_null_columns)
+            self._compiled_query = (
+                view_query,
+                self._build_transformation_query(view_query, remaining),
+                not_null_columns,
+                remaining
+            )
+        view_query, compiled, not_null_columns, remaining = self._compiled_query
         
         try:
-            # Execute the view query in DuckDB
-            result_df = self.duckdb_conn.execute(view_query).df()
+            # A single source without relations needs no query at all
+            result = self._construct_single_source(limit, as_arrow, not_null_columns, remaining)
+            if result is not None:
+                self.logger.info(f"View {self.schema.name} constructed successfully")
+                return result
             
-            # Apply semantic schema transformations
-            result_df = self.apply_transformations(result_df)
+            # Evaluate the join and all transformations in one DuckDB query
+            # when every rule can be expressed in SQL
+            result = None
+            if compiled is not None:
+                sql, params, int_columns = compiled
+                if limit is not None:
+                    sql = f"{sql} LIMIT {int(limit)}"
+                try:
+                    cursor = self.duckdb_conn.execute(sql, params)
+                    result = cursor.fetch_record_batch().read_all() if as_arrow else cursor.df()
+                except duckdb.Error as e:
+                    self.logger.warning(f"SQL transformations failed, falling back to pandas: {e}")
+                else:
+                    if not as_arrow:
+                        # Match the nullable integer dtype of the pandas path
+                        for column in int_columns:
+                            result[column] = result[column].astype('Int64')
+            
+            if result is None:
+                try:
+                    result = self._construct_view_pandas(view_query, limit, remaining)
+                except duckdb.Error as e:
+                    if remaining is self.schema.transformations:
+                        raise
+                    # A pushed-down filter the query cannot bind (e.g. a missing
+                    # column) is left to the per-rule error handling instead
+                    self.logger.warning(f"Filtered view query failed, retrying without filters: {e}")
+                    result = self._construct_view_pandas(
+                        self._build_view_query(), limit, self.schema.transformations
+                    )
+                if as_arrow:
+                    result = self._frame_to_arrow(result)
+            
+            if as_arrow:
+                # Joins can select the same column name from several sources
+                names = _dedupe_names(result.column_names)
+                if names != result.column_names:
+                    result = result.rename_columns(names)
             
             self.logger.info(f"View {self.schema.name} constructed successfully")
-            return result_df
+            return result
         
         except Exception as e:
             self.logger.error(f"Error constructing view: {e}")
             raise
     
-    def _build_view_query(self) -> str:
+    def _construct_single_source(self,
+                                 limit: Optional[int],
+                                 as_arrow: bool,
+                                 not_null_columns: Sequence[str],
+                                 transformations: List[TransformationRule]) -> Any:
+        """
+        Build the view straight from the only registered source, if possible.
+        
+        With one source and no relations the view query is a plain
+        SELECT * FROM, so the round trip through DuckDB only copies the data.
+        An Arrow result is built from the Arrow form of the source with
+        pyarrow.compute kernels when every rule has one; otherwise a DataFrame
+        source is filtered and transformed directly with pandas, in the same
+        order as the query would. The DataFrame shortcut is only taken when
+        every source dtype comes back unchanged from DuckDB (see
+        _duckdb_stable), so the result matches the query's; the rules follow
+        apply_transformations.
+        
+        Args:
+            limit (Optional[int]): Maximum number of rows to return.
+            as_arrow (bool): Return a pyarrow Table instead of a DataFrame.
+            not_null_columns (Sequence[str]): Columns the view query filters on.
+            transformations (List[TransformationRule]): Rules left after those
+                filters.
+        
+        Returns:
+            The constructed view, or None if the query has to run.
+        """
+        if self.schema.relations or len(self._registered_sources) != 1:
+            return None
+        name, source = next(iter(self._registered_sources.items()))
+        is_frame = isinstance(source, pd.DataFrame)
+        # DuckDB renames duplicate and non-string columns; keep those on the query
+        if is_frame and (not source.columns.is_unique
+                         or not all(isinstance(c, str) for c in source.columns)):
+            return None
+        
+        table = self._arrow_sources.get(name)
+        if as_arrow and table is not None:
+            result = self._transform_table(table, limit, not_null_columns, transformations)
+            if result is not None:
+                return result
+        
+        # Only dtypes DuckDB hands back unchanged; object, categorical and
+        # other columns are normalized by the query
+        if not is_frame or table is None or not self._duckdb_stable(source):
+            return None
+        if not_null_columns:
+            source = source.dropna(subset=list(not_null_columns))
+        # The source itself is never modified; rows are renumbered like a query result
+        result = self._transform_frame(source, limit, transformations).reset_index(drop=True)
+        if as_arrow:
+            result = self._frame_to_arrow(result)
+        return result
+    
+    @staticmethod
+    def _frame_to_arrow(df: pd.DataFrame) -> Any:
+        """
+        Convert a view DataFrame to a pyarrow Table.
+        
+        Object columns that Arrow cannot type (e.g. integers mixed with text
+        after a REPLACE) are converted to strings, keeping missing values null.
+        """
+        try:
+            return pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+        df = df.copy()
+        for column in df.columns[(df.dtypes == object).to_numpy()]:
+            try:
+                pa.array(df[column], from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                df[column] = df[column].astype('string')
+        return pa.Table.from_pandas(df, preserve_index=False)
+    
+    @staticmethod
+    def _duckdb_stable(df: pd.DataFrame) -> bool:
+        """
+        Check that every column has a dtype a DuckDB round trip keeps as is:
+        numpy booleans, integers, floats and timezone-naive datetimes, and
+        pandas strings.
+        """
+        return all(
+            (isinstance(dtype, np.dtype) and dtype.kind in 'biufM')
+            or isinstance(dtype, pd.StringDtype)
+            for dtype in df.dtypes
+        )
+    
+    def _transform_table(self,
+                         table: Any,
+                         limit: Optional[int],
+                         not_null_columns: Sequence[str],
+                         transformations: List[TransformationRule]) -> Any:
+        """
+        Filter and transform a pyarrow Table with pyarrow.compute kernels.
+        
+        The kernels run without holding the GIL, so several views can be built
+        concurrently from a thread pool.
+        
+        Args:
+            table (pyarrow.Table): Source table.
+            limit (Optional[int]): Maximum number of rows to return.
+            not_null_columns (Sequence[str]): Columns that must not be null.
+            transformations (List[TransformationRule]): Rules to apply.
+        
+        Returns:
+            Optional[pyarrow.Table]: Transformed table, or None if a rule has
+            no Arrow equivalent matching the pandas result.
+        """
+        try:
+            for column in not_null_columns:
+                table = table.filter(self._arrow_valid(table.column(column)))
+            if limit is not None and not self._filters_rows(transformations):
+                table = table.slice(0, int(limit))
+            for transformation in transformations:
+                table = self._apply_transformation_arrow(table, transformation)
+                if table is None:
+                    return None
+            if transformations:
+                # The pandas metadata describes the source columns, not these
+                table = table.replace_schema_metadata(None)
+        except (KeyError, pa.ArrowException) as e:
+            # Leave the error reporting to the pandas path
+            self.logger.debug(f"Arrow transformations not applicable: {e}")
+            return None
+        if limit is not None:
+            table = table.slice(0, int(limit))
+        return table
+    
+    @staticmethod
+    def _arrow_valid(column: Any) -> Any:
+        """Mask of the values pandas would not consider missing (nulls and NaN)."""
+        if pa.types.is_floating(column.type):
+            return pc.invert(pc.is_nan(column))
+        return pc.is_valid(column)
+    
+    def _apply_transformation_arrow(self, table: Any, transformation: TransformationRule) -> Any:
+        """
+        Apply one transformation rule to a pyarrow Table.
+        
+        Only rules whose Arrow kernel gives the same values as the pandas
+        path are handled: FILLNA on float and string columns, CLIP on numeric
+        columns, CONVERT_TYPE to int or float on numeric columns and to
+        datetime with an explicit format on string columns, DROP_NA and
+        RENAME.
+        
+        Args:
+            table (pyarrow.Table): Input table.
+            transformation (TransformationRule): Transformation to apply.
+        
+        Returns:
+            Optional[pyarrow.Table]: Transformed table, or None if the rule has
+            to run in pandas.
+        """
+        column = transformation.column
+        params = transformation.params
+        rule_type = transformation.type
+        
+        if rule_type == TransformationType.RENAME:
+            names = table.column_names
+            new_name = params.get('new_name')
+            if column not in names or new_name == column:
+                return table
+            if new_name in names:
+                return None
+            return table.rename_columns([new_name if name == column else name for name in names])
+        
+        index = table.schema.get_field_index(column)
+        if index < 0:
+            return None
+        values = table.column(index)
+        value_type = values.type
+        number = (int, float)
+        
+        if rule_type == TransformationType.DROP_NA:
+            return table.filter(self._arrow_valid(values))
+        
+        if rule_type == TransformationType.FILLNA:
+            value = params.get('value')
+            if pa.types.is_floating(value_type) and isinstance(value, number) \
+                    and not isinstance(value, bool):
+                # NaN counts as missing in pandas, so fill it as well
+                values = pc.if_else(pc.is_nan(values), None, values)
+            elif not (pa.types.is_string(value_type) or pa.types.is_large_string(value_type)) \
+                    or not isinstance(value, str):
+                return None
+            result = pc.fill_null(values, pa.scalar(value, value_type))
+        
+        elif rule_type == TransformationType.CLIP:
+            bounds = [params.get('min'), params.get('max')]
+            if any(isinstance(b, bool) or (b is not None and not isinstance(b, number)) for b in bounds):
+                return None
+            if pa.types.is_integer(value_type):
+                if any(isinstance(b, float) for b in bounds):
+                    return None
+            elif not pa.types.is_floating(value_type):
+                return None
+            result = values
+            lower, upper = bounds
+            if lower is not None:
+                result = pc.max_element_wise(result, pa.scalar(lower, value_type), skip_nulls=False)
+            if upper is not None:
+                result = pc.min_element_wise(result, pa.scalar(upper, value_type), skip_nulls=False)
+        
+        elif rule_type == TransformationType.CONVERT_TYPE:
+            target_type = params.get('type')
+            numeric = pa.types.is_integer(value_type) or pa.types.is_floating(value_type)
+            if target_type == 'float' and numeric:
+                # pd.to_numeric leaves numeric columns untouched
+                return table
+            if target_type == 'int' and numeric:
+                # A safe cast fails on fractional values, like astype('Int64')
+                result = pc.cast(values, pa.int64())
+            elif target_type == 'datetime' and params.get('format') \
+                    and (pa.types.is_string(value_type) or pa.types.is_large_string(value_type)):
+                result = pc.strptime(values, format=params['format'], unit=_DATETIME_UNIT, error_is_null=True)
+            else:
+                return None
+        
+        else:
+            return None
+        
+        return table.set_column(index, column, result)
+    
+    def _construct_view_pandas(self,
+                               view_query: str,
+                               limit: Optional[int],
+                               transformations: List[TransformationRule]) -> pd.DataFrame:
+        """
+        Run the view query and apply the transformations with pandas.
+        
+        Args:
+            view_query (str): Query joining the registered sources.
+            limit (Optional[int]): Maximum number of rows to return.
+            transformations (List[TransformationRule]): Rules not already
+                applied by the view query.
+        
+        Returns:
+            pd.DataFrame: Constructed view DataFrame.
+        """
+        if limit is not None and not self._filters_rows(transformations):
+            view_query = f"{view_query} LIMIT {int(limit)}"
+        
+        result_df = self.duckdb_conn.execute(view_query).df()
+        return self._transform_frame(result_df, limit, transformations)
+    
+    @staticmethod
+    def _filters_rows(transformations: List[TransformationRule]) -> bool:
+        """Check whether any rule removes rows, which rules out an early limit."""
+        return any(t.type == TransformationType.DROP_NA for t in transformations)
+    
+    def _transform_frame(self,
+                         df: pd.DataFrame,
+                         limit: Optional[int],
+                         transformations: List[TransformationRule]) -> pd.DataFrame:
+        """
+        Apply the transformations to a frame and cut it to the limit.
+        
+        Args:
+            df (pd.DataFrame): Frame to transform.
+            limit (Optional[int]): Maximum number of rows to return.
+            transformations (List[TransformationRule]): Rules to apply.
+        
+        Returns:
+            pd.DataFrame: Transformed DataFrame.
+        """
+        # DROP_NA removes rows, so the limit can only be applied first when
+        # no such rule exists
+        if limit is None:
+            return self._apply_rules(df, transformations)
+        if not self._filters_rows(transformations):
+            return self._apply_rules(df.head(limit), transformations)
+        return self._apply_rules(df, transformations).head(limit)
+    
+    def _source_columns(self) -> Optional[set]:
+        """
+        Return the column names the view query can reference unambiguously.
+        
+        Names present in more than one source, or equal to another name up to
+        case (DuckDB identifiers are case-insensitive), are left out.
+        
+        Returns:
+            Optional[set]: Column names, or None if a source's columns are unknown.
+        """
+        names: List[str] = []
+        for source in self._registered_sources.values():
+            source_names = source.columns if isinstance(source, pd.DataFrame) else getattr(source, 'column_names', None)
+            if source_names is None:
+                return None
+            names.extend(str(name) for name in source_names)
+        
+        counts: Dict[str, int] = {}
+        for name in names:
+            counts[name.lower()] = counts.get(name.lower(), 0) + 1
+        return {name for name in names if counts[name.lower()] == 1}
+    
+    def _source_column_kinds(self) -> Optional[Dict[str, str]]:
+        """
+        Return the kind of each column the view query can reference unambiguously.
+        
+        Kinds are 'int', 'float', 'string' or 'other' and follow the types
+        DuckDB scans: the Arrow schema of a source when it has one, otherwise
+        the DataFrame dtypes.
+        
+        Returns:
+            Optional[Dict[str, str]]: Column name -> kind, or None if a source's
+            columns are unknown.
+        """
+        columns = self._source_columns()
+        if columns is None:
+            return None
+        
+        kinds: Dict[str, str] = {}
+        for name, source in self._registered_sources.items():
+            table = self._arrow_sources.get(name)
+            if table is not None:
+                items = zip(table.column_names, table.schema.types)
+            elif isinstance(source, pd.DataFrame):
+                items = source.dtypes.items()
+            else:
+                items = ((column, None) for column in source.column_names)
+            for column, dtype in items:
+                column = str(column)
+                if column in columns:
+                    kinds[column] = 'other' if dtype is None else _column_kind(dtype)
+        return kinds
+    
+    def _split_drop_na(self) -> Tuple[List[str], List[TransformationRule]]:
+        """
+        Find DROP_NA rules that can be evaluated in the view query itself.
+        
+        A DROP_NA rule can run before the join when only renames and other
+        DROP_NA rules come before it, and its column has not been renamed onto
+        an existing one; the filter then uses the source column name. Such
+        rules become WHERE ... IS NOT NULL predicates so DuckDB filters rows
+        before joining them. A DROP_NA after any other rule keeps its place:
+        dropping rows first can change that rule's outcome (an int conversion
+        that no longer fails, a datetime format inferred from fewer values).
+        
+        Returns:
+            Tuple[List[str], List[TransformationRule]]: Source columns to filter
+            on, and the rules still to apply afterwards.
+        """
+        transformations = self.schema.transformations
+        columns = self._source_columns()
+        if columns is None:
+            return [], transformations
+        
+        origin: Dict[str, str] = {}
+        touched = set()
+        not_null_columns: List[str] = []
+        remaining: List[TransformationRule] = []
+        # Set once a rule other than RENAME or DROP_NA has been seen
+        blocked = False
+        
+        for transformation in transformations:
+            column = transformation.column
+            if transformation.type == TransformationType.DROP_NA:
+                if not blocked and column in columns and column not in touched:
+                    not_null_columns.append(origin.get(column, column))
+                    continue
+            elif transformation.type == TransformationType.RENAME:
+                new_name = transformation.params.get('new_name')
+                if column in columns and new_name != column:
+                    # Renaming onto an existing column duplicates it; leave
+                    # anything on that name to the later steps
+                    if column in touched or new_name in columns:
+                        touched.add(new_name)
+                    else:
+                        touched.discard(new_name)
+                    columns.discard(column)
+                    columns.add(new_name)
+                    touched.discard(column)
+                    origin[new_name] = origin.pop(column, column)
+            else:
+                touched.add(column)
+                blocked = True
+            remaining.append(transformation)
+        
+        if not not_null_columns:
+            return [], transformations
+        return list(dict.fromkeys(not_null_columns)), remaining
+    
+    def _build_transformation_query(self,
+                                    view_query: str,
+                                    transformations: List[TransformationRule]) -> Optional[Tuple[str, List[Any], List[str]]]:
+        """
+        Wrap the view query with transformations expressed in SQL.
+        
+        Each rule becomes one projection or filter layer over the previous one,
+        preserving rule order; DuckDB's optimizer merges the layers into a single
+        pipeline. Values are passed as parameters, never inlined.
+        
+        The kind of every column is tracked through the rules, and a type
+        conversion is only expressed in SQL when it gives the pandas result:
+        integer conversion of integer columns, float conversion of numeric
+        columns (a no-op, as in pd.to_numeric) and datetime conversion of text
+        with an explicit format. Anything else, e.g. epoch integers, format
+        inference or fractional values that make astype('Int64') fail, is left
+        to pandas, since TRY_CAST would silently turn those values into NULL.
+        Likewise, FILLNA, MAP_VALUES, CLIP and REPLACE values must be of the
+        column's kind, so DuckDB's implicit casts never match or write values
+        pandas would not.
+        
+        Args:
+            view_query (str): Query joining the registered sources.
+            transformations (List[TransformationRule]): Rules to express.
+        
+        Returns:
+            Optional[Tuple[str, List[Any], List[str]]]: The SQL, its parameters and
+            the output columns converted to integers, or None when a rule has no
+            SQL equivalent and the pandas path must be used.
+        """
+        kinds = self._source_column_kinds()
+        if kinds is None:
+            return None
+        
+        sql = view_query
+        params: List[Any] = []
+        int_columns: List[str] = []
+        
+        for transformation in transformations:
+            column = transformation.column
+            col = _quote_ident(column)
+            rule_params = transformation.params
+            rule_type = transformation.type
+            expr = None
+            # Parameters of this layer; outer layers come first in the SQL text
+            layer: List[Any] = []
+            
+            if column not in kinds:
+                if rule_type == TransformationType.RENAME:
+                    # pandas ignores renames of missing columns
+                    continue
+                # Leave the per-rule error handling to the pandas path
+                return None
+            
+            if rule_type == TransformationType.RENAME:
+                new_name = rule_params.get('new_name')
+                if not isinstance(new_name, str):
+                    return None
+                if new_name == column:
+                    continue
+                if any(name.lower() == new_name.lower() for name in kinds if name != column):
+                    return None
+                kinds[new_name] = kinds.pop(column)
+                sql = f"SELECT * RENAME ({col} AS {_quote_ident(new_name)}) FROM ({sql})"
+                if column in int_columns:
+                    int_columns[int_columns.index(column)] = new_name
+                continue
+            
+            elif rule_type == TransformationType.DROP_NA:
+                sql = f"SELECT * FROM ({sql}) WHERE {col} IS NOT NULL"
+                continue
+            
+            elif rule_type == TransformationType.FILLNA:
+                value = rule_params.get('value')
+                if not _matches_kind(value, kinds[column], exact=True):
+                    # pandas changes the dtype where DuckDB would cast the value
+                    return None
+                expr = f"COALESCE({col}, ?)"
+                layer.append(value)
+            
+            elif rule_type == TransformationType.CONVERT_TYPE:
+                target_type = rule_params.get('type')
+                kind = kinds[column]
+                if target_type == 'int':
+                    if kind != 'int':
+                        return None
+                    expr = f"CAST({col} AS BIGINT)"
+                elif target_type == 'float':
+                    if kind not in ('int', 'float'):
+                        return None
+                    # pd.to_numeric leaves numeric columns untouched
+                    continue
+                elif target_type == 'datetime':
+                    fmt = rule_params.get('format')
+                    if kind != 'string' or not isinstance(fmt, str) or '%' not in fmt:
+                        # Inferred formats, epochs and pandas-only formats such
+                        # as 'ISO8601' or 'mixed'
+                        return None
+                    expr = f"CAST(try_strptime({col}, ?) AS {_SQL_TIMESTAMP_TYPES[_DATETIME_UNIT]})"
+                    layer.append(fmt)
+                else:
+                    continue
+                if column in int_columns:
+                    int_columns.remove(column)
+                if target_type == 'int':
+                    int_columns.append(column)
+                kinds[column] = 'int' if target_type == 'int' else 'other'
+            
+            elif rule_type == TransformationType.MAP_VALUES:
+                mapping = rule_params.get('mapping', {})
+                if not isinstance(mapping, dict):
+                    return None
+                # DuckDB would cast '1' to match an integer column; Series.map does not
+                if not all(_matches_kind(key, kinds[column]) for key in mapping):
+                    return None
+                values = mapping.values()
+                if all(isinstance(v, str) for v in values):
+                    result_type = 'VARCHAR'
+                elif all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+                    # Unmapped values become NaN in pandas, so numbers are floats
+                    result_type = 'DOUBLE'
+                else:
+                    return None
+                kinds[column] = 'string' if result_type == 'VARCHAR' else 'float'
+                if mapping:
+                    expr = f"CAST(CASE {col}{' WHEN ? THEN ?' * len(mapping)} END AS {result_type})"
+                    for key, value in mapping.items():
+                        layer.extend((key, value))
+                else:
+                    expr = "CAST(NULL AS DOUBLE)"
+            
+            elif rule_type == TransformationType.CLIP:
+                lower = rule_params.get('min')
+                upper = rule_params.get('max')
+                if kinds[column] not in ('int', 'float') or not all(
+                        bound is None or _matches_kind(bound, kinds[column]) for bound in (lower, upper)):
+                    return None
+                cases = []
+                if lower is not None:
+                    cases.append(f"WHEN {col} < ? THEN ?")
+                    layer.extend((lower, lower))
+                if upper is not None:
+                    cases.append(f"WHEN {col} > ? THEN ?")
+                    layer.extend((upper, upper))
+                if not cases:
+                    continue
+                expr = f"CASE {' '.join(cases)} ELSE {col} END"
+            
+            elif rule_type == TransformationType.REPLACE:
+                old_value = rule_params.get('old_value')
+                new_value = rule_params.get('new_value')
+                # Only same-kind values keep pandas' matching and result dtype:
+                # '1' never matches an int column and None makes it object
+                if not _matches_kind(old_value, kinds[column]) \
+                        or not _matches_kind(new_value, kinds[column], exact=True):
+                    return None
+                expr = f"CASE WHEN {col} = ? THEN ? ELSE {col} END"
+                layer.extend((old_value, new_value))
+            
+            else:
+                self.logger.warning(f"Unsupported transformation: {rule_type}")
+                continue
+            
+            sql = f"SELECT * REPLACE ({expr} AS {col}) FROM ({sql})"
+            params = layer + params
+        
+        return sql, params, int_columns
+    
+    def _build_view_query(self, not_null_columns: Sequence[str] = ()) -> str:
         """
         Constrói uma consulta SQL para construir a view com base nas relações.
         
+        Args:
+            not_null_columns: Colunas que não podem ser nulas; viram um filtro
+                WHERE aplicado antes da junção.
+        
         Returns:
             str: Consulta SQL para construção da view.
         """
+        query = self._build_join_query()
+        if not_null_columns:
+            query += " WHERE " + " AND ".join(
+                f"{_quote_ident(column)} IS NOT NULL" for column in not_null_columns
+            )
+        return query
+    
+    def _build_join_query(self) -> str:
+        """
+        Constrói a consulta de junção das fontes registradas.
+        
+        Returns:
+            str: Consulta SQL de junção.
+        """
         if not self.schema.relations:
             # Se não há relações, seleciona de todas as fontes
-            source_tables = list(self._registered_sources.keys())
+            source_tables = [_quote_ident(name) for name in self._registered_sources]
             if len(source_tables) == 1:
                 return f"SELECT * FROM {source_tables[0]}"
             else:
                 # Se múltiplas fontes, faz um produto cartesiano
                 return f"SELECT * FROM {' CROSS JOIN '.join(source_tables)}"
         
-        # Constrói consulta de junção baseada em relações
-        join_query = None
-        first_table = None
-        
-        for relation in self.schema.relations:
-            if first_table is None:
-                first_table = relation.source_table
-                join_query = first_table
-            
-            # Adiciona junções
-            join_query += f" INNER JOIN {relation.target_table} " \
-                        f"ON {relation.source_table}.{relation.source_column} = " \
-                        f"{relation.target_table}.{relation.target_column}"
-        
-        # Se não conseguiu construir a junção, faz junção cruzada
-        if join_query is None:
-            source_tables = list(self._registered_sources.keys())
-            join_query = f"SELECT * FROM {' CROSS JOIN '.join(source_tables)}"
-        else:
-            join_query = f"SELECT * FROM {join_query}"
-        
-        return join_query
+        # Constrói consulta de junção baseada em relações, montando as partes
+        # numa lista e unindo-as uma única vez; os identificadores vão sempre
+        # entre aspas, pois vêm do schema
+        relations = self.schema.relations
+        parts = ["SELECT * FROM ", _quote_ident(relations[0].source_table)]
+        for relation in relations:
+            source = _quote_ident(relation.source_table)
+            target = _quote_ident(relation.target_table)
+            parts.append(
+                f" INNER JOIN {target} "
+                f"ON {source}.{_quote_ident(relation.source_column)} = "
+                f"{target}.{_quote_ident(relation.target_column)}"
+            )
+        return ''.join(parts)
     
     def validate_view_sources(self) -> bool:
         """
@@ -196,18 +1174,14 @@ class ViewLoader:
             bool: True if sources are valid, False otherwise.
         """
         # Check if registered sources match schema
-        registered_tables = set(self._registered_sources.keys())
-        required_tables = {
-            rel.source_table for rel in self.schema.relations
-        } | {
-            rel.target_table for rel in self.schema.relations
-        }
-        
-        return registered_tables == required_tables
+        return self._registered_sources.keys() == self._required_tables
     
     def close(self) -> None:
-        """Close the DuckDB connection."""
-        self.duckdb_conn.close()
+        """Release the DuckDB connection back to the shared pool."""
+        if self.duckdb_conn is None:
+            return
+        _release_connection(self.duckdb_conn, list(self._registered_sources))
+        self.duckdb_conn = None
         self.logger.info("View loader connection closed")
 
 def create_view_from_sources(
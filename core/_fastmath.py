@@ -0,0 +1,115 @@
+"""
+Funções numéricas rápidas expostas ao código gerado como ``fast``.
+
+Com o Numba instalado, os laços são compilados com ``njit(cache=True)``, de
+modo que só a primeira execução paga a compilação. Sem ele, as mesmas funções
+são executadas em Python puro, com resultados idênticos.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Substituto sem efeito para numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _sum(a):
+    total = 0.0
+    for i in range(a.shape[0]):
+        total += a[i]
+    return total
+
+
+@njit(cache=True)
+def _mean(a):
+    if a.shape[0] == 0:
+        return np.nan
+    return _sum(a) / a.shape[0]
+
+
+@njit(cache=True)
+def _std(a, ddof):
+    n = a.shape[0]
+    if n - ddof <= 0:
+        return np.nan
+    mean = _sum(a) / n
+    acc = 0.0
+    for i in range(n):
+        diff = a[i] - mean
+        acc += diff * diff
+    return np.sqrt(acc / (n - ddof))
+
+
+@njit(cache=True)
+def _clip(a, lower, upper):
+    out = np.empty_like(a)
+    for i in range(a.shape[0]):
+        value = a[i]
+        # Mesma ordem do np.clip: com lower > upper, prevalece upper
+        if value < lower:
+            value = lower
+        if value > upper:
+            value = upper
+        out[i] = value
+    return out
+
+
+@njit(cache=True)
+def _rolling_mean(a, window):
+    n = a.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    for i in range(n):
+        total += a[i]
+        if i >= window:
+            total -= a[i - window]
+        if i >= window - 1:
+            out[i] = total / window
+    return out
+
+
+def _as_float_array(a) -> np.ndarray:
+    """Converte a entrada para um array 1-D contíguo de float64."""
+    return np.ascontiguousarray(a, dtype=np.float64).ravel()
+
+
+def sum1d(a) -> float:
+    """Soma dos elementos de um array 1-D."""
+    return float(_sum(_as_float_array(a)))
+
+
+def mean1d(a) -> float:
+    """Média dos elementos de um array 1-D (NaN se vazio)."""
+    return float(_mean(_as_float_array(a)))
+
+
+def std1d(a, ddof: int = 0) -> float:
+    """
+    Desvio padrão de um array 1-D, com ``ddof`` graus de liberdade descontados.
+    
+    NaN se não sobrarem graus de liberdade (``ddof >= len(a)``).
+    """
+    return float(_std(_as_float_array(a), ddof))
+
+
+def clip1d(a, lower: float = -np.inf, upper: float = np.inf) -> np.ndarray:
+    """Limita os elementos de um array 1-D ao intervalo [lower, upper]."""
+    return _clip(_as_float_array(a), float(lower), float(upper))
+
+
+def rolling_mean1d(a, window: int) -> np.ndarray:
+    """Média móvel de um array 1-D; as primeiras ``window - 1`` posições são NaN."""
+    if window < 1:
+        raise ValueError("window deve ser pelo menos 1")
+    return _rolling_mean(_as_float_array(a), int(window))
+
+
+__all__ = ['NUMBA_AVAILABLE', 'sum1d', 'mean1d', 'std1d', 'clip1d', 'rolling_mean1d']
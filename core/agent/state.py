@@ -1,3 +1,5 @@
+from collections import deque
+from itertools import islice
 from typing import List, Dict, Any, Optional, Union
 import pandas as pd
 
@@ -7,13 +9,30 @@ class AgentMemory:
     Class to store agent memory including conversation history.
     """
     
-    def __init__(self, agent_description: str = ""):
+    __slots__ = ('agent_description', '_conversation', '_joined', '_prev_joined')
+    
+    def __init__(self, agent_description: str = "", max_history: Optional[int] = None):
+        if max_history is not None and max_history < 1:
+            raise ValueError("max_history must be at least 1 or None")
         self.agent_description = agent_description
-        self._conversation = []
+        # Bounded deque: O(1) appends, oldest messages evicted automatically
+        self._conversation = deque(maxlen=max_history)
+        # Joined history, kept up to date on every add so reads are O(1)
+        self._joined = ""
+        self._prev_joined = ""
     
     def add_message(self, message: str):
         """Add a message to the conversation history."""
-        self._conversation.append(message)
+        conversation = self._conversation
+        if conversation.maxlen is not None and len(conversation) == conversation.maxlen:
+            # The oldest message is about to be evicted; rebuild from the window
+            conversation.append(message)
+            self._prev_joined = "\n".join(islice(conversation, 0, len(conversation) - 1))
+            self._joined = "\n".join(conversation)
+            return
+        self._prev_joined = self._joined
+        self._joined = f"{self._joined}\n{message}" if conversation else message
+        conversation.append(message)
     
     def get_last_message(self) -> str:
         """Get the last message in the conversation."""
@@ -23,13 +42,11 @@ class AgentMemory:
     
     def get_conversation(self) -> str:
         """Get the full conversation history as a string."""
-        return "\n".join(self._conversation)
+        return self._joined
     
     def get_previous_conversation(self) -> str:
         """Get the conversation history excluding the last message."""
-        if len(self._conversation) <= 1:
-            return ""
-        return "\n".join(self._conversation[:-1])
+        return self._prev_joined
     
     def count(self) -> int:
         """Get the number of messages in the conversation."""
@@ -37,7 +54,7 @@ class AgentMemory:
     
     def to_json(self) -> List[str]:
         """Get the conversation as a JSON-serializable list."""
-        return self._conversation
+        return list(self._conversation)
 
 
 class AgentConfig:
@@ -45,8 +62,9 @@ class AgentConfig:
     Configuration for the agent.
     """
     
-    def __init__(self, direct_sql: bool = False):
+    def __init__(self, direct_sql: bool = False, max_history: Optional[int] = None):
         self.direct_sql = direct_sql
+        self.max_history = max_history
 
 
 class AgentState:
@@ -54,6 +72,14 @@ class AgentState:
     Represents the current state of the agent including data, memory, and configuration.
     """
     
+    # Well-known state keys live in slots; any other key goes to _state
+    _STATE_KEYS = frozenset(('last_query', 'last_result', 'last_code', 'last_code_generated'))
+    
+    __slots__ = (
+        'dfs', 'memory', 'config', 'output_type', 'vectorstore',
+        'last_query', 'last_result', 'last_code', 'last_code_generated', '_state',
+    )
+    
     def __init__(
         self,
         dfs: List[pd.DataFrame] = None,
@@ -63,18 +89,23 @@ class AgentState:
         vectorstore: Any = None,
     ):
         self.dfs = dfs or []
-        self.memory = memory or AgentMemory()
         self.config = config or AgentConfig()
+        self.memory = memory or AgentMemory(max_history=self.config.max_history)
         self.output_type = output_type
         self.vectorstore = vectorstore
         self._state = {}
     
     def set(self, key: str, value: Any):
         """Set a value in the state dictionary."""
-        self._state[key] = value
+        if key in self._STATE_KEYS:
+            setattr(self, key, value)
+        else:
+            self._state[key] = value
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a value from the state dictionary."""
+        if key in self._STATE_KEYS:
+            return getattr(self, key, default)
         return self._state.get(key, default)
     
     def add_df(self, df: pd.DataFrame):
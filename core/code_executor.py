@@ -1,7 +1,12 @@
 import ast
 import contextlib
+import datetime
+import functools
 import importlib
 import io
+import json
+import math
+import random
 import re
 import traceback
 import threading
@@ -18,6 +23,278 @@ import numpy as np
 import pandas as pd
 import sympy as sp
 
+from core import _fastmath
+
+
+# Padrões usados por sanitize_code, compilados uma única vez
+_DANGEROUS_IMPORTS = (
+    'os', 'sys', 'subprocess', 'eval', 'exec', 
+    'pickle', 'marshal', 'ctypes', 'threading'
+)
+_DANGEROUS_NAMES = '|'.join(map(re.escape, _DANGEROUS_IMPORTS))
+_COMMENT_RE = re.compile(r'^\s*#.*$', re.MULTILINE)
+_BLANKS_RE = re.compile(r'\n{3,}')
+_DANGEROUS_RE = re.compile(
+    rf'^(?:import\s+(?P<m1>{_DANGEROUS_NAMES})|from\s+(?P<m2>{_DANGEROUS_NAMES})\s+import).*$',
+    re.MULTILINE
+)
+_LAMBDA_EXEC_RE = re.compile(r'lambda\s*.*:\s*exec\(')
+
+# Modo do Black criado uma única vez; FileMode() resolve versões e recursos a cada construção
+_BLACK_MODE = black.FileMode()
+
+# Saídas recentes do Black, que já estão formatadas e podem ser devolvidas como estão
+_FORMATTED_MAX = 512
+_formatted_outputs: Dict[str, None] = {}
+_formatted_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=512)
+def _format_cached(code: str) -> str:
+    """Formata o código com Black, memorizando o resultado por código de entrada."""
+    try:
+        formatted = black.format_str(code, mode=_BLACK_MODE)
+    except Exception:
+        # Se a formatação falhar, retorna o código original
+        return code
+    
+    with _formatted_lock:
+        _formatted_outputs[formatted] = None
+        if len(_formatted_outputs) > _FORMATTED_MAX:
+            # Descarta a saída mais antiga (dicts preservam a ordem de inserção)
+            del _formatted_outputs[next(iter(_formatted_outputs))]
+    return formatted
+
+
+_AST_CACHE_MAX = 128
+
+# Abaixo deste tamanho, código já na forma de ast.unparse não passa pelo Black
+_UNPARSE_MAX_SIZE = 4096
+
+
+class _InspectVisitor(ast.NodeVisitor):
+    """
+    Percorre a AST uma única vez, reunindo as regras de segurança e as métricas.
+    
+    Guarda a primeira violação (imports não autorizados, chamadas bloqueadas,
+    global/nonlocal) na ordem em largura do ast.walk, e conta funções,
+    classes, imports e a complexidade ciclomática, em que cada desvio conta
+    uma vez para cada função que o contém.
+    """
+    
+    _BLOCKED_CALLS = frozenset(('open', 'exec', 'eval', 'compile'))
+    
+    def __init__(self, allowed_imports: List[str]):
+        self.allowed_imports = allowed_imports
+        self.tree: Optional[ast.Module] = None
+        self.violation: Optional[str] = None
+        self.functions = 0
+        self.classes = 0
+        self.imports = 0
+        self.complexity = 0
+        self._function_depth = 0
+        self._flagged: Dict[ast.AST, str] = {}
+    
+    def inspect(self, tree: ast.Module) -> None:
+        """Percorre a árvore e define a violação reportada."""
+        self.tree = tree
+        self.visit(tree)
+        if len(self._flagged) > 1:
+            # A visita é em profundidade; a primeira violação é a do ast.walk
+            self.violation = next(self._flagged[node] for node in ast.walk(tree) if node in self._flagged)
+        elif self._flagged:
+            self.violation = next(iter(self._flagged.values()))
+    
+    def _flag(self, node: ast.AST, message: str) -> None:
+        self._flagged.setdefault(node, message)
+    
+    def visit_Global(self, node: ast.AST) -> None:
+        self._flag(node, f"Operação não permitida: {type(node).__name__}")
+        self.generic_visit(node)
+    
+    visit_Nonlocal = visit_Global
+    
+    def visit_Import(self, node: ast.Import) -> None:
+        self.imports += 1
+        for alias in node.names:
+            base_module = alias.name.split('.')[0]
+            if base_module not in self.allowed_imports:
+                self._flag(node, f"Import não autorizado: {alias.name}")
+                break
+        self.generic_visit(node)
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        self.imports += 1
+        self.generic_visit(node)
+    
+    def visit_Call(self, node: ast.Call) -> None:
+        if isinstance(node.func, ast.Name) and node.func.id in self._BLOCKED_CALLS:
+            self._flag(node, f"Chamada não permitida: {node.func.id}")
+        self.generic_visit(node)
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.functions += 1
+        self._function_depth += 1
+        self.generic_visit(node)
+        self._function_depth -= 1
+    
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.classes += 1
+        self.generic_visit(node)
+    
+    def _visit_branch(self, node: ast.AST) -> None:
+        self.complexity += self._function_depth
+        self.generic_visit(node)
+    
+    visit_If = visit_While = visit_For = visit_Try = visit_ExceptHandler = _visit_branch
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(source: str) -> Any:
+    """Compila o código para bytecode uma única vez por código-fonte."""
+    return compile(source, '<exec>', 'exec', dont_inherit=True)
+
+
+# Tipos simples, que passam entre processos e se serializam como estão. A
+# consulta por type() no frozenset evita a cadeia de isinstance nos casos
+# comuns; subclasses (ex.: np.float64, OrderedDict) caem no isinstance.
+_PRIMITIVE_TYPES = frozenset((int, float, str, bool, type(None)))
+_CONTAINER_TYPES = frozenset((list, dict, tuple, set))
+_PLAIN_TYPES = _PRIMITIVE_TYPES | _CONTAINER_TYPES
+_PRIMITIVE_CLASSES = tuple(_PRIMITIVE_TYPES)
+_PLAIN_CLASSES = tuple(_PLAIN_TYPES)
+
+
+def _is_plain(value: Any) -> bool:
+    """Indica se o valor é de um tipo simples ou de uma subclasse de um deles."""
+    return type(value) in _PLAIN_TYPES or isinstance(value, _PLAIN_CLASSES)
+
+
+# Tipos de coluna cujo tolist() já devolve os mesmos escalares nativos que to_dict()
+_BULK_DTYPE_KINDS = frozenset('biufcmM')
+
+
+def _index_keys(index: pd.Index) -> Optional[List[Any]]:
+    """Rótulos do índice como escalares nativos, ou None se for preciso o to_dict()."""
+    if isinstance(index.dtype, np.dtype):
+        return index.tolist()
+    return None
+
+
+def _series_to_dict(series: pd.Series, keys: Optional[List[Any]]) -> Dict[Any, Any]:
+    """
+    Equivalente a series.to_dict(), convertendo a coluna inteira de uma vez.
+    
+    Colunas numpy numéricas, booleanas e de datas usam tolist(), que converte
+    em bloco; as demais (extensões do pandas, object) ficam com o to_dict(),
+    que troca NA por None e converte escalares numpy dentro de objetos.
+    """
+    dtype = series.dtype
+    if keys is not None and isinstance(dtype, np.dtype) and dtype.kind in _BULK_DTYPE_KINDS:
+        return dict(zip(keys, series.tolist()))
+    return series.to_dict()
+
+
+# Módulos disponíveis para todo código executado, montados uma única vez
+_BASE_NAMESPACE: Dict[str, Any] = {
+    'np': np,
+    'pd': pd,
+    'sp': sp,
+    'math': math,
+    'random': random,
+    'datetime': datetime,
+    'json': json,
+    'fast': _fastmath,
+}
+
+
+# Executor usado dentro de cada processo de trabalho, criado na primeira tarefa
+_worker_executor: Optional["AdvancedDynamicCodeExecutor"] = None
+
+
+def _init_worker() -> None:
+    """Carrega as bibliotecas pesadas uma vez por processo de trabalho."""
+    import numpy  # noqa: F401
+    import pandas  # noqa: F401
+    import sympy  # noqa: F401
+
+
+def _execute_in_worker(formatted_code: str, namespace_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Executa o código num processo de trabalho e devolve o resultado serializável."""
+    global _worker_executor
+    if _worker_executor is None:
+        _worker_executor = AdvancedDynamicCodeExecutor(use_multiprocessing=False)
+    return _worker_executor._execute_in_process(formatted_code, namespace_dict)
+
+
+def _worker_loop(conn) -> None:
+    """Laço de um processo de trabalho: recebe tarefas pelo pipe até receber None."""
+    _init_worker()
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        conn.send(_execute_in_worker(*task))
+
+
+class _Worker:
+    """
+    Processo de trabalho reutilizável, com um pipe próprio.
+    
+    Cada tarefa ocupa o processo sozinha, de modo que um timeout encerra só
+    este processo, sem afetar tarefas que rodam em outros.
+    """
+    
+    def __init__(self):
+        context = multiprocessing.get_context()
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_loop, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+    
+    def run(self, formatted_code: str, namespace_dict: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """
+        Executa uma tarefa e aguarda o resultado.
+        
+        O prazo começa a contar no envio, pois o processo está dedicado à tarefa.
+        
+        Raises:
+            TimeoutError: Se o resultado não chegar dentro do prazo.
+            EOFError: Se o processo terminar sem devolver resultado.
+        """
+        self.conn.send((formatted_code, namespace_dict))
+        if not self.conn.poll(timeout):
+            raise TimeoutError()
+        return self.conn.recv()
+    
+    def is_alive(self) -> bool:
+        """Indica se o processo ainda está em execução."""
+        return self.process.is_alive()
+    
+    def kill(self) -> None:
+        """Encerra o processo à força (SIGTERM e, se preciso, SIGKILL)."""
+        self.process.terminate()
+        self.process.join(1)  # Dá 1 segundo para finalização
+        if self.process.is_alive():
+            os.kill(self.process.pid, signal.SIGKILL)
+            self.process.join()
+        self.conn.close()
+    
+    def close(self) -> None:
+        """Pede ao processo que termine após a tarefa atual."""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(1)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+
 
 class TimeoutException(Exception):
     """Exceção levantada quando a execução excede o tempo limite."""
@@ -61,6 +338,15 @@ class AdvancedDynamicCodeExecutor:
         self.max_output_size = max_output_size
         self.use_multiprocessing = use_multiprocessing
         self.imported_modules = {}
+        # Namespace base de execução, copiado a cada chamada
+        self._base_ns: Dict[str, Any] = {**_BASE_NAMESPACE, 'import_module': self._safe_import}
+        # Processos de trabalho ociosos, reaproveitados entre execuções
+        self._idle_workers: List[_Worker] = []
+        self._workers_lock = threading.Lock()
+        # Inspeções de AST por código-fonte e imports permitidos, compartilhadas
+        # entre validação e complexidade
+        self._ast_cache: Dict[Tuple[str, Tuple[str, ...]], _InspectVisitor] = {}
+        self._ast_cache_lock = threading.Lock()
     
     @staticmethod
     def sanitize_code(code: str) -> str:
@@ -74,34 +360,27 @@ class AdvancedDynamicCodeExecutor:
             str: Código limpo e formatado.
         """
         # Remove comentários de bloco e linhas em branco excessivas
-        code = re.sub(r'^\s*#.*$', '', code, flags=re.MULTILINE)
-        code = re.sub(r'\n{3,}', '\n\n', code)
+        code = _COMMENT_RE.sub('', code)
+        code = _BLANKS_RE.sub('\n\n', code)
         
-        # Remove imports potencialmente perigosos
-        dangerous_imports = [
-            'os', 'sys', 'subprocess', 'eval', 'exec', 
-            'pickle', 'marshal', 'ctypes', 'threading'
-        ]
-        for imp in dangerous_imports:
-            # Usa substituição menos agressiva
-            code = re.sub(
-                rf'^(import\s+{imp}|from\s+{imp}\s+import).*$', 
-                f'# Import removido por segurança: {imp}', 
-                code, 
-                flags=re.MULTILINE
-            )
+        # Remove imports potencialmente perigosos, todos numa única passada
+        code = _DANGEROUS_RE.sub(
+            lambda m: f'# Import removido por segurança: {m.group("m1") or m.group("m2")}',
+            code
+        )
         
         # Previne criação de funções perigosas
-        code = re.sub(r'lambda\s*.*:\s*exec\(', 'lambda x: None  # Blocked', code)
+        code = _LAMBDA_EXEC_RE.sub('lambda x: None  # Blocked', code)
         
         return code.strip()
     
-    def basic_code_validation(self, code: str) -> Tuple[bool, str]:
+    def basic_code_validation(self, code: str, tree: Optional[ast.Module] = None) -> Tuple[bool, str]:
         """
         Valida a sintaxe do código com verificações avançadas.
         
         Args:
             code (str): Código a ser validado.
+            tree (Optional[ast.Module]): AST já analisada do código, se houver.
         
         Returns:
             Tuple[bool, str]: 
@@ -109,35 +388,12 @@ class AdvancedDynamicCodeExecutor:
             - Mensagens de erro (se houver)
         """
         try:
-            # Verifica a sintaxe usando AST
-            tree = ast.parse(code)
-            
-            # Análise de nós AST para segurança
-            for node in ast.walk(tree):
-                # Bloqueia chamadas potencialmente perigosas
-                # Removida a verificação de ast.Exec que não existe mais
-                if isinstance(node, ast.Global) or isinstance(node, ast.Nonlocal):
-                    return False, f"Operação não permitida: {type(node).__name__}"
-                
-                # Previne imports não autorizados
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        base_module = alias.name.split('.')[0]
-                        if base_module not in self.allowed_imports:
-                            return False, f"Import não autorizado: {alias.name}"
-                
-                # Previne chamadas de funções do sistema
-                if isinstance(node, ast.Call):
-                    if (isinstance(node.func, ast.Name) and 
-                        node.func.id in ['open', 'exec', 'eval', 'compile']):
-                        return False, f"Chamada não permitida: {node.func.id}"
-            
-            # Verifica indentação e blocos
-            lines = code.split('\n')
-            for i, line in enumerate(lines):
-                if line.strip() and not re.match(r'^\s*\S', line):
-                    return False, f"Erro de indentação na linha {i+1}"
+            # Verifica a sintaxe e inspeciona a AST numa única passada
+            inspection = self._inspect(code, tree)
+            if inspection.violation:
+                return False, inspection.violation
             
+            # Erros de indentação já chegam como SyntaxError (IndentationError) do ast.parse
             return True, "Código válido"
         
         except SyntaxError as e:
@@ -145,22 +401,58 @@ class AdvancedDynamicCodeExecutor:
         except Exception as e:
             return False, f"Erro durante validação: {str(e)}"
     
+    def _inspect(self, code: str, tree: Optional[ast.Module] = None) -> "_InspectVisitor":
+        """
+        Analisa o código e percorre a AST uma única vez, com cache por código
+        e lista de imports permitidos.
+        
+        Args:
+            code (str): Código a ser inspecionado.
+            tree (Optional[ast.Module]): AST já analisada do código, se houver.
+        
+        Returns:
+            _InspectVisitor: Visitante com a AST, as métricas e a primeira violação.
+        
+        Raises:
+            SyntaxError: Se o código não for Python válido.
+        """
+        # A lista de imports pode mudar entre chamadas
+        key = (code, tuple(self.allowed_imports))
+        with self._ast_cache_lock:
+            inspection = self._ast_cache.get(key)
+        if inspection is None:
+            inspection = _InspectVisitor(list(key[1]))
+            inspection.inspect(tree if tree is not None else ast.parse(code))
+            with self._ast_cache_lock:
+                self._ast_cache[key] = inspection
+                if len(self._ast_cache) > _AST_CACHE_MAX:
+                    # Descarta a entrada mais antiga
+                    del self._ast_cache[next(iter(self._ast_cache))]
+        return inspection
+    
     @staticmethod
-    def format_code(code: str) -> str:
+    def format_code(code: str, tree: Optional[ast.Module] = None) -> str:
         """
         Formata o código usando Black para manter consistência.
         
+        Códigos repetidos (comuns em laços de nova tentativa) vêm do cache, e
+        um código que já é saída recente do Black é devolvido sem reformatar.
+        Com a AST em mãos, um código curto que já está na forma canônica de
+        ast.unparse também dispensa o Black, cuja análise é bem mais cara.
+        
         Args:
             code (str): Código a ser formatado.
+            tree (Optional[ast.Module]): AST já analisada do código, se houver.
         
         Returns:
             str: Código formatado.
         """
-        try:
-            return black.format_str(code, mode=black.FileMode())
-        except Exception:
-            # Se a formatação falhar, retorna o código original
+        if code in _formatted_outputs:
             return code
+        if tree is not None and len(code) < _UNPARSE_MAX_SIZE \
+                and ast.unparse(tree).strip() == code.strip():
+            return code
+        return _format_cached(code)
     
     def _safe_import(self, module_name: str) -> Optional[Any]:
         """
@@ -211,7 +503,7 @@ class AdvancedDynamicCodeExecutor:
             with contextlib.redirect_stdout(output), \
                  contextlib.redirect_stderr(error_output):
                 # Executa o código em um namespace isolado
-                exec(formatted_code, exec_namespace)
+                exec(_compile(formatted_code), exec_namespace)
             
             # Armazena o resultado da execução no container
             result_container["success"] = True
@@ -224,34 +516,27 @@ class AdvancedDynamicCodeExecutor:
     def _execute_in_process(
         self, 
         formatted_code: str, 
-        namespace_dict: Dict[str, Any],
-        result_queue: multiprocessing.Queue
-    ) -> None:
+        namespace_dict: Dict[str, Any]
+    ) -> Dict[str, Any]:
         """
         Executa código em processo separado para interrupção segura.
         
         Args:
             formatted_code: Código formatado e validado
             namespace_dict: Dicionário com variáveis de ambiente para execução
-            result_queue: Fila para retornar resultados
+        
+        Returns:
+            Dict[str, Any]: Resultado serializável da execução
         """
         try:
             # Recria o namespace a partir do dicionário
             # Obs: nem todas as variáveis podem ser serializadas para multiprocessing
-            exec_namespace = {
-                'np': np,
-                'pd': pd,
-                'sp': sp,
-                'math': __import__('math'),
-                'random': __import__('random'),
-                'datetime': __import__('datetime'),
-                'json': __import__('json'),
-            }
+            exec_namespace = dict(_BASE_NAMESPACE)
             
             # Adiciona variáveis simples do contexto original
             for key, value in namespace_dict.items():
                 # Só adiciona tipos serializáveis básicos
-                if isinstance(value, (int, float, str, bool, list, dict, tuple, set)):
+                if value is not None and _is_plain(value):
                     exec_namespace[key] = value
                     
             # Captura de saída
@@ -261,26 +546,24 @@ class AdvancedDynamicCodeExecutor:
             # Executa o código
             with contextlib.redirect_stdout(output), \
                  contextlib.redirect_stderr(error_output):
-                exec(formatted_code, exec_namespace)
+                exec(_compile(formatted_code), exec_namespace)
                 
             # Obtém o resultado
             result_var = exec_namespace.get('result')
             
-            # Envia resultado pela fila
-            result_queue.put({
+            return {
                 "success": True,
                 "result_var": self._safe_serialize(result_var),
                 "stdout": output.getvalue(),
                 "stderr": error_output.getvalue()
-            })
+            }
             
         except Exception as e:
-            # Envia erro pela fila
-            result_queue.put({
+            return {
                 "success": False,
                 "error": str(e),
                 "traceback": traceback.format_exc()
-            })
+            }
 
     def execute_code(
         self, 
@@ -323,27 +606,26 @@ class AdvancedDynamicCodeExecutor:
             # Limpa o código
             sanitized_code = self.sanitize_code(modified_code)
             
+            # Analisa o código uma única vez; a AST serve à formatação e à validação
+            try:
+                tree = ast.parse(sanitized_code)
+            except SyntaxError:
+                tree = None
+            
             # Formata o código
-            formatted_code = self.format_code(sanitized_code)
+            formatted_code = self.format_code(sanitized_code, tree)
+            if formatted_code != sanitized_code:
+                # O Black reescreveu o código; a validação analisa a nova versão
+                tree = None
             
             # Valida o código
-            is_valid, validation_msg = self.basic_code_validation(formatted_code)
+            is_valid, validation_msg = self.basic_code_validation(formatted_code, tree=tree)
             if not is_valid:
                 result["error"] = validation_msg
                 return result
             
             # Preparação do ambiente de execução
-            exec_namespace = {
-                'np': np,
-                'pd': pd,
-                'sp': sp,
-                'math': __import__('math'),
-                'random': __import__('random'),
-                'datetime': __import__('datetime'),
-                'json': __import__('json'),
-                'import_module': self._safe_import
-            }
-            exec_namespace.update(context)
+            exec_namespace = {**self._base_ns, **context}
             
             # Determina qual método de execução usar
             if self.use_multiprocessing and self._can_use_multiprocessing(context):
@@ -377,6 +659,10 @@ class AdvancedDynamicCodeExecutor:
         """
         # Verifica se há objetos não serializáveis no contexto
         for key, value in context.items():
+            # Tipos simples exatos dispensam as demais verificações
+            if type(value) in _PLAIN_TYPES:
+                continue
+            
             # Tipos que são problemáticos para serialização entre processos
             if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
                 return False
@@ -386,7 +672,7 @@ class AdvancedDynamicCodeExecutor:
                 return False
                 
             # Objetos personalizados provavelmente não são serializáveis
-            if not isinstance(value, (int, float, str, bool, list, dict, tuple, set, type(None))):
+            if not isinstance(value, _PLAIN_CLASSES):
                 return False
                 
         return True
@@ -492,46 +778,30 @@ class AdvancedDynamicCodeExecutor:
             Dict[str, Any]: Dicionário de resultado com status, saída, etc.
         """
         try:
-            # Cria uma fila para comunicação entre processos
-            result_queue = multiprocessing.Queue()
-            
             # Filtra o namespace para ter apenas valores serializáveis
             filtered_namespace = {}
             for key, value in exec_namespace.items():
-                if isinstance(value, (int, float, str, bool, list, dict, tuple, set, type(None))):
+                if _is_plain(value):
                     filtered_namespace[key] = value
             
-            # Cria o processo
-            process = multiprocessing.Process(
-                target=self._execute_in_process,
-                args=(formatted_code, filtered_namespace, result_queue),
-                daemon=True
-            )
-            
-            # Inicia o processo
-            process.start()
-            
-            # Aguarda a conclusão com timeout
-            process.join(timeout=self.timeout)
-            
-            # Verifica se o processo ainda está em execução (timeout ocorreu)
-            if process.is_alive():
-                # No caso de multiprocessing, podemos encerrar o processo
-                process.terminate()
-                process.join(1)  # Dá 1 segundo para finalização
-                
-                # Se ainda estiver vivo, usa medidas mais drásticas (SIGKILL)
-                if process.is_alive():
-                    os.kill(process.pid, signal.SIGKILL)
-                
+            # Cada execução ocupa um processo de trabalho só seu, reaproveitado
+            # depois se terminar normalmente
+            worker = self._acquire_worker()
+            try:
+                process_result = worker.run(formatted_code, filtered_namespace, self.timeout)
+            except TimeoutError:
+                # Só o processo desta execução é encerrado
+                worker.kill()
                 result["success"] = False
                 result["error"] = f"Timeout de execução excedido ({self.timeout} segundos)"
                 return result
+            except (EOFError, OSError) as e:
+                worker.kill()
+                result["error"] = f"Erro ao obter resultado do processo: {str(e) or type(e).__name__}"
+                return result
+            self._release_worker(worker)
             
-            # Obtém o resultado da fila, se disponível
             try:
-                process_result = result_queue.get(block=False)
-                
                 # Verifica se o processo teve sucesso
                 if not process_result.get("success", False):
                     result["error"] = process_result.get("error", "Erro durante execução")
@@ -570,6 +840,35 @@ class AdvancedDynamicCodeExecutor:
             result["error"] = f"Erro no gerenciamento do processo: {traceback.format_exc()}"
             return result
     
+    def _acquire_worker(self) -> _Worker:
+        """
+        Retorna um processo de trabalho ocioso ou cria um novo.
+        
+        Returns:
+            _Worker: Processo dedicado à próxima execução
+        """
+        with self._workers_lock:
+            while self._idle_workers:
+                worker = self._idle_workers.pop()
+                if worker.is_alive():
+                    return worker
+        return _Worker()
+    
+    def _release_worker(self, worker: _Worker) -> None:
+        """Devolve um processo à lista de ociosos, até um por CPU."""
+        with self._workers_lock:
+            if len(self._idle_workers) < (os.cpu_count() or 1):
+                self._idle_workers.append(worker)
+                return
+        worker.close()
+    
+    def shutdown(self) -> None:
+        """Encerra os processos de trabalho ociosos, se houver."""
+        with self._workers_lock:
+            workers, self._idle_workers = self._idle_workers, []
+        for worker in workers:
+            worker.close()
+    
     def _validate_output_type(
         self, 
         value: Any, 
@@ -615,11 +914,30 @@ class AdvancedDynamicCodeExecutor:
         Returns:
             Any: Objeto serializado ou representação segura
         """
+        obj_type = type(obj)
+        
         # Tipos primitivos podem ser serializados diretamente
-        if obj is None or isinstance(obj, (str, int, float, bool)):
+        if obj_type in _PRIMITIVE_TYPES:
+            return obj
+        
+        # Estruturas comuns; itens primitivos são copiados sem recursão
+        if obj_type is list or obj_type is tuple or obj_type is set:
+            return [
+                item if type(item) in _PRIMITIVE_TYPES else self._safe_serialize(item)
+                for item in obj
+            ]
+        
+        if obj_type is dict:
+            return {
+                (k if type(k) in _PRIMITIVE_TYPES else self._safe_serialize(k)):
+                (v if type(v) in _PRIMITIVE_TYPES else self._safe_serialize(v))
+                for k, v in obj.items()
+            }
+        
+        # Subclasses dos tipos acima seguem o caminho geral
+        if isinstance(obj, _PRIMITIVE_CLASSES):
             return obj
         
-        # Serialização de estruturas de dados comuns
         if isinstance(obj, (list, tuple, set)):
             return [self._safe_serialize(item) for item in obj]
         
@@ -629,9 +947,13 @@ class AdvancedDynamicCodeExecutor:
                 for k, v in obj.items()
             }
         
-        # Serialização de DataFrames e Series
-        if isinstance(obj, (pd.DataFrame, pd.Series)):
-            return obj.to_dict()
+        # Serialização de DataFrames e Series, coluna a coluna em bloco
+        if isinstance(obj, pd.DataFrame):
+            keys = _index_keys(obj.index)
+            return {column: _series_to_dict(series, keys) for column, series in obj.items()}
+        
+        if isinstance(obj, pd.Series):
+            return _series_to_dict(obj, _index_keys(obj.index))
         
         # Serialização de arrays numpy
         if isinstance(obj, np.ndarray):
@@ -643,42 +965,28 @@ class AdvancedDynamicCodeExecutor:
         except Exception:
             return repr(obj)
     
-    def analyze_code_complexity(self, code: str) -> Dict[str, Any]:
+    def analyze_code_complexity(self, code: str, tree: Optional[ast.Module] = None) -> Dict[str, Any]:
         """
         Analisa a complexidade do código.
         
         Args:
             code (str): Código a ser analisado
+            tree (Optional[ast.Module]): AST já analisada do código, se houver
         
         Returns:
             Dict[str, Any]: Métricas de complexidade
         """
         try:
-            tree = ast.parse(code)
+            # Reaproveita a AST e os contadores da validação, quando houver
+            inspection = self._inspect(code, tree)
             
-            # Contadores básicos
-            metrics = {
+            return {
                 "lines_of_code": len(code.split('\n')),
-                "functions": 0,
-                "classes": 0,
-                "imports": 0,
-                "complexity": 0
+                "functions": inspection.functions,
+                "classes": inspection.classes,
+                "imports": inspection.imports,
+                "complexity": inspection.complexity
             }
-            
-            # Análise de complexidade ciclomática
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    metrics["functions"] += 1
-                    metrics["complexity"] += sum(
-                        1 for child in ast.walk(node)
-                        if isinstance(child, (ast.If, ast.While, ast.For, ast.Try, ast.ExceptHandler))
-                    )
-                elif isinstance(node, ast.ClassDef):
-                    metrics["classes"] += 1
-                elif isinstance(node, ast.Import) or isinstance(node, ast.ImportFrom):
-                    metrics["imports"] += 1
-            
-            return metrics
         
         except Exception as e:
             return {"error": str(e)}
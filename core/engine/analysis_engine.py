@@ -71,7 +71,8 @@ class AnalysisEngine:
         max_output_size: int = 1024 * 1024,  # 1 MB
         model_type: str = "mock",
         model_name: Optional[str] = None,
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        max_history: Optional[int] = None
     ):
         """
         Inicializa o motor de análise com configurações personalizadas.
@@ -85,6 +86,8 @@ class AnalysisEngine:
             model_type: Tipo de modelo LLM (openai, anthropic, huggingface, local, mock)
             model_name: Nome específico do modelo LLM
             api_key: Chave de API para o modelo LLM
+            max_history: Número máximo de mensagens mantidas na memória do agente
+                (None mantém todo o histórico)
         """
         logger.info(f"Inicializando AnalysisEngine com output_type={default_output_type}, model_type={model_type}")
         
@@ -112,8 +115,11 @@ class AnalysisEngine:
         )
         
         # Configuração do agente
-        agent_config = AgentConfig(direct_sql=direct_sql)
-        agent_memory = AgentMemory(agent_description=agent_description)
+        agent_config = AgentConfig(direct_sql=direct_sql, max_history=max_history)
+        agent_memory = AgentMemory(
+            agent_description=agent_description,
+            max_history=agent_config.max_history
+        )
         
         # Estado do agente (armazena datasets, memória e configurações)
         self.agent_state = AgentState(
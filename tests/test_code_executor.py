@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Testes para o AdvancedDynamicCodeExecutor
+=========================================
+
+Verifica o isolamento de timeouts entre execuções em processos separados e o
+cache de inspeção da AST usado na validação.
+"""
+
+import unittest
+import os
+import threading
+import time
+from unittest import mock
+
+# Adiciona diretório pai ao PATH para importar módulos adequadamente
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import core.code_executor as executor_module
+from core.code_executor import AdvancedDynamicCodeExecutor
+
+
+class TestCodeExecutorTimeouts(unittest.TestCase):
+    """Testes de timeout com multiprocessing"""
+
+    def setUp(self):
+        """Cria um executor com timeout curto"""
+        self.executor = AdvancedDynamicCodeExecutor(timeout=2, use_multiprocessing=True)
+
+    def tearDown(self):
+        """Encerra os processos de trabalho"""
+        self.executor.shutdown()
+
+    def test_timeout_does_not_affect_other_executions(self):
+        """Um código travado não derruba uma execução simultânea"""
+        results = {}
+        hung = threading.Thread(
+            target=lambda: results.setdefault('hung', self.executor.execute_code("while True:\n    pass\n"))
+        )
+        hung.start()
+        # A segunda execução começa perto do timeout da primeira e dura além dele
+        time.sleep(1.5)
+        results['other'] = self.executor.execute_code("result = sum(range(20_000_000))\n")
+        hung.join()
+
+        self.assertFalse(results['hung']['success'])
+        self.assertIn("Timeout", results['hung']['error'])
+        self.assertTrue(results['other']['success'], results['other']['error'])
+        self.assertEqual(results['other']['result'], sum(range(20_000_000)))
+
+    def test_executor_usable_after_timeout(self):
+        """Após um timeout, novas execuções funcionam normalmente"""
+        timed_out = self.executor.execute_code("while True:\n    pass\n")
+        result = self.executor.execute_code("result = 1 + 1\n")
+
+        self.assertFalse(timed_out['success'])
+        self.assertTrue(result['success'], result['error'])
+        self.assertEqual(result['result'], 2)
+
+
+class TestCodeExecutorValidation(unittest.TestCase):
+    """Testes da validação com cache de inspeção da AST"""
+
+    def setUp(self):
+        """Cria um executor sem multiprocessing"""
+        self.executor = AdvancedDynamicCodeExecutor(use_multiprocessing=False)
+
+    def test_first_violation_in_breadth_first_order(self):
+        """A violação reportada é a primeira do ast.walk, não a mais profunda"""
+        code = "def f():\n    open('x')\n\nimport os\n"
+
+        valid, message = self.executor.basic_code_validation(code)
+
+        self.assertFalse(valid)
+        self.assertEqual(message, "Import não autorizado: os")
+
+    def test_cache_follows_allowed_imports(self):
+        """Alterar os imports permitidos invalida o resultado em cache"""
+        code = "import os\n"
+        self.assertFalse(self.executor.basic_code_validation(code)[0])
+
+        self.executor.allowed_imports.append('os')
+        self.assertTrue(self.executor.basic_code_validation(code)[0])
+
+        self.executor.allowed_imports = ['math']
+        self.assertFalse(self.executor.basic_code_validation(code)[0])
+
+    def test_concurrent_validation(self):
+        """Validações simultâneas com descarte constante do cache não falham"""
+        results = []
+
+        def validate(worker):
+            for i in range(300):
+                results.append(self.executor.basic_code_validation(f"x = {worker} + {i}\n"))
+
+        with mock.patch.object(executor_module, '_AST_CACHE_MAX', 2):
+            threads = [threading.Thread(target=validate, args=(worker,)) for worker in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(results), 8 * 300)
+        self.assertTrue(all(valid for valid, _ in results), set(results))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Testes para o DuckDBCsvConnector
+================================
+
+Verifica a adaptação de consultas SQL com metadados de colunas (alias), o
+cache em Parquet, a conexão compartilhada entre fontes e a leitura em lotes.
+"""
+
+import unittest
+import os
+import tempfile
+import shutil
+import glob
+from unittest import mock
+import pandas as pd
+
+# Adiciona diretório pai ao PATH para importar módulos adequadamente
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from connector.datasource_config import DataSourceConfig
+import connector.duckdb_csv_connector as csv_module
+from connector.duckdb_csv_connector import DuckDBCsvConnector
+
+
+class TestDuckDBCsvConnectorAliases(unittest.TestCase):
+    """Testes de substituição de alias de colunas nas consultas"""
+
+    def setUp(self):
+        """Cria um CSV temporário com metadados que definem o alias 'receita'"""
+        self.test_data_dir = tempfile.mkdtemp()
+        csv_path = os.path.join(self.test_data_dir, "vendas.csv")
+        pd.DataFrame({
+            'cliente': ['a', 'b', 'a'],
+            'valor': [1.0, 2.0, 3.0],
+        }).to_csv(csv_path, index=False)
+
+        metadata = {
+            'name': 'vendas',
+            'columns': [{'name': 'valor', 'alias': ['receita']}],
+        }
+        config = DataSourceConfig('vendas', 'csv', metadata=metadata, path=csv_path)
+        self.connector = DuckDBCsvConnector(config)
+        self.connector.connect()
+
+    def tearDown(self):
+        """Fecha a conexão e remove os arquivos temporários"""
+        self.connector.close()
+        shutil.rmtree(self.test_data_dir)
+
+    def test_order_by_output_alias(self):
+        """ORDER BY que referencia um alias de saída não deve ser reescrito"""
+        query = ("SELECT cliente, SUM(receita) AS receita FROM csv "
+                 "GROUP BY cliente ORDER BY receita DESC")
+
+        result = self.connector.read_data(query)
+
+        self.assertEqual(list(result.columns), ['cliente', 'receita'])
+        self.assertEqual(result['cliente'].tolist(), ['a', 'b'])
+        self.assertEqual(result['receita'].tolist(), [4.0, 2.0])
+
+    def test_alias_outside_string_literals(self):
+        """Alias são substituídos apenas fora de literais de texto"""
+        query = "SELECT cliente, receita FROM csv WHERE cliente <> 'receita' ORDER BY receita"
+
+        adapted = self.connector._adapt_query_with_metadata(query)
+
+        self.assertIn("'receita'", adapted)
+        self.assertEqual(self.connector.read_data(query)['valor'].tolist(), [1.0, 2.0, 3.0])
+
+
+class TestDuckDBCsvConnectorParquetCache(unittest.TestCase):
+    """Testes do cache em Parquet ('cache_dir')"""
+
+    def setUp(self):
+        """Cria um CSV e um diretório de cache temporários"""
+        self.test_data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_data_dir)
+        self.csv_path = os.path.join(self.test_data_dir, "vendas.csv")
+        self.cache_dir = os.path.join(self.test_data_dir, "cache")
+        self._write_csv([1, 2, 3])
+
+    def _write_csv(self, values):
+        """Grava a coluna 'valor' no CSV"""
+        pd.DataFrame({'valor': values}).to_csv(self.csv_path, index=False)
+
+    def _read(self):
+        """Conecta um novo conector com cache e lê todos os valores"""
+        config = DataSourceConfig('vendas', 'csv', path=self.csv_path, cache_dir=self.cache_dir)
+        connector = DuckDBCsvConnector(config)
+        connector.connect()
+        try:
+            return connector.read_data()['valor'].tolist()
+        finally:
+            connector.close()
+
+    def _cache_files(self):
+        """Arquivos Parquet presentes no diretório de cache"""
+        return glob.glob(os.path.join(self.cache_dir, "*.parquet"))
+
+    def test_cache_is_reused_while_file_is_unchanged(self):
+        """Com mesmo tamanho e mtime, a leitura vem do Parquet em cache"""
+        self.assertEqual(self._read(), [1, 2, 3])
+        self.assertEqual(len(self._cache_files()), 1)
+
+        # Conteúdo diferente, mas com o mesmo tamanho e a mesma mtime
+        stat = os.stat(self.csv_path)
+        self._write_csv([7, 8, 9])
+        os.utime(self.csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertEqual(self._read(), [1, 2, 3])
+        self.assertEqual(len(self._cache_files()), 1)
+
+    def test_mtime_change_invalidates_cache(self):
+        """Um CSV modificado é lido novamente e ganha outra entrada no cache"""
+        self.assertEqual(self._read(), [1, 2, 3])
+
+        stat = os.stat(self.csv_path)
+        self._write_csv([7, 8, 9])
+        os.utime(self.csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(self._read(), [7, 8, 9])
+        self.assertEqual(len(self._cache_files()), 2)
+
+    def test_cache_path_depends_on_mtime_and_options(self):
+        """A chave do cache inclui a mtime e as opções de leitura"""
+        config = DataSourceConfig('vendas', 'csv', path=self.csv_path, cache_dir=self.cache_dir)
+        connector = DuckDBCsvConnector(config)
+        before = connector._cache_path(self.csv_path, ',', True, True)
+
+        self.assertNotEqual(before, connector._cache_path(self.csv_path, ';', True, True))
+        stat = os.stat(self.csv_path)
+        os.utime(self.csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.assertNotEqual(before, connector._cache_path(self.csv_path, ',', True, True))
+
+
+class TestDuckDBCsvConnectorSharedConnection(unittest.TestCase):
+    """Testes do banco compartilhado ('shared_connection')"""
+
+    def setUp(self):
+        """Cria dois diretórios com um arquivo 'vendas.csv' cada"""
+        self.test_data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_data_dir)
+        self.connectors = {}
+        for source_id, values in (('loja_a', [1, 2]), ('loja_b', [10, 20])):
+            path = os.path.join(self.test_data_dir, source_id)
+            os.makedirs(path)
+            pd.DataFrame({'id': [1, 2], 'valor': values}).to_csv(os.path.join(path, "vendas.csv"), index=False)
+            config = DataSourceConfig(source_id, 'csv', path=path, shared_connection=True)
+            connector = DuckDBCsvConnector(config)
+            connector.connect()
+            self.addCleanup(connector.close)
+            self.connectors[source_id] = connector
+
+    def test_views_are_isolated_per_source(self):
+        """Views de mesmo nome ficam no schema de cada fonte"""
+        a, b = self.connectors['loja_a'], self.connectors['loja_b']
+
+        self.assertEqual(a._schema_name, 'source_loja_a')
+        self.assertEqual(a.read_data("SELECT valor FROM vendas ORDER BY id")['valor'].tolist(), [1, 2])
+        self.assertEqual(b.read_data("SELECT valor FROM vendas ORDER BY id")['valor'].tolist(), [10, 20])
+
+    def test_sources_can_be_joined(self):
+        """Fontes diferentes podem ser unidas numa única consulta"""
+        query = ("SELECT a.valor + b.valor AS total FROM source_loja_a.vendas a "
+                 "JOIN source_loja_b.vendas b USING (id) ORDER BY id")
+
+        result = self.connectors['loja_a'].read_data(query)
+
+        self.assertEqual(result['total'].tolist(), [11, 22])
+
+    def test_close_drops_only_own_schema(self):
+        """Fechar uma fonte não afeta as views das outras"""
+        self.connectors['loja_a'].close()
+
+        b = self.connectors['loja_b']
+        self.assertEqual(b.read_data("SELECT valor FROM vendas ORDER BY id")['valor'].tolist(), [10, 20])
+        schemas = {row[0] for row in csv_module._shared_cursor().execute(
+            "SELECT schema_name FROM information_schema.schemata").fetchall()}
+        self.assertNotIn('source_loja_a', schemas)
+        self.assertIn('source_loja_b', schemas)
+
+    def test_cursors_share_one_database(self):
+        """Cada conector usa um cursor próprio do mesmo banco em memória"""
+        a, b = self.connectors['loja_a'], self.connectors['loja_b']
+
+        self.assertIsNot(a.connection, b.connection)
+        self.assertEqual(
+            b.read_data("SELECT COUNT(*) AS n FROM source_loja_a.vendas")['n'].tolist(), [2]
+        )
+
+
+class TestDuckDBCsvConnectorBatches(unittest.TestCase):
+    """Testes de read_data_batches"""
+
+    def setUp(self):
+        """Cria um CSV temporário com cinco linhas"""
+        self.test_data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_data_dir)
+        csv_path = os.path.join(self.test_data_dir, "vendas.csv")
+        pd.DataFrame({'valor': [1, 2, 3, 4, 5]}).to_csv(csv_path, index=False)
+        self.connector = DuckDBCsvConnector(DataSourceConfig('vendas', 'csv', path=csv_path))
+        self.connector.connect()
+        self.addCleanup(self.connector.close)
+
+    def _tracked_cursors(self):
+        """Envolve os cursores criados pelo conector para registrar o close"""
+        cursors = []
+        original = self.connector._cursor
+
+        def cursor():
+            tracked = mock.MagicMock(wraps=original())
+            cursors.append(tracked)
+            return tracked
+
+        patcher = mock.patch.object(self.connector, '_cursor', side_effect=cursor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return cursors
+
+    def test_batches_cover_all_rows(self):
+        """Os lotes têm no máximo batch_rows linhas e cobrem o resultado inteiro"""
+        cursors = self._tracked_cursors()
+
+        batches = list(self.connector.read_data_batches(batch_rows=2))
+
+        self.assertTrue(all(batch.num_rows <= 2 for batch in batches))
+        values = [value for batch in batches for value in batch.column('valor').to_pylist()]
+        self.assertEqual(values, [1, 2, 3, 4, 5])
+        cursors[0].close.assert_called_once()
+
+    def test_query_is_adapted(self):
+        """Consultas sobre 'csv' são redirecionadas à view da fonte"""
+        batches = self.connector.read_data_batches("SELECT valor FROM csv WHERE valor > 3", batch_rows=2)
+
+        self.assertEqual([v for batch in batches for v in batch.column('valor').to_pylist()], [4, 5])
+
+    def test_early_stop_closes_cursor(self):
+        """Interromper a iteração fecha o cursor da consulta"""
+        cursors = self._tracked_cursors()
+
+        batches = self.connector.read_data_batches(batch_rows=1)
+        next(batches)
+        batches.close()
+
+        cursors[0].close.assert_called_once()
+        self.assertTrue(self.connector.is_connected())
+
+    def test_invalid_query_raises_and_closes_cursor(self):
+        """Erros na consulta viram DataReadException e o cursor é fechado"""
+        cursors = self._tracked_cursors()
+
+        with self.assertRaises(csv_module.DataReadException):
+            list(self.connector.read_data_batches("SELECT * FROM tabela_inexistente"))
+        cursors[0].close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Testes para as funções numéricas rápidas
+========================================
+
+Compara sum1d, mean1d, std1d, clip1d e rolling_mean1d com o numpy, inclusive
+para entradas vazias e janelas nos limites.
+"""
+
+import unittest
+import os
+import numpy as np
+
+# Adiciona diretório pai ao PATH para importar módulos adequadamente
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core import _fastmath
+
+
+def _reference_rolling_mean(a, window):
+    """Média móvel com numpy: NaN nas primeiras window - 1 posições"""
+    out = np.full(len(a), np.nan)
+    if window <= len(a):
+        out[window - 1:] = np.convolve(a, np.ones(window) / window, mode='valid')
+    return out
+
+
+class TestFastMath(unittest.TestCase):
+    """Compara os resultados com as funções equivalentes do numpy"""
+
+    def setUp(self):
+        """Arrays de teste: aleatório, inteiro, com um elemento e vazio"""
+        rng = np.random.default_rng(42)
+        self.arrays = [
+            rng.normal(10, 3, 1000),
+            np.arange(-5, 6),
+            np.array([2.5]),
+            np.array([]),
+        ]
+
+    def test_sum(self):
+        """sum1d equivale a np.sum (0.0 para vazio)"""
+        for a in self.arrays:
+            with self.subTest(size=len(a)):
+                self.assertAlmostEqual(_fastmath.sum1d(a), float(np.sum(a)), places=9)
+        self.assertEqual(_fastmath.sum1d([]), 0.0)
+
+    def test_mean(self):
+        """mean1d equivale a np.mean (NaN para vazio)"""
+        for a in self.arrays[:-1]:
+            with self.subTest(size=len(a)):
+                self.assertAlmostEqual(_fastmath.mean1d(a), float(np.mean(a)), places=9)
+        self.assertTrue(np.isnan(_fastmath.mean1d([])))
+
+    def test_std(self):
+        """std1d equivale a np.std para ddof 0 e 1"""
+        for a in self.arrays[:-1]:
+            for ddof in (0, 1):
+                if len(a) - ddof <= 0:
+                    continue
+                with self.subTest(size=len(a), ddof=ddof):
+                    self.assertAlmostEqual(_fastmath.std1d(a, ddof=ddof), float(np.std(a, ddof=ddof)), places=9)
+
+    def test_std_without_degrees_of_freedom(self):
+        """Sem graus de liberdade restantes, o resultado é NaN"""
+        self.assertTrue(np.isnan(_fastmath.std1d([])))
+        self.assertTrue(np.isnan(_fastmath.std1d([2.5], ddof=1)))
+        self.assertTrue(np.isnan(_fastmath.std1d([1.0, 2.0], ddof=3)))
+
+    def test_clip(self):
+        """clip1d equivale a np.clip, inclusive com NaN e limites invertidos"""
+        cases = [(a, -1.0, 1.0) for a in self.arrays]
+        cases += [
+            (np.array([np.nan, -np.inf, np.inf, 0.5]), 0.0, 1.0),
+            (np.array([1.0, 3.0, 9.0]), 5.0, 2.0),
+            (np.arange(5), -np.inf, 2),
+        ]
+        for a, lower, upper in cases:
+            with self.subTest(size=len(a), lower=lower, upper=upper):
+                np.testing.assert_array_equal(_fastmath.clip1d(a, lower, upper), np.clip(a, lower, upper))
+        np.testing.assert_array_equal(_fastmath.clip1d(np.arange(3)), np.arange(3.0))
+
+    def test_rolling_mean(self):
+        """rolling_mean1d equivale à média das janelas calculada com numpy"""
+        for a in self.arrays:
+            for window in (1, 2, 7, len(a)):
+                if window < 1:
+                    continue
+                with self.subTest(size=len(a), window=window):
+                    np.testing.assert_allclose(
+                        _fastmath.rolling_mean1d(a, window), _reference_rolling_mean(a, window),
+                        rtol=1e-9, atol=1e-12
+                    )
+
+    def test_rolling_mean_window_larger_than_input(self):
+        """Janela maior que o array gera apenas NaN"""
+        result = _fastmath.rolling_mean1d([1.0, 2.0, 3.0], 4)
+
+        self.assertEqual(len(result), 3)
+        self.assertTrue(np.isnan(result).all())
+        self.assertEqual(len(_fastmath.rolling_mean1d([], 3)), 0)
+
+    def test_rolling_mean_invalid_window(self):
+        """Janela menor que 1 gera ValueError"""
+        for window in (0, -1):
+            with self.subTest(window=window), self.assertRaises(ValueError):
+                _fastmath.rolling_mean1d([1.0, 2.0], window)
+
+    def test_input_is_flattened(self):
+        """Listas e arrays 2-D são convertidos para um array 1-D de float"""
+        a = np.arange(6).reshape(2, 3)
+
+        self.assertEqual(_fastmath.sum1d(a), 15.0)
+        np.testing.assert_array_equal(_fastmath.clip1d(a, 1, 4), np.clip(a.ravel(), 1, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Testes para os metadados de datasets
+====================================
+
+Verifica o cache de to_dict e to_json de ColumnMetadata e DatasetMetadata,
+que o JSON gerado com orjson é idêntico ao do módulo json e o MetadataRegistry
+sob acesso concorrente e com arquivos inválidos.
+"""
+
+import unittest
+import os
+import json
+import shutil
+import tempfile
+import threading
+from unittest import mock
+
+# Adiciona diretório pai ao PATH para importar módulos adequadamente
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import connector.metadata as metadata_module
+from connector.metadata import DatasetMetadata, MetadataRegistry
+
+METADATA = {
+    'name': 'vendas',
+    'description': 'Vendas do mês',
+    'columns': [
+        {'name': 'valor', 'data_type': 'float', 'alias': ['receita'],
+         'validation': {'min': 0}, 'tags': ['financeiro']},
+        {'name': 'cliente', 'data_type': 'str'},
+    ],
+    'tags': ['vendas'],
+    'custom': {'origem': {'sistema': 'erp'}},
+}
+
+
+class TestDatasetMetadataToDict(unittest.TestCase):
+    """Testes do dicionário em cache"""
+
+    def setUp(self):
+        """Cria os metadados e preenche os caches"""
+        self.metadata = DatasetMetadata.from_dict(METADATA)
+        self.expected_json = self.metadata.to_json()
+
+    def test_nested_mutation_does_not_leak(self):
+        """Alterar listas e dicionários aninhados não afeta chamadas seguintes"""
+        data = self.metadata.to_dict()
+        data['columns'][0]['name'] = 'alterado'
+        data['columns'][0]['validation']['min'] = 10
+        data['columns'].append({'name': 'extra'})
+        data['tags'].append('extra')
+        data['custom']['origem']['sistema'] = 'outro'
+
+        self.assertEqual(self.metadata.to_dict(), METADATA)
+        self.assertEqual(self.metadata.to_json(), self.expected_json)
+        self.assertEqual(self.metadata.columns['valor'].validation, {'min': 0})
+
+    def test_column_mutation_does_not_leak(self):
+        """O mesmo vale para o dicionário de uma coluna"""
+        column = self.metadata.columns['valor']
+        data = column.to_dict()
+        data['alias'].append('faturamento')
+        data['validation']['max'] = 100
+
+        self.assertEqual(column.to_dict(), METADATA['columns'][0])
+        self.assertEqual(self.metadata.to_json(), self.expected_json)
+
+
+class TestDatasetMetadataJson(unittest.TestCase):
+    """to_json gera a mesma saída com e sem orjson"""
+
+    def _assert_same_as_json(self, data):
+        """Compara to_json com json.dumps, com orjson ligado e desligado"""
+        for fast in (True, False):
+            with self.subTest(fast=fast), mock.patch.object(metadata_module, '_FAST_JSON', fast):
+                metadata = DatasetMetadata.from_dict(data)
+                for indent in (2, None, 4):
+                    self.assertEqual(metadata.to_json(indent), json.dumps(metadata.to_dict(), indent=indent))
+
+    def test_non_ascii_text_is_escaped(self):
+        """Acentos, emoji e caracteres de controle saem escapados (ensure_ascii)"""
+        self._assert_same_as_json({
+            'name': 'vendas',
+            'description': 'Descrição com ação, 😀, \x7f, \u2028 e\nquebra',
+            'columns': [{'name': 'preço', 'alias': ['valor unitário']}],
+        })
+        self.assertTrue(DatasetMetadata.from_dict({'name': 'ção'}).to_json().isascii())
+
+    def test_floats(self):
+        """Floats com expoente ou não finitos têm a formatação do json"""
+        self._assert_same_as_json({
+            'name': 'vendas',
+            'columns': [{'name': 'valor', 'validation': {'min': 0.5, 'max': 1e16, 'step': 1e-07}}],
+            'custom': {'limite': float('inf'), 'razao': 1.0},
+        })
+
+    def test_plain_metadata(self):
+        """Metadados sem casos especiais"""
+        self._assert_same_as_json(METADATA)
+
+
+class TestMetadataRegistry(unittest.TestCase):
+    """Testes do registro global de metadados"""
+
+    def setUp(self):
+        """Parte de um registro vazio e o limpa ao final"""
+        self.registry = MetadataRegistry()
+        self.registry.clear()
+        self.addCleanup(self.registry.clear)
+
+    def test_concurrent_register_and_read(self):
+        """Leituras durante registros e remoções sempre veem um estado consistente"""
+        errors = []
+        writing = threading.Event()
+        writing.set()
+
+        def write(worker):
+            for i in range(200):
+                self.registry.register_from_dict({'name': f'w{worker}_{i}', 'columns': [{'name': 'valor'}]})
+                if i % 2:
+                    self.registry.remove_metadata(f'w{worker}_{i}')
+
+        def read():
+            while writing.is_set():
+                try:
+                    names = self.registry.list_datasets()
+                    for name in names:
+                        metadata = self.registry.get_metadata(name)
+                        # Apenas os índices ímpares são removidos
+                        if metadata is None and int(name.rsplit('_', 1)[1]) % 2 == 0:
+                            errors.append(f"{name} sumiu do registro")
+                except Exception as e:
+                    errors.append(repr(e))
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        writers = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        writing.clear()
+        for thread in readers:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        expected = {f'w{worker}_{i}' for worker in range(4) for i in range(0, 200, 2)}
+        self.assertEqual(set(self.registry.list_datasets()), expected)
+
+    def test_snapshot_is_read_only(self):
+        """O mapa publicado não pode ser alterado por quem o lê"""
+        self.registry.register_from_dict({'name': 'vendas'})
+
+        with self.assertRaises(TypeError):
+            self.registry._datasets['outro'] = None
+
+
+class TestMetadataRegistryFiles(unittest.TestCase):
+    """Testes de register_from_files com arquivos inválidos"""
+
+    INVALID = {
+        'vazio.json': b'',
+        'truncado.json': b'{"name": "vendas", "columns": [',
+        'sem_nome.json': b'{"columns": []}',
+        'lista.json': b'[1, 2]',
+        'binario.json': b'\xff\xfe\x00',
+    }
+
+    def setUp(self):
+        """Cria um arquivo válido e os inválidos num diretório temporário"""
+        self.registry = MetadataRegistry()
+        self.registry.clear()
+        self.addCleanup(self.registry.clear)
+        self.test_data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_data_dir)
+        self.valid = self._write('valido.json', json.dumps(
+            {'name': 'vendas', 'description': 'Preço médio'}, ensure_ascii=False).encode('utf-8'))
+
+    def _write(self, name, content):
+        """Grava o conteúdo num arquivo do diretório temporário"""
+        path = os.path.join(self.test_data_dir, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def _for_both_parsers(self):
+        """Executa o teste com orjson (mmap) e com o json padrão"""
+        for fast in (True, False):
+            with self.subTest(fast=fast), mock.patch.object(metadata_module, '_FAST_JSON', fast):
+                self.registry.clear()
+                yield
+
+    def test_valid_file(self):
+        """Arquivo válido com texto UTF-8 é registrado"""
+        for _ in self._for_both_parsers():
+            self.registry.register_from_files([self.valid])
+            self.assertEqual(self.registry.get_metadata('vendas').description, 'Preço médio')
+
+    def test_invalid_files_raise_value_error(self):
+        """Arquivos vazios, truncados, sem 'name' ou inexistentes geram ValueError"""
+        paths = [self._write(name, content) for name, content in self.INVALID.items()]
+        paths.append(os.path.join(self.test_data_dir, 'inexistente.json'))
+        for _ in self._for_both_parsers():
+            for path in paths:
+                with self.assertRaises(ValueError, msg=path):
+                    self.registry.register_from_files([path])
+
+    def test_invalid_file_registers_nothing(self):
+        """Um arquivo inválido no lote impede o registro dos demais"""
+        invalid = self._write('truncado.json', self.INVALID['truncado.json'])
+        for _ in self._for_both_parsers():
+            with self.assertRaises(ValueError):
+                self.registry.register_from_files([self.valid, invalid])
+            self.assertEqual(self.registry.list_datasets(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Testes para o SemanticSchema
+============================
+
+Verifica que a leitura incremental (load_from_file_stream) produz o mesmo
+schema que load_from_file.
+"""
+
+import unittest
+import os
+import json
+import tempfile
+import shutil
+from datetime import datetime
+from unittest import mock
+
+# Adiciona diretório pai ao PATH para importar módulos adequadamente
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import connector.semantic_layer_schema as schema_module
+from connector.semantic_layer_schema import (
+    SemanticSchema, ColumnSchema, ColumnType, RelationSchema,
+    TransformationRule, TransformationType
+)
+
+
+class TestSemanticSchemaStreamLoading(unittest.TestCase):
+    """Compara load_from_file_stream com load_from_file"""
+
+    def setUp(self):
+        """Cria um diretório temporário para os arquivos de schema"""
+        self.test_data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_data_dir)
+
+    def _write(self, data):
+        """Grava o dicionário como JSON e retorna o caminho"""
+        path = os.path.join(self.test_data_dir, "schema.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        return path
+
+    def _assert_same(self, path):
+        """Os dois carregadores produzem schemas iguais"""
+        expected = SemanticSchema.load_from_file(path)
+        result = SemanticSchema.load_from_file_stream(path)
+        self.assertEqual(result, expected)
+        return result
+
+    @unittest.skipIf(schema_module.ijson is None, "ijson não instalado")
+    def test_saved_schema_round_trip(self):
+        """Schema salvo com save_to_file é lido de volta igual ao original"""
+        schema = SemanticSchema(
+            name='vendas',
+            description='Vendas por região — ação',
+            source_type='postgres',
+            source_path='db.vendas',
+            columns=[
+                ColumnSchema('id', ColumnType.INTEGER, nullable=False, primary_key=True, unique=True),
+                ColumnSchema('valor', ColumnType.FLOAT, description='Preço', default=0.5,
+                             constraints={'min': 0, 'max': 1e6, 'in': [1, 2.5, None]}, tags=['financeiro']),
+                ColumnSchema('regiao', ColumnType.CATEGORICAL, default='sul', tags=['geo', 'geo']),
+                ColumnSchema('criado_em', ColumnType.DATETIME),
+            ],
+            relations=[RelationSchema('vendas', 'id', 'clientes', 'id', 'one_to_one')],
+            transformations=[
+                TransformationRule(TransformationType.RENAME, 'valor', {'new_name': 'receita'}),
+                TransformationRule(TransformationType.MAP_VALUES, 'regiao',
+                                   {'mapping': {'sul': 'S', 'norte': None}}),
+                TransformationRule(TransformationType.CLIP, 'receita', {'min': 0.1, 'max': 100}),
+                TransformationRule(TransformationType.DROP_NA, 'id', {}),
+            ],
+            created_at=datetime(2024, 1, 2, 3, 4, 5, 678000),
+            version='2.1.0',
+            tags=['comercial', 'mensal'],
+        )
+        path = os.path.join(self.test_data_dir, "schema.json")
+        schema.save_to_file(path)
+
+        self.assertEqual(self._assert_same(path), schema)
+
+    @unittest.skipIf(schema_module.ijson is None, "ijson não instalado")
+    def test_optional_and_unknown_fields(self):
+        """Campos ausentes usam os padrões; campos desconhecidos são ignorados"""
+        path = self._write({
+            'extra': {'name': 'ignorado', 'columns': [{'name': 'x'}]},
+            'name': 'minimo',
+            'description': None,
+            'columns': [{'name': 'a', 'type': 'string', 'constraints': {'columns': ['b']}}],
+            'lista': [1, {'name': 'outro'}],
+            'created_at': '2024-01-02T03:04:05',
+            'tags': [],
+        })
+
+        result = self._assert_same(path)
+        self.assertEqual(result.name, 'minimo')
+        self.assertEqual(result.columns[0].constraints, {'columns': ['b']})
+        self.assertEqual(result.tags, [])
+
+    @unittest.skipIf(schema_module.ijson is None, "ijson não instalado")
+    def test_same_with_standard_json(self):
+        """A equivalência vale também quando load_from_file usa o json padrão"""
+        path = self._write({
+            'name': 'vendas',
+            'columns': [{'name': 'valor', 'type': 'float', 'default': 1.25}],
+            'transformations': [{'type': 'fill_na', 'column': 'valor', 'params': {'value': 0}}],
+            'created_at': '2024-01-02T03:04:05',
+        })
+
+        with mock.patch.object(schema_module, '_FAST_JSON', False):
+            self._assert_same(path)
+
+    def test_without_ijson(self):
+        """Sem ijson, a leitura recorre a load_from_file"""
+        path = self._write({'name': 'vendas', 'created_at': '2024-01-02T03:04:05'})
+
+        with mock.patch.object(schema_module, 'ijson', None):
+            self._assert_same(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
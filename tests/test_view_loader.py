@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Testes para o ViewLoader
+========================
+
+Verifica que os caminhos otimizados de transformação (consulta SQL no
+DuckDB, kernels Arrow e atalho de fonte única) produzem o mesmo resultado que
+a aplicação das regras com pandas sobre o DataFrame inteiro.
+"""
+
+import unittest
+import os
+import pandas as pd
+import numpy as np
+
+# Adiciona diretório pai ao PATH para importar módulos adequadamente
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import connector.view_loader_and_transformer as view_module
+from connector.semantic_layer_schema import (
+    SemanticSchema, RelationSchema, TransformationRule, TransformationType
+)
+from connector.view_loader_and_transformer import ViewLoader
+
+
+def _convert(column, **params):
+    """Cria uma regra CONVERT_TYPE para a coluna"""
+    return TransformationRule(type=TransformationType.CONVERT_TYPE, column=column, params=params)
+
+
+class TestViewLoaderSqlTransformations(unittest.TestCase):
+    """Testes das conversões de tipo em views com junção (caminho SQL)"""
+
+    def _construct(self, values, rules):
+        """Monta uma view de duas fontes unidas por 'id' e aplica as regras"""
+        schema = SemanticSchema(
+            name='vendas',
+            relations=[RelationSchema('vendas', 'id', 'clientes', 'id')],
+            transformations=rules,
+        )
+        loader = ViewLoader(schema)
+        self.addCleanup(loader.close)
+        ids = list(range(len(values)))
+        loader.register_source('vendas', pd.DataFrame({'id': ids, 'valor': values}))
+        loader.register_source('clientes', pd.DataFrame({'id': ids, 'nome': [f'c{i}' for i in ids]}))
+        return loader.construct_view()['valor']
+
+    def test_datetime_from_epoch_integers(self):
+        """Inteiros são lidos como epoch, não viram NaT"""
+        result = self._construct([0, 1, 2, 3, 4], [_convert('valor', type='datetime', unit='s')])
+
+        expected = pd.to_datetime(pd.Series([0, 1, 2, 3, 4]), unit='s')
+        self.assertEqual(result.tolist(), expected.tolist())
+
+    def test_datetime_from_non_iso_strings(self):
+        """Datas fora do padrão ISO são interpretadas como no pandas"""
+        result = self._construct(['01/02/2020', '03/04/2020'], [_convert('valor', type='datetime')])
+
+        self.assertFalse(result.isna().any())
+        self.assertEqual(result.iloc[0], pd.Timestamp('2020-01-02'))
+
+    def test_datetime_with_format_matches_pandas_resolution(self):
+        """Datas com formato explícito têm a mesma resolução do pandas"""
+        values = ['02/01/2020', '04/03/2020']
+        result = self._construct(values, [_convert('valor', type='datetime', format='%d/%m/%Y')])
+
+        expected = pd.to_datetime(pd.Series(values), format='%d/%m/%Y')
+        self.assertEqual(result.dtype, expected.dtype)
+        self.assertEqual(result.tolist(), expected.tolist())
+
+    def test_int_conversion_of_fractional_values(self):
+        """Valores fracionários não são arredondados; a coluna fica inalterada"""
+        result = self._construct([1.5, 2.0], [_convert('valor', type='int')])
+
+        self.assertEqual(result.tolist(), [1.5, 2.0])
+
+    def test_int_conversion_of_fractional_strings(self):
+        """Texto fracionário não é arredondado; a coluna fica inalterada"""
+        result = self._construct(['2.5', '3'], [_convert('valor', type='int')])
+
+        self.assertEqual(result.tolist(), ['2.5', '3'])
+
+    def test_int_conversion_of_integers(self):
+        """Inteiros continuam convertidos para o tipo Int64"""
+        result = self._construct([1, 2], [_convert('valor', type='int')])
+
+        self.assertEqual(str(result.dtype), 'Int64')
+        self.assertEqual(result.tolist(), [1, 2])
+
+
+class TestViewLoaderSqlMatchesPandas(unittest.TestCase):
+    """Compara o caminho SQL com a aplicação das regras em pandas"""
+
+    def _assert_same_as_pandas(self, values, rule):
+        """Constrói a view pelos dois caminhos e compara a coluna transformada"""
+        schema = SemanticSchema(
+            name='vendas',
+            relations=[RelationSchema('vendas', 'id', 'clientes', 'id')],
+            transformations=[rule],
+        )
+        loader = ViewLoader(schema)
+        self.addCleanup(loader.close)
+        ids = list(range(len(values)))
+        loader.register_source('vendas', pd.DataFrame({'id': ids, 'valor': values}))
+        loader.register_source('clientes', pd.DataFrame({'id': ids, 'nome': [f'c{i}' for i in ids]}))
+
+        result = loader.construct_view()['valor']
+        expected = loader._construct_view_pandas(loader._build_view_query(), None, [rule])['valor']
+        pd.testing.assert_series_equal(result, expected)
+
+    def _rule(self, rule_type, **params):
+        """Cria uma regra para a coluna 'valor'"""
+        return TransformationRule(type=rule_type, column='valor', params=params)
+
+    def test_map_values_string_keys_on_int_column(self):
+        """Chaves texto não casam com inteiros, como em Series.map"""
+        self._assert_same_as_pandas([1, 2], self._rule(TransformationType.MAP_VALUES, mapping={'1': 'a'}))
+
+    def test_map_values_matching_keys(self):
+        """Mapeamento com chaves do mesmo tipo da coluna"""
+        self._assert_same_as_pandas([1, 2], self._rule(TransformationType.MAP_VALUES, mapping={1: 'a'}))
+        self._assert_same_as_pandas(['b', 'c'], self._rule(TransformationType.MAP_VALUES, mapping={'b': 'x'}))
+
+    def test_replace_string_on_int_column(self):
+        """REPLACE com old_value texto não altera uma coluna inteira"""
+        self._assert_same_as_pandas([1, 2], self._rule(TransformationType.REPLACE, old_value='1', new_value=5))
+
+    def test_replace_with_none(self):
+        """REPLACE por None mantém None, como no pandas"""
+        self._assert_same_as_pandas([1, 2], self._rule(TransformationType.REPLACE, old_value=1, new_value=None))
+
+    def test_replace_same_kind(self):
+        """REPLACE entre valores do mesmo tipo da coluna"""
+        self._assert_same_as_pandas([1, 2], self._rule(TransformationType.REPLACE, old_value=1, new_value=5))
+        self._assert_same_as_pandas(['b', 'c'], self._rule(TransformationType.REPLACE, old_value='b', new_value='z'))
+
+    def test_fillna_and_clip(self):
+        """FILLNA e CLIP numéricos"""
+        self._assert_same_as_pandas([1.0, None], self._rule(TransformationType.FILLNA, value=0.5))
+        self._assert_same_as_pandas([1, 2], self._rule(TransformationType.FILLNA, value='x'))
+        self._assert_same_as_pandas([1, 3], self._rule(TransformationType.CLIP, min=2))
+
+
+class TestViewLoaderDropNaOrder(unittest.TestCase):
+    """DROP_NA depois de outras regras é aplicado na ordem original"""
+
+    def setUp(self):
+        """Linha com valor fracionário e data inválida é a que tem 'chave' nula"""
+        self.df = pd.DataFrame({
+            'id': [0, 1, 2],
+            'valor': [1.0, 2.0, 2.5],
+            'data': ['2020-01-02', '2020-01-03', 'x'],
+            'chave': [1.0, 2.0, None],
+        })
+        self.rules = [
+            _convert('valor', type='int'),
+            _convert('data', type='datetime'),
+            TransformationRule(type=TransformationType.DROP_NA, column='chave', params={}),
+        ]
+
+    def _expected(self):
+        """Resultado das regras aplicadas com pandas, na ordem do schema"""
+        loader = ViewLoader(SemanticSchema(name='vendas'))
+        self.addCleanup(loader.close)
+        return loader._apply_rules(self.df.copy(), self.rules).reset_index(drop=True)
+
+    def test_single_source(self):
+        """Fonte única sem relações"""
+        loader = ViewLoader(SemanticSchema(name='vendas', transformations=self.rules))
+        self.addCleanup(loader.close)
+        loader.register_source('vendas', self.df)
+
+        result = loader.construct_view()
+
+        expected = self._expected()
+        self.assertEqual(result['valor'].dtype, expected['valor'].dtype)
+        self.assertEqual(result['data'].tolist(), expected['data'].tolist())
+
+    def test_join(self):
+        """View com junção"""
+        schema = SemanticSchema(
+            name='vendas',
+            relations=[RelationSchema('vendas', 'id', 'clientes', 'id')],
+            transformations=self.rules,
+        )
+        loader = ViewLoader(schema)
+        self.addCleanup(loader.close)
+        loader.register_source('vendas', self.df)
+        loader.register_source('clientes', pd.DataFrame({'id': [0, 1, 2], 'nome': ['a', 'b', 'c']}))
+
+        result = loader.construct_view()
+
+        expected = self._expected()
+        self.assertEqual(result['valor'].dtype, expected['valor'].dtype)
+        self.assertEqual(result['data'].tolist(), expected['data'].tolist())
+
+
+class TestViewLoaderSingleSource(unittest.TestCase):
+    """Fonte única sem relações: mesmo resultado da consulta no DuckDB"""
+
+    def _assert_same_as_query(self, df):
+        """Compara construct_view com SELECT * sobre a fonte registrada"""
+        loader = ViewLoader(SemanticSchema(name='vendas'))
+        self.addCleanup(loader.close)
+        loader.register_source('vendas', df)
+
+        result = loader.construct_view()
+        expected = loader.duckdb_conn.execute('SELECT * FROM "vendas"').df()
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_object_and_category_columns_are_normalized(self):
+        """Colunas object e category saem como na consulta"""
+        self._assert_same_as_query(pd.DataFrame({
+            'texto': pd.Series(['a', None], dtype=object),
+            'categoria': pd.Categorical(['x', 'y']),
+        }))
+
+    def test_mixed_object_column(self):
+        """Coluna object com tipos mistos é normalizada pelo DuckDB"""
+        self._assert_same_as_query(pd.DataFrame({'misto': pd.Series([1, 'a'], dtype=object)}))
+
+    def test_plain_dtypes(self):
+        """Tipos numéricos, texto e datas usam o atalho sem alteração"""
+        self._assert_same_as_query(pd.DataFrame({
+            'inteiro': [1, 2],
+            'real': [1.5, np.nan],
+            'texto': ['a', 'b'],
+            'data': pd.to_datetime(['2020-01-01', '2020-01-02']),
+        }))
+
+
+class TestViewLoaderArrow(unittest.TestCase):
+    """Testes de construct_view_arrow"""
+
+    def _loader(self, rules=()):
+        """View com junção entre fontes que repetem nomes de colunas"""
+        schema = SemanticSchema(
+            name='vendas',
+            relations=[RelationSchema('vendas', 'id', 'clientes', 'id')],
+            transformations=list(rules),
+        )
+        loader = ViewLoader(schema)
+        self.addCleanup(loader.close)
+        loader.register_source('vendas', pd.DataFrame({'id': [1, 2], 'valor': [1, 2]}))
+        loader.register_source('clientes', pd.DataFrame({'id': [1, 2], 'id_1': ['a', 'b']}))
+        return loader
+
+    def test_join_column_names_match_pandas(self):
+        """Colunas repetidas na junção recebem os mesmos nomes do DataFrame"""
+        loader = self._loader()
+
+        table = loader.construct_view_arrow()
+
+        self.assertEqual(table.column_names, list(loader.construct_view().columns))
+        self.assertEqual(len(set(table.column_names)), table.num_columns)
+        self.assertEqual(table.select(['id']).num_columns, 1)
+
+    def test_dedupe_names(self):
+        """Mesma renomeação que o DuckDB aplica ao gerar DataFrames"""
+        names = ['id', 'ID', 'id', 'id_1', 'id', 'a', 'a_1', 'a']
+        expected = ['id', 'ID_1', 'id_2', 'id_1_1', 'id_3', 'a', 'a_1', 'a_2']
+        self.assertEqual(view_module._dedupe_names(names), expected)
+
+    def test_mixed_types_after_pandas_rules(self):
+        """Coluna com tipos mistos após as regras em pandas vira texto no Arrow"""
+        rule = TransformationRule(type=TransformationType.REPLACE, column='valor',
+                                  params={'old_value': 1, 'new_value': 'x'})
+        loader = self._loader([rule])
+
+        table = loader.construct_view_arrow()
+
+        self.assertEqual(table.column('valor').to_pylist(), ['x', '2'])
+
+    def test_source_not_registered_as_arrow(self):
+        """Fonte com coluna de tipos mistos registrada como DataFrame"""
+        loader = ViewLoader(SemanticSchema(name='vendas'))
+        self.addCleanup(loader.close)
+        loader.register_source('vendas', pd.DataFrame({'misto': pd.Series([1, 'a', None], dtype=object)}))
+
+        table = loader.construct_view_arrow()
+
+        self.assertEqual(table.column_names, ['misto'])
+        self.assertEqual(table.num_rows, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()